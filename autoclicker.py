@@ -4,75 +4,2244 @@ Cross-Platform Autoclicker Application
 Supports Windows and Linux with multiple independent clickers
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox
-import threading
 import time
-from pynput import mouse, keyboard
-from pynput.keyboard import GlobalHotKeys
+
+# Taken before any other import so --profile-startup can include import cost
+STARTUP_T0 = time.perf_counter()
+
+import argparse
+import threading
+import collections
+import heapq
+import itertools
+import csv
+import json
+import logging
+import logging.handlers
+import math
+import mmap
+import queue
+import random
+import struct
+from array import array
 import sys
 import os
+import shutil
+import subprocess
+
+# tkinter and pynput are imported on first use: the headless engine never loads
+# Tk, and the GUI draws its window before the input backends are probed
+tk = None
+ttk = None
+messagebox = None
+filedialog = None
+
+
+def load_tk():
+    """Import tkinter into the module namespace for the GUI"""
+    global tk, ttk, messagebox, filedialog
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as tk_ttk, messagebox as tk_messagebox, filedialog as tk_filedialog
+        tk, ttk, messagebox, filedialog = tkinter, tk_ttk, tk_messagebox, tk_filedialog
+
+# Modern Dark Theme Colors (CustomTkinter Style)
+COLORS = {
+    'bg_main': '#212121',           # Dark gray main background
+    'bg_section': '#2b2b2b',        # Slightly lighter gray for sections
+    'bg_section_disabled': '#1a1a1a',  # Darker gray for disabled
+    'accent_blue': '#1f538d',       # Primary blue accent
+    'accent_blue_hover': '#14375e',  # Darker blue for hover
+    'accent_blue_light': '#3d7bb8', # Lighter blue
+    'text_primary': '#ffffff',      # White text
+    'text_secondary': '#b0b0b0',    # Light gray text
+    'text_disabled': '#707070',     # Darker gray for disabled
+    'button_bg': '#1f538d',         # Blue button background
+    'button_hover': '#14375e',      # Darker blue hover
+    'button_disabled': '#404040',   # Dark gray for disabled buttons
+    'entry_bg': '#404040',          # Dark gray for entry fields
+    'entry_disabled': '#2a2a2a',    # Darker for disabled entries
+    'border_color': '#404040'       # Border color
+}
+
+# Click verification: with the fast path on, only every Nth click pays for a
+# separate move and position read-back; the rest move and click in one backend call
+VERIFY_EVERY_N_CLICKS = 50
+MAX_POSITION_ERROR = 5      # Pixels before a verified click re-sends the move
+MIN_INTERVAL_MS = 1
+DEFAULT_INTERVAL_MS = 1000
+
+# How the scheduler waits for a clicker's next deadline:
+#   hybrid    - sleep until PRECISE_WAKE_MARGIN before it, then spin-yield to the deadline
+#   absolute  - sleep until PRECISE_WAKE_MARGIN before it, then clock_nanosleep(TIMER_ABSTIME)
+#   low_power - one plain timed wait; cheapest, but the OS may wake it late
+WAIT_HYBRID = 'hybrid'
+WAIT_ABSOLUTE = 'absolute'
+WAIT_LOW_POWER = 'low_power'
+WAIT_MODES = (WAIT_HYBRID, WAIT_ABSOLUTE, WAIT_LOW_POWER)
+WAIT_MODE_LABELS = {WAIT_HYBRID: "Precise", WAIT_ABSOLUTE: "Absolute", WAIT_LOW_POWER: "Low power"}
+DEFAULT_WAIT_MODE = WAIT_HYBRID
+PRECISE_WAKE_MARGIN = 0.002
+
+# Burst mode: each tick clicks up to MAX_BURST times, sent to the backend as one call
+MOUSE_BUTTONS = {'left': 1, 'middle': 2, 'right': 3}  # X11 button numbers
+MAX_BURST = 1000
+MAX_BURST_DELAY_MS = 10000
+
+# Multi-point targets are expanded into a path of at most this many points
+MAX_TARGET_POINTS = 1000000
+
+# Recorded event kinds. A click is a whole press + release and is all a simple
+# recording holds; high-fidelity recording adds the rest. detail is the button
+# for button events and the signed step count for scrolls (up / right positive).
+EVENT_CLICK = 0
+EVENT_MOVE = 1
+EVENT_PRESS = 2
+EVENT_RELEASE = 3
+EVENT_SCROLL = 4
+EVENT_HSCROLL = 5
+EVENT_NAMES = {EVENT_CLICK: "Click", EVENT_MOVE: "Move", EVENT_PRESS: "Press",
+               EVENT_RELEASE: "Release", EVENT_SCROLL: "Scroll", EVENT_HSCROLL: "Scroll sideways"}
+
+# High-fidelity recording keeps a pointer move only once it is at least
+# MOTION_MIN_DISTANCE px and MOTION_MIN_INTERVAL s from the last kept one
+MOTION_MIN_DISTANCE = 3
+MOTION_MIN_INTERVAL = 0.008
+
+# Replay timing: speed factor range and the default pause between repeats.
+# A speed of None replays as fast as the backend accepts clicks, REPLAY_BATCH per call
+MIN_REPLAY_SPEED = 0.1
+MAX_REPLAY_SPEED = 100.0
+DEFAULT_REPLAY_GAP_MS = 500
+REPLAY_BATCH = 64
+
+# Jitter offsets are drawn JITTER_BLOCK at a time; the next block is generated on a
+# background thread once half the current one is used, so a click only reads an array
+JITTER_DISTRIBUTIONS = ('uniform', 'gaussian', 'lognormal')
+JITTER_BLOCK = 4096
+LOGNORMAL_SIGMA = 0.5
+
+# Worker threads never touch Tk; one main-thread timer redraws their state at this rate
+UI_REFRESH_INTERVAL_MS = 33
+
+# Clickers in a new window, and how many rows of the clicker list have widgets
+DEFAULT_CLICKERS = 3
+VISIBLE_CLICKER_ROWS = 3
+
+# Named clicker sets, all in one JSON file in config_dir():
+#   {"version": 1, "active": "<name>", "profiles": {"<name>": {"clickers": [...]}}}
+# Each clickers entry uses the headless job file format (see clicker_from_config).
+PROFILES_FILE = 'profiles.json'
+PROFILES_VERSION = 1
+DEFAULT_PROFILE = 'Default'
+
+# Longest a stop or shutdown waits for a worker thread to finish the click in flight
+WORKER_JOIN_TIMEOUT = 2.0
+
+# Worker threads log through a queue, so a slow terminal never stalls a click. Per-click
+# lines are DEBUG; at INFO a summary of click counts is logged every LOG_SUMMARY_INTERVAL
+LOG_SUMMARY_INTERVAL = 5.0
+log = logging.getLogger("autoclicker")
+
+
+def setup_logging(level=logging.INFO):
+    """Route the autoclicker logger through a queue to stdout; returns the listener to stop"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(level)
+    log.propagate = False
+    listener.start()
+    return listener
+
+
+# --profile-startup warns when launch to first frame takes longer than this
+STARTUP_BUDGET_MS = 500
+
+
+class StartupProfile:
+    """Wall-clock phases from process start to a usable app, for --profile-startup"""
+
+    def __init__(self, start):
+        self.enabled = False
+        self.last = start
+        self.start = start
+        self.phases = []  # (name, seconds)
+
+    def mark(self, name):
+        """Close the current phase under name"""
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def report(self, budget_ms=STARTUP_BUDGET_MS):
+        """Print the phase breakdown if --profile-startup was given"""
+        if not self.enabled:
+            return
+        total_ms = (self.last - self.start) * 1000
+        print(f"⏱️  Startup profile (budget {budget_ms} ms)")
+        for name, seconds in self.phases:
+            print(f"   {name:<22}{seconds * 1000:8.1f} ms")
+        verdict = "✅ within budget" if total_ms <= budget_ms else "⚠️  over budget"
+        print(f"   {'total':<22}{total_ms:8.1f} ms  {verdict}")
+
+
+STARTUP = StartupProfile(STARTUP_T0)
+
+
+_clock_nanosleep = None
+
+
+def sleep_until(deadline):
+    """Sleep until time.perf_counter() reaches deadline"""
+    global _clock_nanosleep
+    if _clock_nanosleep is None:
+        _clock_nanosleep = False
+        if (sys.platform.startswith('linux')
+                and time.get_clock_info('perf_counter').implementation == 'clock_gettime(CLOCK_MONOTONIC)'):
+            try:
+                import ctypes
+                import ctypes.util
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6')
+                nanosleep = libc.clock_nanosleep
+                nanosleep.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p]
+                timespec = ctypes.c_long * 2  # struct timespec {tv_sec, tv_nsec}
+                _clock_nanosleep = (nanosleep, timespec)
+            except (OSError, AttributeError):
+                pass
+
+    # perf_counter is CLOCK_MONOTONIC here, so the wake-up is pinned to the deadline itself
+    # and a signal interrupting the sleep cannot stretch it
+    if _clock_nanosleep:
+        nanosleep, timespec = _clock_nanosleep
+        deadline_ns = int(deadline * 1e9)
+        request = timespec(deadline_ns // 1000000000, deadline_ns % 1000000000)
+        # CLOCK_MONOTONIC = 1, TIMER_ABSTIME = 1; returns EINTR (4) if a signal woke it early
+        while nanosleep(1, 1, request, None) == 4:
+            pass
+        return
+
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def spin_until(deadline, clock=time.perf_counter):
+    """Yield the CPU in a tight loop until clock() reaches deadline"""
+    while clock() < deadline:
+        time.sleep(0)
+
+
+# A job's next deadline is its previous deadline plus the interval, not the time the click
+# finished plus the interval, so click cost never turns into drift. One thread for every
+# clicker also keeps them from racing each other for the pointer between move and click.
+class ClickScheduler:
+    """Fires every active clicker from one thread using a min-heap of absolute deadlines"""
+
+    def __init__(self, fire_callback, clock=time.perf_counter, wait_mode_of=None):
+        # fire_callback(job, deadline) -> seconds until the next click, or None to drop the job
+        self.fire_callback = fire_callback
+        self.clock = clock
+        # wait_mode_of(job) -> one of WAIT_MODES, read each time that job is next due
+        self.wait_mode_of = wait_mode_of
+        self._heap = []       # (deadline, seq, job_id, generation)
+        self._jobs = {}       # job_id -> (generation, job)
+        self._last_due = {}   # job_id -> deadline it last fired for
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        """Start the scheduler thread if it is not already running"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="ClickScheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=WORKER_JOIN_TIMEOUT):
+        """Stop the scheduler thread and drop every job"""
+        with self._cond:
+            self._running = False
+            self._jobs.clear()
+            self._heap.clear()
+            self._last_due.clear()
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            # The wait wakes at once; only a click already in flight can hold the join up
+            thread.join(timeout)
+            if thread.is_alive():
+                log.warning("⚠️  Scheduler thread still busy after %.1fs", timeout)
+        self._thread = None
+
+    def schedule(self, job_id, job, delay=0.0):
+        """Add a job whose first click fires after delay seconds"""
+        with self._cond:
+            generation = next(self._seq)
+            self._jobs[job_id] = (generation, job)
+            heapq.heappush(self._heap, (self.clock() + delay, generation, job_id, generation))
+            self._cond.notify()
+
+    def reschedule(self, job_id, interval):
+        """Re-time a job's pending click to interval after its last one (or now); False if not scheduled"""
+        with self._cond:
+            entry = self._jobs.get(job_id)
+            if entry is None:
+                return False
+            now = self.clock()
+            last = self._last_due.get(job_id)
+            deadline = now if last is None else max(now, last + interval)
+            generation = next(self._seq)
+            self._jobs[job_id] = (generation, entry[1])
+            heapq.heappush(self._heap, (deadline, generation, job_id, generation))
+            self._cond.notify()
+            return True
+
+    def unschedule(self, job_id):
+        """Remove a job; its stale heap entry is discarded when it reaches the top"""
+        with self._cond:
+            self._jobs.pop(job_id, None)
+            self._last_due.pop(job_id, None)
+            self._cond.notify()
+
+    def unschedule_all(self):
+        """Remove every job without stopping the thread"""
+        with self._cond:
+            self._jobs.clear()
+            self._heap.clear()
+            self._last_due.clear()
+            self._cond.notify()
+
+    def is_scheduled(self, job_id):
+        """Return True if the job is currently scheduled"""
+        with self._cond:
+            return job_id in self._jobs
+
+    def job_count(self):
+        """Return the number of scheduled jobs"""
+        with self._cond:
+            return len(self._jobs)
+
+    def _next_due(self):
+        """Block until a job is due and pop it, or return None when stopped"""
+        with self._cond:
+            while self._running:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline, _, job_id, generation = self._heap[0]
+                entry = self._jobs.get(job_id)
+                if entry is None or entry[0] != generation:
+                    heapq.heappop(self._heap)
+                    continue
+                remaining = deadline - self.clock()
+                if remaining > 0:
+                    mode = self.wait_mode_of(entry[1]) if self.wait_mode_of else WAIT_LOW_POWER
+                    if mode == WAIT_LOW_POWER or remaining > PRECISE_WAKE_MARGIN:
+                        # Interruptible, so new or removed jobs are seen right away
+                        self._cond.wait(remaining if mode == WAIT_LOW_POWER else remaining - PRECISE_WAKE_MARGIN)
+                        continue
+                    # Last stretch: wait precisely with the lock released, then re-check the heap
+                    self._cond.release()
+                    try:
+                        if mode == WAIT_ABSOLUTE and self.clock is time.perf_counter:
+                            sleep_until(deadline)
+                        else:
+                            spin_until(deadline, self.clock)
+                    finally:
+                        self._cond.acquire()
+                    continue
+                heapq.heappop(self._heap)
+                self._last_due[job_id] = deadline
+                return deadline, job_id, generation, entry[1]
+            return None
+
+    def _run(self):
+        """Scheduler loop"""
+        while True:
+            due = self._next_due()
+            if due is None:
+                return
+            deadline, job_id, generation, job = due
+
+            # Fire outside the lock so schedule/unschedule never wait on a click
+            interval = self.fire_callback(job, deadline)
+
+            with self._cond:
+                entry = self._jobs.get(job_id)
+                if entry is None or entry[0] != generation:
+                    continue  # Unscheduled or replaced while firing
+                if interval is None:
+                    del self._jobs[job_id]
+                    continue
+                next_deadline = deadline + interval
+                now = self.clock()
+                if next_deadline < now and interval > 0:
+                    # Fell behind: skip the missed ticks but stay on the original grid
+                    next_deadline += ((now - next_deadline) // interval + 1) * interval
+                heapq.heappush(self._heap, (next_deadline, next(self._seq), job_id, generation))
+
+
+def find_xdotool():
+    """Locate the xdotool binary, preferring the copy bundled in the AppImage"""
+    if 'APPDIR' in os.environ:
+        bundled_xdotool = os.path.join(os.environ['APPDIR'], 'usr', 'bin', 'xdotool')
+        if os.path.exists(bundled_xdotool):
+            return bundled_xdotool
+    return shutil.which('xdotool')
+
+
+# A click with count > 1 is a burst of press/release pairs sent back to back. Backends never
+# sleep or queue delayed events; ClickEngine gives each click of a spaced burst its own deadline.
+class InputBackend:
+    """Interface for injecting mouse input; buttons use X11 numbering (1 left, 2 middle, 3 right)"""
+
+    name = "base"
+
+    def move(self, x, y):
+        """Move the pointer to absolute screen coordinates"""
+        raise NotImplementedError
+
+    def click(self, button=1, count=1):
+        """Click count times at the current pointer position"""
+        raise NotImplementedError
+
+    def move_and_click_batch(self, points, button=1, count=1):
+        """Move to each (x, y) point and click count times there"""
+        for x, y in points:
+            self.move(x, y)
+            self.click(button, count)
+
+    def press(self, button=1):
+        """Press and hold a button at the current pointer position"""
+        raise NotImplementedError
+
+    def release(self, button=1):
+        """Release a held button"""
+        raise NotImplementedError
+
+    def scroll(self, dx, dy):
+        """Scroll dx steps right and dy steps up (negative for left / down)"""
+        raise NotImplementedError
+
+    def position(self):
+        """Return the current pointer position"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any connection or process held by the backend"""
+        pass
+
+
+class PynputBackend(InputBackend):
+    """pynput mouse controller; the only backend available on Windows"""
+
+    name = "pynput"
+
+    def __init__(self):
+        from pynput import mouse as pynput_mouse
+
+        self._controller = pynput_mouse.Controller()
+        self._buttons = {
+            1: pynput_mouse.Button.left,
+            2: pynput_mouse.Button.middle,
+            3: pynput_mouse.Button.right,
+        }
+        # Fail here rather than on the first click if the platform backend is unusable
+        self._controller.position
+
+    def move(self, x, y):
+        self._controller.position = (int(x), int(y))
+
+    def click(self, button=1, count=1):
+        self._controller.click(self._buttons[button], count)
+
+    def press(self, button=1):
+        self._controller.press(self._buttons[button])
+
+    def release(self, button=1):
+        self._controller.release(self._buttons[button])
+
+    def scroll(self, dx, dy):
+        self._controller.scroll(dx, dy)
+
+    def position(self):
+        return self._controller.position
+
+
+# The display is opened once and each batch of clicks is flushed with a single sync,
+# so no process is spawned per click
+class XTestBackend(InputBackend):
+    """Persistent X11 connection that injects pointer events through the XTEST extension"""
+
+    name = "xtest"
+
+    def __init__(self, display_name=None):
+        from Xlib import X, display as xdisplay
+        from Xlib.ext import xtest
+
+        self._X = X
+        self._xtest = xtest
+        self._display = xdisplay.Display(display_name)
+        if not self._display.has_extension('XTEST'):
+            self._display.close()
+            raise RuntimeError("X server does not support the XTEST extension")
+        self._root = self._display.screen().root
+        self._lock = threading.Lock()
+
+    def _queue_move(self, x, y):
+        self._xtest.fake_input(self._display, self._X.MotionNotify, x=int(x), y=int(y))
+
+    def _queue_click(self, button=1, count=1):
+        for _ in range(count):
+            self._xtest.fake_input(self._display, self._X.ButtonPress, button)
+            self._xtest.fake_input(self._display, self._X.ButtonRelease, button)
+
+    def move(self, x, y):
+        with self._lock:
+            self._queue_move(x, y)
+            self._display.sync()
+
+    def click(self, button=1, count=1):
+        with self._lock:
+            self._queue_click(button, count)
+            self._display.sync()
+
+    def press(self, button=1):
+        with self._lock:
+            self._xtest.fake_input(self._display, self._X.ButtonPress, button)
+            self._display.sync()
+
+    def release(self, button=1):
+        with self._lock:
+            self._xtest.fake_input(self._display, self._X.ButtonRelease, button)
+            self._display.sync()
+
+    def scroll(self, dx, dy):
+        # X11 scrolls with buttons: 4/5 up/down, 6/7 left/right, one click per step
+        with self._lock:
+            if dy:
+                self._queue_click(4 if dy > 0 else 5, abs(dy))
+            if dx:
+                self._queue_click(7 if dx > 0 else 6, abs(dx))
+            self._display.sync()
+
+    def move_and_click_batch(self, points, button=1, count=1):
+        """Move and click at each (x, y) point, flushed as one write"""
+        with self._lock:
+            for x, y in points:
+                self._queue_move(x, y)
+                self._queue_click(button, count)
+            self._display.sync()
+
+    def position(self):
+        with self._lock:
+            pointer = self._root.query_pointer()
+        return pointer.root_x, pointer.root_y
+
+    def close(self):
+        with self._lock:
+            self._display.close()
+
+
+class XdotoolBackend(InputBackend):
+    """xdotool driven with chained commands so one process handles a whole batch of clicks"""
+
+    name = "xdotool"
+
+    def __init__(self, xdotool_cmd=None):
+        self.xdotool_cmd = xdotool_cmd or find_xdotool()
+        if not self.xdotool_cmd:
+            raise FileNotFoundError("xdotool not found")
+
+    def _run(self, args):
+        subprocess.run([self.xdotool_cmd] + args, check=True, capture_output=True)
+
+    def move(self, x, y):
+        self._run(['mousemove', str(int(x)), str(int(y))])
+
+    @staticmethod
+    def _click_args(button, count):
+        # --delay 0 because xdotool otherwise waits 12 ms between repeats
+        return ['click', '--repeat', str(count), '--delay', '0', str(button)]
+
+    def click(self, button=1, count=1):
+        self._run(self._click_args(button, count))
+
+    def press(self, button=1):
+        self._run(['mousedown', str(button)])
+
+    def release(self, button=1):
+        self._run(['mouseup', str(button)])
+
+    def scroll(self, dx, dy):
+        args = []
+        if dy:
+            args += self._click_args(4 if dy > 0 else 5, abs(dy))
+        if dx:
+            args += self._click_args(7 if dx > 0 else 6, abs(dx))
+        if args:
+            self._run(args)
+
+    def move_and_click_batch(self, points, button=1, count=1):
+        """Move and click at each (x, y) point in a single xdotool invocation"""
+        args = []
+        click_args = self._click_args(button, count)
+        for x, y in points:
+            args += ['mousemove', str(int(x)), str(int(y))] + click_args
+        if args:
+            self._run(args)
+
+    def position(self):
+        result = subprocess.run([self.xdotool_cmd, 'getmouselocation', '--shell'],
+                                check=True, capture_output=True, text=True)
+        values = dict(line.split('=', 1) for line in result.stdout.split() if '=' in line)
+        return int(values['X']), int(values['Y'])
+
+
+class RecordingBackend(InputBackend):
+    """In-memory backend that records events instead of touching the real pointer, for headless runs"""
+
+    name = "memory"
+
+    def __init__(self):
+        # (perf_counter_ns, kind, a, b): 'move' (x, y), 'click' (button, count),
+        # 'press' / 'release' (button, 0) or 'scroll' (dx, dy)
+        self.events = []
+        self._position = (0, 0)
+        self._lock = threading.Lock()
+
+    def move(self, x, y):
+        with self._lock:
+            self._position = (int(x), int(y))
+            self.events.append((time.perf_counter_ns(), 'move', int(x), int(y)))
+
+    def click(self, button=1, count=1):
+        with self._lock:
+            self.events.append((time.perf_counter_ns(), 'click', button, count))
+
+    def move_and_click_batch(self, points, button=1, count=1):
+        with self._lock:
+            for x, y in points:
+                now = time.perf_counter_ns()
+                self._position = (int(x), int(y))
+                self.events.append((now, 'move', int(x), int(y)))
+                self.events.append((now, 'click', button, count))
+
+    def press(self, button=1):
+        with self._lock:
+            self.events.append((time.perf_counter_ns(), 'press', button, 0))
+
+    def release(self, button=1):
+        with self._lock:
+            self.events.append((time.perf_counter_ns(), 'release', button, 0))
+
+    def scroll(self, dx, dy):
+        with self._lock:
+            self.events.append((time.perf_counter_ns(), 'scroll', dx, dy))
+
+    def position(self):
+        with self._lock:
+            return self._position
+
+    def click_count(self):
+        """Return the total number of button clicks recorded"""
+        with self._lock:
+            return sum(event[3] for event in self.events if event[1] == 'click')
+
+    def clear(self):
+        with self._lock:
+            self.events = []
+
+
+INPUT_BACKENDS = {
+    'xtest': XTestBackend,
+    'pynput': PynputBackend,
+    'xdotool': XdotoolBackend,
+    'memory': RecordingBackend,
+}
+
+
+def input_backend_order():
+    """Return backend names from fastest to slowest for this platform"""
+    if sys.platform.startswith('linux'):
+        return ['xtest', 'pynput', 'xdotool']
+    return ['pynput']
+
+
+def select_input_backend(preferred=None, exclude=()):
+    """Open the first working backend, trying preferred (or $AUTOCLICKER_BACKEND) first; None if none works"""
+    # Probed once here, so the click path never finds a broken backend through an exception per click
+    preferred = preferred or os.environ.get('AUTOCLICKER_BACKEND')
+    order = input_backend_order()
+    if preferred:
+        order = [preferred] + [name for name in order if name != preferred]
+    for name in order:
+        if name in exclude or name not in INPUT_BACKENDS:
+            continue
+        try:
+            backend = INPUT_BACKENDS[name]()
+        except Exception as e:
+            log.warning("⚠️  Input backend '%s' unavailable: %s", name, e)
+            continue
+        if name == 'xdotool' and 'APPDIR' in os.environ and backend.xdotool_cmd.startswith(os.environ['APPDIR']):
+            log.info("🎯 Using bundled xdotool from AppImage")
+        log.info("✅ Input backend: %s", name)
+        return backend
+    return None
+
+
+class RecordingBuffer:
+    """Recorded events stored column-wise in typed arrays"""
+
+    def __init__(self):
+        self.clear()
+
+    def append(self, x, y, t, kind=EVENT_CLICK, detail=1):
+        """Add one event"""
+        # The time goes last: a reader that sizes itself with len() never sees a half-written event
+        self.xs.append(x)
+        self.ys.append(y)
+        self.kinds.append(kind)
+        self.details.append(detail)
+        self.times.append(t)
+
+    def clear(self):
+        """Drop every event"""
+        # 21 bytes per event instead of a tuple of five Python objects
+        self.xs = array('i')
+        self.ys = array('i')
+        self.times = array('d')
+        self.kinds = array('B')
+        self.details = array('i')
+
+    def __len__(self):
+        return len(self.times)
+
+    def __getitem__(self, index):
+        return self.xs[index], self.ys[index], self.times[index], self.kinds[index], self.details[index]
+
+    def __iter__(self):
+        return zip(*self.columns())
+
+    def columns(self, start=0, stop=None):
+        """Zero-copy memoryviews of (xs, ys, times, kinds, details) for events [start, stop)"""
+        # The arrays cannot grow while a view is alive, so views must go before recording again
+        stop = len(self) if stop is None else min(stop, len(self))
+        return (memoryview(self.xs)[start:stop],
+                memoryview(self.ys)[start:stop],
+                memoryview(self.times)[start:stop],
+                memoryview(self.kinds)[start:stop],
+                memoryview(self.details)[start:stop])
+
+    def duration(self):
+        """Return the time of the last event in seconds"""
+        return self.times[-1] if len(self) else 0.0
+
+    @classmethod
+    def from_events(cls, events):
+        """Build a buffer from any recording or iterable of (x, y, t, kind, detail)"""
+        if isinstance(events, cls):
+            return events
+        buffer = cls()
+        for event in events:
+            buffer.append(*event)
+        return buffer
+
+    @classmethod
+    def from_columns(cls, xs, ys, times, kinds, details):
+        """Build a buffer that takes ownership of five equal-length arrays"""
+        buffer = cls()
+        buffer.xs, buffer.ys, buffer.times, buffer.kinds, buffer.details = xs, ys, times, kinds, details
+        return buffer
+
+    def nbytes(self):
+        """Return the memory used by the event data"""
+        return sum(column.itemsize * column.buffer_info()[1]
+                   for column in (self.xs, self.ys, self.times, self.kinds, self.details))
+
+
+class MotionFilter:
+    """Downsamples pointer motion as it is recorded"""
+
+    def __init__(self, min_distance=MOTION_MIN_DISTANCE, min_interval=MOTION_MIN_INTERVAL):
+        self.min_distance = min_distance
+        self.min_interval = min_interval
+        self._last = None     # (x, y, t) of the last kept move
+        # Latest dropped move, flushed before a button or scroll event so the replayed
+        # path goes through the exact spot where the button went down
+        self._pending = None
+
+    def accept(self, x, y, t):
+        """Return True if the move at (x, y, t) should be recorded"""
+        last = self._last
+        if (last is None or t - last[2] >= self.min_interval
+                and math.hypot(x - last[0], y - last[1]) >= self.min_distance):
+            self._last = (x, y, t)
+            self._pending = None
+            return True
+        self._pending = (x, y, t)
+        return False
+
+    def flush(self):
+        """Return the latest dropped move as (x, y, t) and mark it kept, or None"""
+        pending = self._pending
+        if pending is not None:
+            self._last = pending
+            self._pending = None
+        return pending
+
+
+def replay_schedule(recording, speed=1.0, max_gap_ms=None):
+    """Yield (x, y, t, kind, detail) with each pause capped at max_gap_ms, then divided by speed"""
+    max_gap = None if max_gap_ms is None else max_gap_ms / 1000.0
+    previous = 0.0
+    offset = 0.0
+    for x, y, t, kind, detail in recording:
+        gap = t - previous
+        previous = t
+        if max_gap is not None and gap > max_gap:
+            gap = max_gap
+        offset += gap / speed
+        yield x, y, offset, kind, detail
+
+
+# Binary recording format (.acrec), little-endian:
+#   32-byte header: magic, version, record size, flags, record count, padding
+#   followed by fixed-width (x: int32, y: int32, t: float64, kind: uint8, detail: int32)
+#   records; version 1 files hold (x, y, t) clicks only and are still read
+# Metadata lives in an optional JSON sidecar next to the file (<name>.acrec.json).
+RECORDING_MAGIC = b'ACREC\x00'
+RECORDING_VERSION = 2
+RECORDING_HEADER = struct.Struct('<6sHHHQ12x')
+RECORDING_RECORD = struct.Struct('<iidB3xi')
+RECORDING_RECORD_V1 = struct.Struct('<iid')
+RECORDING_EXTENSION = '.acrec'
+RECORDING_FLAG_STREAMING = 0x1  # Set while a stream is open; count is then derived from file size
+
+
+def config_dir():
+    """Return the per-user directory for settings and recordings"""
+    if sys.platform.startswith('win'):
+        base = os.environ.get('APPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+    return os.path.join(base, 'autoclicker')
+
+
+def recordings_dir():
+    """Return the directory streamed recordings are written to"""
+    return os.path.join(config_dir(), 'recordings')
+
+
+def recording_sidecar_path(path):
+    """Return the JSON metadata path for a recording file"""
+    return path + '.json'
+
+
+def save_recording(recording, path, metadata=None):
+    """Write a recording to path atomically, plus a JSON metadata sidecar"""
+    count = len(recording)
+    data = bytearray(RECORDING_HEADER.size + count * RECORDING_RECORD.size)
+    RECORDING_HEADER.pack_into(data, 0, RECORDING_MAGIC, RECORDING_VERSION,
+                               RECORDING_RECORD.size, 0, count)
+    offset = RECORDING_HEADER.size
+    for event in recording:
+        RECORDING_RECORD.pack_into(data, offset, *event)
+        offset += RECORDING_RECORD.size
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    write_recording_sidecar(path, count, recording.duration(), metadata)
+
+
+def write_recording_sidecar(path, count, duration, metadata=None):
+    """Write the JSON metadata sidecar for a recording file"""
+    sidecar = {
+        'format': 'acrec',
+        'version': RECORDING_VERSION,
+        'clicks': count,
+        'duration': duration,
+        'saved_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+    sidecar.update(metadata or {})
+    tmp_path = recording_sidecar_path(path) + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(sidecar, f, indent=2)
+    os.replace(tmp_path, recording_sidecar_path(path))
+
+
+def load_recording_metadata(path):
+    """Return the JSON sidecar for a recording, or an empty dict if there is none"""
+    try:
+        with open(recording_sidecar_path(path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# Records are decoded one at a time as replay walks them, so opening is instant and the OS
+# pages the file in (and drops it again) instead of every event becoming a Python object
+class MappedRecording:
+    """Read-only recording replayed straight from a memory-mapped .acrec file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty")
+        try:
+            magic, version, record_size, flags, count = RECORDING_HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            self.close()
+            raise ValueError(f"{path} is too short to be a recording")
+        if version > RECORDING_VERSION and magic == RECORDING_MAGIC:
+            self.close()
+            raise ValueError(f"{path} uses recording format v{version}, newer than supported v{RECORDING_VERSION}")
+        self._record = RECORDING_RECORD_V1 if version == 1 else RECORDING_RECORD
+        if magic != RECORDING_MAGIC or record_size != self._record.size:
+            self.close()
+            raise ValueError(f"{path} is not a recording file")
+        if flags & RECORDING_FLAG_STREAMING:
+            # Stream was never closed (crash or still recording): keep every complete record
+            count = (len(self._map) - RECORDING_HEADER.size) // record_size
+        end = RECORDING_HEADER.size + count * record_size
+        if end > len(self._map):
+            self.close()
+            raise ValueError(f"{path} is truncated")
+        self._count = count
+        self._records = memoryview(self._map)[RECORDING_HEADER.size:end]
+        self.metadata = load_recording_metadata(path)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("recording index out of range")
+        event = self._record.unpack_from(self._records, index * self._record.size)
+        return event if self._record is RECORDING_RECORD else event + (EVENT_CLICK, 1)
+
+    def __iter__(self):
+        if self._record is RECORDING_RECORD:
+            return self._record.iter_unpack(self._records)
+        return ((x, y, t, EVENT_CLICK, 1) for x, y, t in self._record.iter_unpack(self._records))
+
+    def duration(self):
+        """Return the time of the last event in seconds"""
+        return self[-1][2] if self._count else 0.0
+
+    def close(self):
+        """Unmap and close the file"""
+        records = getattr(self, '_records', None)
+        if records is not None:
+            records.release()
+            self._records = None
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class RecordingStream:
+    """Appends records to a .acrec file as they arrive"""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.duration = 0.0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'wb')
+        # Flagged as streaming until close() patches in the count, so a stream cut short still loads
+        self._file.write(RECORDING_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION,
+                                               RECORDING_RECORD.size, RECORDING_FLAG_STREAMING, 0))
+        self._file.flush()
+
+    def write(self, events):
+        """Append a batch of (x, y, t, kind, detail) events with one write"""
+        if not events:
+            return
+        data = bytearray(len(events) * RECORDING_RECORD.size)
+        offset = 0
+        for event in events:
+            RECORDING_RECORD.pack_into(data, offset, *event)
+            offset += RECORDING_RECORD.size
+        self._file.write(data)
+        self._file.flush()
+        self.count += len(events)
+        self.duration = events[-1][2]
+
+    def close(self, metadata=None):
+        """Finalize the header and write the metadata sidecar"""
+        self._file.seek(0)
+        self._file.write(RECORDING_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION,
+                                               RECORDING_RECORD.size, 0, self.count))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        write_recording_sidecar(self.path, self.count, self.duration, metadata)
+
+
+class RecordingWriter:
+    """Moves recorded events off the mouse listener thread"""
+
+    def __init__(self, buffer, stream=None, flush_interval=0.05):
+        self.buffer = buffer
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.submitted = 0  # Only written by the listener thread
+        # The listener only appends here, which never blocks; _run drains it in batches
+        self._pending = collections.deque()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="RecordingWriter", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def submit(self, x, y, t, kind=EVENT_CLICK, detail=1):
+        """Hand one event to the writer; safe to call from the listener thread"""
+        self._pending.append((x, y, t, kind, detail))
+        self.submitted += 1
+
+    def _drain(self):
+        batch = []
+        pop = self._pending.popleft
+        while True:
+            try:
+                batch.append(pop())
+            except IndexError:
+                break
+        if not batch:
+            return
+        append = self.buffer.append
+        for event in batch:
+            append(*event)
+        if self.stream is not None:
+            try:
+                self.stream.write(batch)
+            except OSError as e:
+                log.warning("⚠️  Streaming to %s stopped: %s", self.stream.path, e)
+                self.stream = None
+        log.debug("📹 Recorded %d event(s), %d total", len(batch), len(self.buffer))
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self._drain()
+
+    def stop(self):
+        """Flush everything still pending and close the stream"""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._drain()
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except OSError as e:
+                log.warning("⚠️  Could not finalize %s: %s", self.stream.path, e)
+
+
+# Recording edits. Each takes a recording (anything iterable as events) and
+# returns a new RecordingBuffer, computed column by column in one pass over the
+# arrays; the input is never modified. Times stay relative to recording start.
+
+def dedupe_clicks(recording, min_interval_ms):
+    """Drop clicks that repeat the previous click's button less than min_interval_ms later"""
+    buffer = RecordingBuffer.from_events(recording)
+    min_interval = min_interval_ms / 1000.0
+    keep = bytearray(len(buffer))
+    last_time = None
+    last_button = None
+    dropped = set()  # Buttons whose press was dropped; their next release goes with it
+    for i, (t, kind, detail) in enumerate(zip(buffer.times, buffer.kinds, buffer.details)):
+        if kind == EVENT_CLICK or kind == EVENT_PRESS:
+            # A press/release pair from a full recording counts as one click, timed by its press
+            if detail == last_button and t - last_time < min_interval:
+                if kind == EVENT_PRESS:
+                    dropped.add(detail)
+                continue
+            last_time, last_button = t, detail
+        elif kind == EVENT_RELEASE and detail in dropped:
+            dropped.discard(detail)
+            continue
+        keep[i] = 1
+    return RecordingBuffer.from_columns(*(array(column.typecode, itertools.compress(column, keep))
+                                          for column in (buffer.xs, buffer.ys, buffer.times,
+                                                         buffer.kinds, buffer.details)))
+
+
+def snap_to_grid(recording, step):
+    """Round every position to the nearest multiple of step pixels"""
+    buffer = RecordingBuffer.from_events(recording)
+    step = int(step)
+    if step <= 0:
+        raise ValueError("grid step must be positive")
+    return RecordingBuffer.from_columns(array('i', (round(x / step) * step for x in buffer.xs)),
+                                        array('i', (round(y / step) * step for y in buffer.ys)),
+                                        array('d', buffer.times), array('B', buffer.kinds),
+                                        array('i', buffer.details))
+
+
+def trim_idle(recording):
+    """Shift every event earlier so the first one happens at t = 0"""
+    buffer = RecordingBuffer.from_events(recording)
+    first = buffer.times[0] if len(buffer) else 0.0
+    return RecordingBuffer.from_columns(array('i', buffer.xs), array('i', buffer.ys),
+                                        array('d', (t - first for t in buffer.times)),
+                                        array('B', buffer.kinds), array('i', buffer.details))
+
+
+def scale_time(recording, factor):
+    """Multiply every event time by factor (0.5 plays twice as fast)"""
+    buffer = RecordingBuffer.from_events(recording)
+    factor = float(factor)
+    if factor <= 0:
+        raise ValueError("time scale must be positive")
+    return RecordingBuffer.from_columns(array('i', buffer.xs), array('i', buffer.ys),
+                                        array('d', (t * factor for t in buffer.times)),
+                                        array('B', buffer.kinds), array('i', buffer.details))
+
+
+def concat_recordings(recordings, gap_ms=0):
+    """Join recordings end to end, each keeping its lead-in and starting gap_ms after the previous one ends"""
+    xs, ys, times, kinds, details = array('i'), array('i'), array('d'), array('B'), array('i')
+    offset = 0.0
+    for index, recording in enumerate(recordings):
+        buffer = RecordingBuffer.from_events(recording)
+        if index:
+            offset += gap_ms / 1000.0
+        xs.extend(buffer.xs)
+        ys.extend(buffer.ys)
+        kinds.extend(buffer.kinds)
+        details.extend(buffer.details)
+        times.extend(t + offset for t in buffer.times)
+        offset += buffer.duration()
+    return RecordingBuffer.from_columns(xs, ys, times, kinds, details)
+
+
+def loop_recording(recording, count, gap_ms=0):
+    """Repeat a recording count times, gap_ms apart"""
+    buffer = RecordingBuffer.from_events(recording)
+    count = int(count)
+    if count < 1:
+        raise ValueError("loop count must be at least 1")
+    period = buffer.duration() + gap_ms / 1000.0
+    times = array('d', (t + k * period for k in range(count) for t in buffer.times))
+    return RecordingBuffer.from_columns(buffer.xs * count, buffer.ys * count, times,
+                                        buffer.kinds * count, buffer.details * count)
+
+
+# Edit specs are comma-separated steps applied in order, e.g. "trim,dedupe=80,snap=10,scale=0.5,loop=3:500"
+RECORDING_EDITS = {
+    'dedupe': (dedupe_clicks, "dedupe=MS"),
+    'snap': (snap_to_grid, "snap=PX"),
+    'trim': (trim_idle, "trim"),
+    'scale': (scale_time, "scale=FACTOR"),
+    'loop': (loop_recording, "loop=COUNT[:GAP_MS]"),
+}
+
+
+def parse_recording_edits(spec):
+    """Parse an edit spec into a list of (function, args); raises ValueError"""
+    edits = []
+    for step in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, value = step.partition('=')
+        name = name.strip().lower()
+        if name not in RECORDING_EDITS:
+            usage = ", ".join(example for _, example in RECORDING_EDITS.values())
+            raise ValueError(f"unknown edit '{name}', expected one of: {usage}")
+        function, example = RECORDING_EDITS[name]
+        try:
+            if name == 'trim':
+                if value:
+                    raise ValueError()
+                args = ()
+            elif name == 'loop':
+                count, _, gap = value.partition(':')
+                args = (int(count), float(gap or 0))
+            else:
+                args = (float(value),)
+        except ValueError:
+            raise ValueError(f"bad edit '{step}', expected {example}")
+        edits.append((function, args))
+    return edits
+
+
+def edit_recording(recording, spec):
+    """Apply an edit spec to a recording and return the result as a new RecordingBuffer"""
+    for function, args in parse_recording_edits(spec):
+        recording = function(recording, *args)
+    return RecordingBuffer.from_events(recording)
+
+
+# Histograms are log-linear: 2**HISTOGRAM_SUB_BITS buckets per power of two (about
+# 3% relative error), covering 0 to HISTOGRAM_MAX_VALUE ns (~68 s) in 528 slots
+HISTOGRAM_SUB_BITS = 5
+HISTOGRAM_MAX_VALUE = (1 << 36) - 1
+STATS_REFRESH_INTERVAL = 1.0  # Seconds between stats panel redraws
+
+
+class LatencyHistogram:
+    """Fixed-size HDR-style histogram of non-negative integers (nanoseconds or pixels)"""
+
+    # Recording never allocates, so it is cheap enough for the click path; percentiles are
+    # accurate to one bucket
+    SUB_BUCKETS = 1 << HISTOGRAM_SUB_BITS
+    HALF_BUCKETS = SUB_BUCKETS >> 1
+
+    def __init__(self, unit='ns'):
+        self.unit = unit
+        self.reset()
+
+    @classmethod
+    def bucket_index(cls, value):
+        """Bucket holding value: exact below SUB_BUCKETS, then SUB_BITS significant bits"""
+        if value < cls.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - HISTOGRAM_SUB_BITS
+        return shift * cls.HALF_BUCKETS + (value >> shift)
+
+    @classmethod
+    def bucket_range(cls, index):
+        """(lowest, highest) value that lands in bucket index"""
+        if index < cls.SUB_BUCKETS:
+            return index, index
+        shift = index // cls.HALF_BUCKETS - 1
+        mantissa = index - shift * cls.HALF_BUCKETS
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def reset(self):
+        """Drop every recorded value"""
+        buckets = self.bucket_index(HISTOGRAM_MAX_VALUE) + 1
+        self.counts = array('Q', bytes(8 * buckets))
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value):
+        """Add one value, clamped to [0, HISTOGRAM_MAX_VALUE]"""
+        if value < 0:
+            value = 0
+        elif value > HISTOGRAM_MAX_VALUE:
+            value = HISTOGRAM_MAX_VALUE
+        self.counts[self.bucket_index(value)] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, pct):
+        """Value at the pct-th percentile (middle of its bucket, clamped to min/max)"""
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                low, high = self.bucket_range(index)
+                return min(self.max, max(self.min, (low + high) // 2))
+        return self.max
+
+    def summary(self):
+        """Count, mean, min/max and the usual percentiles"""
+        return {
+            'count': self.count,
+            'min': self.min,
+            'mean': self.total / self.count if self.count else 0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'p999': self.percentile(99.9),
+            'max': self.max,
+        }
+
+    def to_dict(self):
+        """Summary plus the non-empty buckets as [low, high, count]"""
+        data = {'unit': self.unit}
+        data.update(self.summary())
+        data['buckets'] = [list(self.bucket_range(index)) + [count]
+                           for index, count in enumerate(self.counts) if count]
+        return data
+
+
+class ClickMetrics:
+    """Timing and accuracy metrics for one clicker (or the replay), written by one thread"""
+
+    HISTOGRAMS = ('lateness', 'move', 'click', 'move_click', 'position_error')
+
+    def __init__(self):
+        self.lateness = LatencyHistogram()             # Actual fire time minus scheduled deadline
+        self.move = LatencyHistogram()                 # backend.move() on verified clicks
+        self.click = LatencyHistogram()                # backend.click() on verified clicks
+        self.move_click = LatencyHistogram()           # Single move + click call on the fast path
+        self.position_error = LatencyHistogram('px')   # Read-back distance on verified clicks
+        self.fallbacks = 0                             # Clicks retried on another backend
+
+    def reset(self):
+        """Start collecting from scratch"""
+        for name in self.HISTOGRAMS:
+            getattr(self, name).reset()
+        self.fallbacks = 0
+
+    def to_dict(self):
+        """Every histogram plus the fallback count, ready for JSON"""
+        data = {name: getattr(self, name).to_dict() for name in self.HISTOGRAMS}
+        data['fallbacks'] = self.fallbacks
+        return data
+
+
+def format_metrics(name, metrics):
+    """Human-readable lines for one ClickMetrics, used by the stats panel and --headless"""
+    lines = [f"{name}: {metrics.lateness.count} ticks, {metrics.fallbacks} backend fallbacks"]
+    for label, key in (("lateness", 'lateness'), ("move+click", 'move_click'),
+                       ("move", 'move'), ("click", 'click')):
+        histogram = getattr(metrics, key)
+        if histogram.count:
+            stats = histogram.summary()
+            lines.append(f"  {label:<11} p50 {stats['p50'] / 1e6:8.3f} ms   p99 {stats['p99'] / 1e6:8.3f} ms   "
+                         f"max {stats['max'] / 1e6:8.3f} ms")
+    if metrics.position_error.count:
+        stats = metrics.position_error.summary()
+        lines.append(f"  {'pos error':<11} p50 {stats['p50']:5d} px      p99 {stats['p99']:5d} px      "
+                     f"max {stats['max']:5d} px")
+    return lines
+
+
+def export_metrics(sources, path):
+    """Write {name: ClickMetrics} to path as JSON (full histograms) or CSV (one row per histogram)"""
+    if path.lower().endswith('.csv'):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['source', 'metric', 'unit', 'count', 'min', 'mean',
+                             'p50', 'p90', 'p99', 'p999', 'max'])
+            for name, metrics in sources.items():
+                for key in ClickMetrics.HISTOGRAMS:
+                    histogram = getattr(metrics, key)
+                    stats = histogram.summary()
+                    writer.writerow([name, key, histogram.unit, stats['count'], stats['min'],
+                                     f"{stats['mean']:.1f}", stats['p50'], stats['p90'],
+                                     stats['p99'], stats['p999'], stats['max']])
+                writer.writerow([name, 'fallbacks', 'count', metrics.fallbacks] + [''] * 7)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({name: metrics.to_dict() for name, metrics in sources.items()}, f, indent=2)
+
+
+class JitterSource:
+    """Seeded stream of random offsets, pre-generated in blocks"""
+
+    _refills = None  # Shared queue feeding the refill thread
+    _refills_lock = threading.Lock()
+
+    def __init__(self, distribution, spread, seed):
+        if distribution not in JITTER_DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {', '.join(JITTER_DISTRIBUTIONS)}")
+        self.distribution = distribution
+        self.spread = float(spread)
+        # One generator drawn in order, so a seed gives the same offsets however refills are timed
+        self._rng = random.Random(seed)
+        self._block = self._generate()
+        self._index = 0
+        self._next_block = None
+        self._refilled = threading.Event()
+
+    def _generate(self):
+        """Draw one block of offsets"""
+        rng = self._rng
+        spread = self.spread
+        if self.distribution == 'uniform':
+            values = (rng.uniform(-spread, spread) for _ in range(JITTER_BLOCK))
+        elif self.distribution == 'gaussian':
+            values = (rng.gauss(0.0, spread) for _ in range(JITTER_BLOCK))
+        else:
+            # Zero-mean log-normal: mostly small, with a long tail of large positive offsets
+            mean = math.exp(LOGNORMAL_SIGMA ** 2 / 2)
+            values = (spread * (rng.lognormvariate(0.0, LOGNORMAL_SIGMA) - mean) for _ in range(JITTER_BLOCK))
+        return array('d', values)
+
+    def _refill(self):
+        """Generate the next block; runs on the refill thread"""
+        self._next_block = self._generate()
+        self._refilled.set()
+
+    @classmethod
+    def _request_refill(cls, source):
+        with cls._refills_lock:
+            if cls._refills is None:
+                cls._refills = queue.SimpleQueue()
+                threading.Thread(target=cls._refill_worker, name="JitterRefill", daemon=True).start()
+        cls._refills.put(source)
+
+    @classmethod
+    def _refill_worker(cls):
+        while True:
+            cls._refills.get()._refill()
+
+    def next(self):
+        """Return the next offset"""
+        i = self._index
+        if i == JITTER_BLOCK // 2:
+            self._request_refill(self)
+        elif i == JITTER_BLOCK:
+            # The refill normally finished long ago; waiting keeps the draw order fixed
+            self._refilled.wait()
+            self._refilled.clear()
+            self._block = self._next_block
+            self._next_block = None
+            i = 0
+        self._index = i + 1
+        return self._block[i]
+
+
+class TargetPath:
+    """A clicker's targets, precomputed into two int arrays and walked one point per tick"""
+
+    def __init__(self, xs, ys):
+        self.xs = xs
+        self.ys = ys
+        self.index = 0
+        self._count = len(xs)
+
+    def __len__(self):
+        return self._count
+
+    def next_point(self):
+        """Return the next (x, y), wrapping around at the end"""
+        i = self.index
+        self.index = i + 1 if i + 1 < self._count else 0
+        return self.xs[i], self.ys[i]
+
+
+def _halton(index, base):
+    """index-th element of the Halton low-discrepancy sequence in [0, 1)"""
+    result = 0.0
+    fraction = 1.0 / base
+    while index:
+        index, digit = divmod(index, base)
+        result += digit * fraction
+        fraction /= base
+    return result
+
+
+def _rect(spec):
+    """(x, y, width, height) from a {'x', 'y', 'width', 'height'} mapping"""
+    x, y, width, height = (int(spec[key]) for key in ('x', 'y', 'width', 'height'))
+    if width < 0 or height < 0:
+        raise ValueError("width and height must not be negative")
+    return x, y, width, height
+
+
+# Target segments:
+#   {"points": [[x, y], ...], "weights": [w, ...]}  - optional positive weights; point i
+#       appears w_i times, its visits spaced evenly over the segment
+#   {"grid": {"x", "y", "width", "height", "rows", "cols"}}  - every cell centre, row by row
+#   {"region": {"x", "y", "width", "height"}, "count": n}  - n points spread evenly over the
+#       rectangle (Halton sequence, so the same spec always gives the same points)
+def build_target_path(targets):
+    """Expand a list of target segments, clicked in order and repeated, into a TargetPath; raises ValueError"""
+    xs = array('i')
+    ys = array('i')
+    try:
+        for segment in targets:
+            if 'points' in segment:
+                points = [(int(x), int(y)) for x, y in segment['points']]
+                weights = [int(w) for w in segment.get('weights', [1] * len(points))]
+                if len(weights) != len(points) or any(w < 1 for w in weights):
+                    raise ValueError("weights must be positive and match the points")
+                if len(xs) + sum(weights) > MAX_TARGET_POINTS:
+                    raise ValueError(f"more than {MAX_TARGET_POINTS} target points")
+                if all(w == 1 for w in weights):
+                    xs.extend(x for x, _ in points)
+                    ys.extend(y for _, y in points)
+                    continue
+                # Visit j of point i is due at (j + 1/2) * total / w_i; a heap of each point's
+                # next due visit interleaves them in O(total log n). Both sides of the
+                # division are exact ints, so equal due times tie exactly and go by index.
+                total = sum(weights)
+                due = [(total / (2 * weight), i, 0) for i, weight in enumerate(weights)]
+                heapq.heapify(due)
+                for _ in range(total):
+                    _, i, visit = due[0]
+                    xs.append(points[i][0])
+                    ys.append(points[i][1])
+                    if visit + 1 < weights[i]:
+                        heapq.heapreplace(due, ((2 * visit + 3) * total / (2 * weights[i]), i, visit + 1))
+                    else:
+                        heapq.heappop(due)
+            elif 'grid' in segment:
+                grid = segment['grid']
+                x, y, width, height = _rect(grid)
+                rows, cols = int(grid['rows']), int(grid['cols'])
+                if rows < 1 or cols < 1:
+                    raise ValueError("grid needs at least one row and column")
+                if len(xs) + rows * cols > MAX_TARGET_POINTS:
+                    raise ValueError(f"more than {MAX_TARGET_POINTS} target points")
+                for row in range(rows):
+                    cy = y + int((row + 0.5) * height / rows)
+                    for col in range(cols):
+                        xs.append(x + int((col + 0.5) * width / cols))
+                        ys.append(cy)
+            elif 'region' in segment:
+                x, y, width, height = _rect(segment['region'])
+                count = int(segment.get('count', 100))
+                if count < 1 or len(xs) + count > MAX_TARGET_POINTS:
+                    raise ValueError(f"region count must be 1-{MAX_TARGET_POINTS}")
+                for i in range(1, count + 1):
+                    xs.append(x + int(_halton(i, 2) * width))
+                    ys.append(y + int(_halton(i, 3) * height))
+            else:
+                raise ValueError("each target needs 'points', 'grid' or 'region'")
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"malformed target: {e!r}")
+    if not xs:
+        raise ValueError("targets produce no points")
+    return TargetPath(xs, ys)
+
+
+def targets_from_points(points, grid=None):
+    """(coordinates, targets) for a list of picked points"""
+    if not points:
+        return None, None
+    coordinates = tuple(points[0])
+    # With a grid the first two points are opposite corners; otherwise several points are walked in order
+    if grid and len(points) >= 2:
+        (x1, y1), (x2, y2) = points[:2]
+        rows, cols = grid
+        return coordinates, [{'grid': {'x': min(x1, x2), 'y': min(y1, y2),
+                                       'width': abs(x2 - x1), 'height': abs(y2 - y1),
+                                       'rows': rows, 'cols': cols}}]
+    if len(points) > 1:
+        return coordinates, [{'points': [list(point) for point in points]}]
+    return coordinates, None
+
+
+def points_from_targets(coordinates, targets):
+    """Inverse of targets_from_points: (points, grid), or None if targets are not a single points or grid segment"""
+    if not targets:
+        return ([tuple(coordinates)] if coordinates is not None else []), None
+    if len(targets) != 1:
+        return None
+    segment = targets[0]
+    if 'points' in segment and 'weights' not in segment:
+        return [tuple(point) for point in segment['points']], None
+    if 'grid' in segment:
+        grid = segment['grid']
+        corners = [(grid['x'], grid['y']), (grid['x'] + grid['width'], grid['y'] + grid['height'])]
+        return corners, (grid['rows'], grid['cols'])
+    return None
+
+
+# What the scheduler thread reads on every tick. The front end edits a Clicker's
+# plain attributes and ClickEngine.apply_config publishes them as a new snapshot
+# with one attribute assignment, so a tick never sees a half-applied change.
+ClickerSnapshot = collections.namedtuple('ClickerSnapshot', [
+    'enabled', 'coordinates', 'targets', 'target_path', 'interval_ms', 'wait_mode',
+    'button', 'burst_count', 'burst_delay_ms', 'jitter', 'interval_jitter', 'position_jitter',
+])
+
+
+class Clicker:
+    """Engine-side clicker: target, interval and live counters, with no GUI state"""
+
+    def __init__(self, clicker_id, coordinates=None, interval_ms=DEFAULT_INTERVAL_MS, enabled=True,
+                 wait_mode=DEFAULT_WAIT_MODE, button=1, burst_count=1, burst_delay_ms=0):
+        self.clicker_id = clicker_id
+        self.coordinates = coordinates  # (x, y) tuple
+        self.interval_ms = interval_ms
+        self.is_enabled = enabled
+        self.wait_mode = wait_mode      # One of WAIT_MODES
+        self.button = button            # X11 button number, see MOUSE_BUTTONS
+        self.burst_count = burst_count  # Clicks per tick
+        self.burst_delay_ms = burst_delay_ms
+        self.targets = None             # Target segments for build_target_path, or None for coordinates
+        self._expanded = None           # (targets, TargetPath) last built by new_target_path
+
+        # Randomized timing and position; 0 turns each off
+        self.interval_jitter_ms = 0
+        self.position_jitter_px = 0
+        self.jitter_distribution = 'uniform'
+        self.jitter_seed = None         # None picks a fresh seed (logged) on every start
+
+        # Settings as last published to the scheduler thread (see ClickerSnapshot)
+        self.snapshot = None
+
+        # Live state written by the click thread
+        self.is_active = False
+        self.click_count = 0
+        self.tick_count = 0
+        self.next_click_time = 0
+        self.burst_left = 0             # Clicks still due in a spaced-out burst
+        self.burst_target = None        # (x, y) the burst in progress clicks at
+        self.tick_deadline = 0          # Deadline of the tick the burst belongs to
+        self.last_position_error = None  # Pixels, from the last verified click
+        self.metrics = ClickMetrics()
+
+    def new_target_path(self):
+        """A TargetPath at the start of targets, or None; raises ValueError for malformed targets"""
+        if not self.targets:
+            return None
+        # Shared while targets stay the same, so validating a config and starting the clicker build it once
+        if self._expanded is None or self._expanded[0] != self.targets:
+            self._expanded = (self.targets, build_target_path(self.targets))
+        path = self._expanded[1]
+        return TargetPath(path.xs, path.ys)
+    
+    def reset_counters(self):
+        """Zero the click counts and timing histograms"""
+        self.click_count = 0
+        self.tick_count = 0
+        self.last_position_error = None
+        self.metrics.reset()
+
+
+# Owns the input backend, the deadline scheduler and the replay thread. The Tk app and the
+# headless runner both drive it; it reports back only through plain attributes and the
+# optional on_error / on_replay_finished callbacks.
+class ClickEngine:
+    """Clicking and replay engine with no GUI dependency"""
+
+    def __init__(self, backend_name=None, summary_interval=LOG_SUMMARY_INTERVAL):
+        # Input backend is probed once, on first use, instead of on every failed click
+        self.backend_name = backend_name
+        self.input_backend = None
+        self.input_backend_probed = False
+        self.input_backend_lock = threading.Lock()
+
+        self.scheduler = ClickScheduler(self.fire_clicker, wait_mode_of=lambda clicker: clicker.snapshot.wait_mode)
+        self.global_active = False
+        self.active_clickers = {}  # clicker_id -> Clicker
+
+        # Fast path skips the position read-back except on every Nth click, counted
+        # across all clickers (fire_count) and across every pass of a replay
+        self.fast_path = True
+        self.verify_every = VERIFY_EVERY_N_CLICKS
+        self.fire_count = 0
+        self.replay_click_count = 0
+
+        # Replay state
+        self.replaying = False
+        self.replay_count = 0
+        self.max_replays = 1
+        self.replay_speed = 1.0         # None replays as fast as possible
+        self.replay_max_gap_ms = None   # Cap on any single pause, None keeps them all
+        self.replay_gap_ms = DEFAULT_REPLAY_GAP_MS
+        self.replay_recording = None
+        self.replay_held = set()        # Buttons a high-fidelity replay currently holds down
+        self.replay_stop = threading.Event()  # Wakes the replay thread out of any wait
+        self.replay_thread = None
+        self.replay_metrics = ClickMetrics()
+
+        # Periodic click-count summary that replaces per-click log lines at INFO
+        self.summary_interval = summary_interval
+        self.summary_thread = None
+        self.summary_stop = threading.Event()
+
+        self.on_error = None            # on_error(title, message), called from worker threads
+        self.on_replay_finished = None  # on_replay_finished(completed), called from the replay thread
+        
+        # Set whenever clickers stop or a replay ends, so callers can wait instead of polling
+        self.jobs_changed = threading.Event()
+
+    def report_error(self, title, message):
+        """Pass a worker error to the front end"""
+        if self.on_error is not None:
+            self.on_error(title, message)
+
+    def start_clickers(self, clickers):
+        """Schedule every clicker that is not already running"""
+        self.open_input_backend()
+        self.start_summary()
+        self.global_active = True
+        self.scheduler.start()
+        for clicker in clickers:
+            if not self.scheduler.is_scheduled(clicker.clicker_id):
+                clicker.snapshot = self.build_snapshot(clicker)
+                clicker.burst_left = 0
+                self.active_clickers[clicker.clicker_id] = clicker
+                clicker.is_active = True
+                self.scheduler.schedule(clicker.clicker_id, clicker)
+
+    def build_snapshot(self, clicker, previous=None):
+        """Freeze a clicker's settings into a ClickerSnapshot"""
+        # Unchanged targets and jitter carry over from previous, so an unrelated edit restarts
+        # neither the target cycle nor the seeded jitter sequence
+        targets = clicker.targets
+        if previous is not None and previous.targets == targets:
+            target_path = previous.target_path
+        else:
+            target_path = clicker.new_target_path()
+        
+        jitter = (clicker.interval_jitter_ms, clicker.position_jitter_px,
+                  clicker.jitter_distribution, clicker.jitter_seed)
+        if previous is not None and previous.jitter == jitter:
+            interval_jitter, position_jitter = previous.interval_jitter, previous.position_jitter
+        else:
+            interval_jitter, position_jitter = self._create_jitter(clicker)
+        
+        return ClickerSnapshot(clicker.is_enabled, clicker.coordinates, targets, target_path,
+                               clicker.interval_ms, clicker.wait_mode, clicker.button,
+                               clicker.burst_count, clicker.burst_delay_ms,
+                               jitter, interval_jitter, position_jitter)
+    
+    def apply_config(self, clicker):
+        """Publish a running clicker's edited settings to the scheduler without stopping it"""
+        previous = clicker.snapshot
+        if clicker.clicker_id not in self.active_clickers or previous is None:
+            return
+        snapshot = self.build_snapshot(clicker, previous)
+        clicker.snapshot = snapshot
+        # A new interval re-times the pending wait from the last click instead of after the old one
+        if (snapshot.interval_ms, snapshot.wait_mode) != (previous.interval_ms, previous.wait_mode):
+            self.scheduler.reschedule(clicker.clicker_id, snapshot.interval_ms / 1000.0)
+    
+    def _create_jitter(self, clicker):
+        """Create the clicker's jitter streams, seeded so a run can be repeated exactly"""
+        if not (clicker.interval_jitter_ms or clicker.position_jitter_px):
+            return None, None
+        seed = clicker.jitter_seed
+        if seed is None:
+            seed = random.SystemRandom().randrange(1 << 32)
+        log.info("🎲 Clicker %s: %s jitter, seed %s", clicker.clicker_id, clicker.jitter_distribution, seed)
+        interval_jitter = position_jitter = None
+        if clicker.interval_jitter_ms:
+            interval_jitter = JitterSource(clicker.jitter_distribution, clicker.interval_jitter_ms,
+                                           f"{seed}:{clicker.clicker_id}:interval")
+        if clicker.position_jitter_px:
+            position_jitter = JitterSource(clicker.jitter_distribution, clicker.position_jitter_px,
+                                           f"{seed}:{clicker.clicker_id}:position")
+        return interval_jitter, position_jitter
+
+    def stop_clickers(self):
+        """Stop every running clicker; safe to call from any thread"""
+        self.global_active = False
+        self.scheduler.unschedule_all()
+        for clicker in list(self.active_clickers.values()):
+            clicker.is_active = False
+        self.active_clickers.clear()
+        self.jobs_changed.set()
+
+    def stop_clicker(self, clicker):
+        """Stop one running clicker and drop its pending deadline; safe to call from any thread"""
+        self.scheduler.unschedule(clicker.clicker_id)
+        if self.active_clickers.get(clicker.clicker_id) is clicker:
+            self._finish_clicker(clicker)
+
+    def set_enabled(self, clicker, enabled):
+        """Enable or disable one clicker at once; a re-enabled one starts right away while clicking is on"""
+        clicker.is_enabled = enabled
+        if not enabled:
+            self.stop_clicker(clicker)
+        elif self.global_active:
+            self.start_clickers([clicker])
+
+    def fire_clicker(self, clicker, deadline):
+        """Click once for a clicker on the scheduler thread; returns seconds to the next click, or None to stop"""
+        clicker.metrics.lateness.record(time.perf_counter_ns() - int(deadline * 1e9))
+        config = clicker.snapshot  # Read once: a hot reload swaps it between ticks, never during one
+        if not (self.global_active and config.enabled):
+            self._finish_clicker(clicker)
+            return None
+        
+        # A burst with a delay clicks once per scheduler deadline, so a stop or
+        # another clicker's deadline never waits for the whole burst
+        spaced = config.burst_count > 1 and config.burst_delay_ms > 0
+        clicks = 1 if spaced else config.burst_count
+        
+        try:
+            if clicker.burst_left:
+                target_x, target_y = clicker.burst_target
+            else:
+                path = config.target_path
+                if path is not None:
+                    target_x, target_y = path.next_point()
+                elif config.coordinates is None:
+                    log.warning("⚠️  Clicker %s: No coordinates set, skipping...", clicker.clicker_id)
+                    self._finish_clicker(clicker)
+                    return None
+                else:
+                    target_x, target_y = config.coordinates
+                jitter = config.position_jitter
+                if jitter is not None:
+                    target_x += round(jitter.next())
+                    target_y += round(jitter.next())
+                clicker.tick_deadline = deadline
+                clicker.tick_count += 1
+                if spaced:
+                    clicker.burst_left = config.burst_count
+                    clicker.burst_target = (target_x, target_y)
+            log.debug("🖱️  Clicking at coordinates: (%d, %d)", target_x, target_y)
+            
+            # Move mouse to target position and click with improved multi-monitor handling
+            try:
+                backend = self.require_input_backend()
+                
+                verify = not self.fast_path or self.fire_count % self.verify_every == 0
+                self.fire_count += 1
+                pos_diff = self.perform_click(backend, target_x, target_y, verify, clicker.metrics,
+                                              config.button, clicks)
+                if pos_diff is not None:
+                    clicker.last_position_error = pos_diff
+                
+            except Exception as click_error:
+                log.warning("⚠️  Click failed: %s", click_error)
+                # Switch to the next working backend once and retry this click there
+                clicker.metrics.fallbacks += 1
+                backend = self.switch_input_backend()
+                try:
+                    if backend is None:
+                        raise RuntimeError("no working input backend")
+                    backend.move_and_click_batch([(target_x, target_y)], config.button, clicks)
+                except Exception as fallback_error:
+                    log.error("❌ Fallback click failed: %s", fallback_error)
+                    self.report_error(
+                        "Click Error", 
+                        "Cannot click outside app window.\n\n"
+                        "Linux Solutions:\n"
+                        "1. Install xdotool: sudo apt install xdotool\n"
+                        "2. Add user to input group: sudo usermod -a -G input $USER\n"
+                        "3. Run with sudo (not recommended)\n"
+                        "4. Switch from Wayland to X11 if using Wayland")
+                    self._finish_clicker(clicker)
+                    return None
+            
+            # Update click count
+            clicker.click_count += clicks
+            if clicker.burst_left:
+                clicker.burst_left -= 1
+                if clicker.burst_left:
+                    return config.burst_delay_ms / 1000.0
+            
+            # Next tick is measured from this tick's deadline, not from now or the burst's last click
+            interval_ms = config.interval_ms
+            if config.interval_jitter is not None:
+                interval_ms = max(MIN_INTERVAL_MS, interval_ms + config.interval_jitter.next())
+            interval = interval_ms / 1000.0
+            next_tick = clicker.tick_deadline + interval
+            now = self.scheduler.clock()
+            if next_tick < now:
+                # A burst longer than the interval: skip the ticks it overran, staying on the grid
+                next_tick += ((now - next_tick) // interval + 1) * interval
+            clicker.next_click_time = next_tick
+            return next_tick - deadline
+            
+        except Exception as e:
+            log.error("❌ Error in clicker %s: %s", clicker.clicker_id, e)
+            self.report_error(
+                "Clicker Error", 
+                f"Clicker {clicker.clicker_id} encountered an error:\n{e}\n\n"
+                "This may be due to Linux security restrictions.")
+            self._finish_clicker(clicker)
+            return None
 
-# Modern Dark Theme Colors (CustomTkinter Style)
-COLORS = {
-    'bg_main': '#212121',           # Dark gray main background
-    'bg_section': '#2b2b2b',        # Slightly lighter gray for sections
-    'bg_section_disabled': '#1a1a1a',  # Darker gray for disabled
-    'accent_blue': '#1f538d',       # Primary blue accent
-    'accent_blue_hover': '#14375e',  # Darker blue for hover
-    'accent_blue_light': '#3d7bb8', # Lighter blue
-    'text_primary': '#ffffff',      # White text
-    'text_secondary': '#b0b0b0',    # Light gray text
-    'text_disabled': '#707070',     # Darker gray for disabled
-    'button_bg': '#1f538d',         # Blue button background
-    'button_hover': '#14375e',      # Darker blue hover
-    'button_disabled': '#404040',   # Dark gray for disabled buttons
-    'entry_bg': '#404040',          # Dark gray for entry fields
-    'entry_disabled': '#2a2a2a',    # Darker for disabled entries
-    'border_color': '#404040'       # Border color
-}
+    def _finish_clicker(self, clicker):
+        """Clean up after a clicker leaves the schedule"""
+        self.active_clickers.pop(clicker.clicker_id, None)
+        clicker.is_active = False
+        self.jobs_changed.set()
+
+    def perform_click(self, backend, x, y, verify, metrics, button=1, count=1):
+        """Move and click count times at (x, y); returns the position error in pixels for verified clicks"""
+        # The fast path hands the move and the whole burst to the backend as one call
+        if not verify:
+            start = time.perf_counter_ns()
+            backend.move_and_click_batch([(x, y)], button, count)
+            metrics.move_click.record(time.perf_counter_ns() - start)
+            return None
+        
+        # First, try to set position and verify it worked
+        start = time.perf_counter_ns()
+        backend.move(x, y)
+        metrics.move.record(time.perf_counter_ns() - start)
+        
+        # Verify the position was set correctly; move() returns once the server has applied it,
+        # so it needs no settle sleep, which would stall every clicker sharing the scheduler thread
+        actual_pos = backend.position()
+        log.debug("🎯 Target: (%d, %d), Actual: %s", x, y, actual_pos)
+        
+        # If position is significantly off, try alternative approach
+        pos_diff = abs(actual_pos[0] - x) + abs(actual_pos[1] - y)
+        if pos_diff > MAX_POSITION_ERROR:
+            log.debug("⚠️  Position offset detected: %d pixels", pos_diff)
+            # Try setting position again
+            backend.move(x, y)
+        metrics.position_error.record(pos_diff)
+        
+        # Perform the click
+        start = time.perf_counter_ns()
+        backend.click(button, count)
+        metrics.click.record(time.perf_counter_ns() - start)
+        return pos_diff
+
+    def open_input_backend(self):
+        """Probe for a working input backend the first time one is needed"""
+        with self.input_backend_lock:
+            if not self.input_backend_probed:
+                self.input_backend = select_input_backend(self.backend_name)
+                self.input_backend_probed = True
+            return self.input_backend
+
+    def require_input_backend(self):
+        """Return the cached input backend, raising if none could be opened"""
+        backend = self.input_backend or self.open_input_backend()
+        if backend is None:
+            raise RuntimeError("No working input backend (pynput, XTest or xdotool)")
+        return backend
+
+    def switch_input_backend(self):
+        """Replace a backend that failed at runtime with the next working one"""
+        with self.input_backend_lock:
+            failed = self.input_backend
+            exclude = (failed.name,) if failed is not None else ()
+            self.input_backend = select_input_backend(exclude=exclude)
+            if failed is not None:
+                failed.close()
+            return self.input_backend
+
+    def start_replay(self, recording, max_replays, speed=1.0, max_gap_ms=None, gap_ms=DEFAULT_REPLAY_GAP_MS):
+        """Replay a recording max_replays times on a background thread; speed None replays as fast as possible"""
+        self.open_input_backend()
+        self.start_summary()
+        self.replay_recording = recording
+        self.max_replays = max_replays
+        self.replay_speed = speed
+        self.replay_max_gap_ms = max_gap_ms
+        self.replay_gap_ms = gap_ms
+        self.replay_count = 0
+        self.replay_click_count = 0
+        self.replay_stop.clear()
+        self.replaying = True
+        self.replay_thread = threading.Thread(target=self.replay_worker, name="Replay", daemon=True)
+        self.replay_thread.start()
+
+    def stop_replay(self, timeout=WORKER_JOIN_TIMEOUT):
+        """Stop the replay and wait for its thread to finish the click in flight"""
+        self.replaying = False
+        self.replay_stop.set()
+        thread = self.replay_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            if thread.is_alive():
+                log.warning("⚠️  Replay thread still busy after %.1fs", timeout)
+            else:
+                self.replay_thread = None
+
+    def replay_worker(self):
+        """Worker thread for replaying clicks"""
+        # Pass k starts at origin + k * (length + gap), so sleep overshoot in one pass
+        # is never carried into the next
+        recording = self.replay_recording
+        gap_ns = self.replay_gap_ms * 1000000
+        origin = time.monotonic_ns()
+        pass_start = pass_end = origin
+        try:
+            for replay_num in range(self.max_replays):
+                if self.replay_stop.is_set():
+                    break
+                
+                self.replay_count = replay_num + 1
+                
+                if self.replay_speed is None:
+                    self._replay_unthrottled(recording)
+                    pass_end = time.monotonic_ns()
+                else:
+                    pass_end = pass_start + self._replay_timed(recording, pass_start)
+                
+                # Pause between replays, counted from where the pass was due to end
+                if not self.replay_stop.is_set() and replay_num < self.max_replays - 1:
+                    pass_start = pass_end + gap_ns
+                    remaining = pass_start - time.monotonic_ns()
+                    if remaining > 0 and self.replay_stop.wait(remaining / 1e9):
+                        break
+            
+            # Replay completed
+            if not self.replay_stop.is_set():
+                if self.replay_speed is not None:
+                    log.info("✅ Replay: %d passes in %.3f s, %.3f ms behind schedule", self.replay_count,
+                             (time.monotonic_ns() - origin) / 1e9, (time.monotonic_ns() - pass_end) / 1e6)
+                self.replaying = False
+                if self.on_replay_finished is not None:
+                    self.on_replay_finished(True)
+                
+        except Exception as e:
+            log.error("❌ Replay error: %s", e)
+            self.replaying = False
+            if self.on_replay_finished is not None:
+                self.on_replay_finished(False)
+        finally:
+            # A replay stopped mid-drag must not leave a button held down
+            for button in list(self.replay_held):
+                try:
+                    self.require_input_backend().release(button)
+                except Exception as e:
+                    log.warning("⚠️  Could not release button %d after replay: %s", button, e)
+            self.replay_held.clear()
+            self.jobs_changed.set()
+    
+    def _replay_timed(self, recording, start_ns):
+        """Replay one pass on the recorded timing from monotonic start_ns; returns the pass length in ns"""
+        offset_ns = 0
+        
+        # Read straight from the recording's arrays or file mapping without copying
+        schedule = replay_schedule(recording, self.replay_speed, self.replay_max_gap_ms)
+        for i, (x, y, offset, kind, detail) in enumerate(schedule):
+            if self.replay_stop.is_set():
+                break
+            
+            # Wait for the (retimed) original delay; a stop wakes the wait at once
+            offset_ns = int(offset * 1e9)
+            due = start_ns + offset_ns
+            remaining = due - time.monotonic_ns()
+            if remaining > 0 and self.replay_stop.wait(remaining / 1e9):
+                break
+            self.replay_metrics.lateness.record(time.monotonic_ns() - due)
+            
+            # Perform click
+            try:
+                backend = self.require_input_backend()
+                if kind == EVENT_CLICK:
+                    verify = not self.fast_path or self.replay_click_count % self.verify_every == 0
+                    self.replay_click_count += 1
+                    self.perform_click(backend, x, y, verify, self.replay_metrics, detail)
+                else:
+                    self._send_input(backend, x, y, kind, detail)
+                log.debug("🔄 Replay %d: %s %d at (%d, %d)", self.replay_count, EVENT_NAMES[kind], i + 1, x, y)
+            except Exception as e:
+                self._replay_fallback(e, [(x, y, kind, detail)], i)
+        return offset_ns
+    
+    def _replay_unthrottled(self, recording):
+        """Replay one pass as fast as the backend accepts events, REPLAY_BATCH at a time, unverified"""
+        backend = self.require_input_backend()
+        events = iter(recording)
+        index = 0
+        while not self.replay_stop.is_set():
+            batch = [(x, y, kind, detail) for x, y, _, kind, detail in itertools.islice(events, REPLAY_BATCH)]
+            if not batch:
+                break
+            try:
+                start = time.perf_counter_ns()
+                self._send_events(backend, batch)
+                self.replay_metrics.move_click.record((time.perf_counter_ns() - start) // len(batch))
+                log.debug("🔄 Replay %d: Events %d-%d", self.replay_count, index + 1, index + len(batch))
+            except Exception as e:
+                backend = self._replay_fallback(e, batch, index)
+            index += len(batch)
+    
+    def _send_input(self, backend, x, y, kind, detail):
+        """Replay one event other than a click: move there, then press, release or scroll"""
+        start = time.perf_counter_ns()
+        backend.move(x, y)
+        if kind == EVENT_PRESS:
+            backend.press(detail)
+            self.replay_held.add(detail)
+        elif kind == EVENT_RELEASE:
+            backend.release(detail)
+            self.replay_held.discard(detail)
+        elif kind == EVENT_SCROLL:
+            backend.scroll(0, detail)
+        elif kind == EVENT_HSCROLL:
+            backend.scroll(detail, 0)
+        histogram = self.replay_metrics.move if kind == EVENT_MOVE else self.replay_metrics.move_click
+        histogram.record(time.perf_counter_ns() - start)
+    
+    def _send_events(self, backend, events):
+        """Replay (x, y, kind, detail) events; each run of clicks goes to the backend as one batch"""
+        run = []
+        button = None
+        for x, y, kind, detail in events:
+            if kind == EVENT_CLICK and detail == button:
+                run.append((x, y))
+                continue
+            if run:
+                backend.move_and_click_batch(run, button)
+            if kind == EVENT_CLICK:
+                run = [(x, y)]
+                button = detail
+            else:
+                run = []
+                button = None
+                self._send_input(backend, x, y, kind, detail)
+        if run:
+            backend.move_and_click_batch(run, button)
+    
+    def _replay_fallback(self, error, events, index):
+        """Resend (x, y, kind, detail) events on the next working backend; raises RuntimeError if none is left"""
+        log.warning("❌ Replay click failed: %s", error)
+        self.replay_metrics.fallbacks += 1
+        backend = self.switch_input_backend()
+        if backend is None:
+            raise RuntimeError("no working input backend left")
+        try:
+            self._send_events(backend, events)
+            log.debug("✅ Replay %d: Event %d at %s via %s", self.replay_count, index + 1, events[0][:2], backend.name)
+        except Exception as fallback_error:
+            log.error("❌ %s fallback failed for replay click %d: %s", backend.name, index + 1, fallback_error)
+        return backend
+    
+    def start_summary(self):
+        """Start the summary thread unless it is running, disabled, or INFO is filtered out"""
+        if not self.summary_interval or not log.isEnabledFor(logging.INFO):
+            return
+        if self.summary_thread is None or not self.summary_thread.is_alive():
+            self.summary_stop.clear()
+            self.summary_thread = threading.Thread(target=self.summary_worker, name="LogSummary", daemon=True)
+            self.summary_thread.start()
+
+    def summary_worker(self):
+        """Log how many clicks happened each interval; silent while nothing is clicking"""
+        last_counts = {}
+        last_replay = self.replay_metrics.lateness.count
+        while not self.summary_stop.wait(self.summary_interval):
+            parts = []
+            for clicker in list(self.active_clickers.values()):
+                count = clicker.click_count
+                delta = count - last_counts.get(clicker.clicker_id, 0)
+                last_counts[clicker.clicker_id] = count
+                if delta:
+                    parts.append(f"Clicker {clicker.clicker_id} +{delta} ({count} total)")
+            replay_clicks = self.replay_metrics.lateness.count
+            if replay_clicks != last_replay:
+                parts.append(f"Replay {self.replay_count} +{replay_clicks - last_replay}")
+                last_replay = replay_clicks
+            if parts:
+                log.info("📊 Last %gs: %s", self.summary_interval, ", ".join(parts))
+
+    def close(self):
+        """Stop all work, join every worker thread and release the input backend"""
+        self.stop_clickers()
+        self.stop_replay()
+        self.summary_stop.set()
+        if self.summary_thread is not None:
+            self.summary_thread.join(WORKER_JOIN_TIMEOUT)
+        self.scheduler.stop()
+        if self.input_backend is not None:
+            self.input_backend.close()
 
 
 class ClickerSection:
-    """Individual clicker section with its own configuration and controls"""
+    """One row of the clicker list: configuration widgets for whichever Clicker is bound to it"""
     
-    def __init__(self, parent, section_id, on_config_change):
-        self.section_id = section_id
+    def __init__(self, parent, on_config_change):
         self.on_config_change = on_config_change
+        self.clicker = None  # The model every edit goes to; the section keeps no settings of its own
+        self._loading = False  # Set while show() fills the variables, so the traces don't write back
         self.enabled = tk.BooleanVar()
         self.enabled.trace_add('write', self._on_enabled_change)
         
-        # Time variables
+        # Time variables; typed fields reach the model on Enter or focus-out (commit_input)
         self.minutes = tk.StringVar(value="0")
         self.seconds = tk.StringVar(value="1")
         self.milliseconds = tk.StringVar(value="0")
         
-        # Coordinate variables
-        self.coordinates = None  # (x, y) tuple
+        # Burst variables
+        self.burst_count = tk.StringVar(value="1")
+        self.burst_delay = tk.StringVar(value="0")
+        self.button_var = tk.StringVar(value="Left")
+        self.button_var.trace_add('write', self._on_button_change)
+        
+        # Jitter variables; an empty seed draws a fresh one each start
+        self.interval_jitter = tk.StringVar(value="0")
+        self.position_jitter = tk.StringVar(value="0")
+        self.jitter_distribution = tk.StringVar(value=JITTER_DISTRIBUTIONS[0].title())
+        self.jitter_seed = tk.StringVar(value="")
+        self.jitter_distribution.trace_add('write', self._on_distribution_change)
+        
+        # Coordinate variables; with more than one point the clicker walks them in order
+        self.points = []
         self.coordinates_text = tk.StringVar(value="No coordinates set")
+        self.grid_var = tk.StringVar(value="")  # "ROWSxCOLS" spanning the first two points
+        self._shown_grid = ""  # Grid text the targets were last built from
         
-        # Status tracking
-        self.is_active = False
-        self.click_count = 0
-        self.next_click_time = 0
+        self._shown_status = None  # (enabled, active, count) last drawn by refresh_status
         
         self._create_widgets(parent)
+    
+    @property
+    def section_id(self):
+        """Id of the bound clicker, shown as its number"""
+        return self.clicker.clicker_id if self.clicker is not None else None
+    
+    def show(self, clicker):
+        """Show clicker in this section; edits from now on change its model"""
+        self.commit_input()  # Typed edits still belong to the clicker shown until now
+        self.clicker = clicker
+        self._loading = True
+        try:
+            self.title_label.config(text=f"Clicker {clicker.clicker_id}")
+            self.enabled.set(clicker.is_enabled)
+            
+            self._show_interval()
+            self.wait_mode_var.set(WAIT_MODE_LABELS[clicker.wait_mode])
+            
+            self.burst_count.set(str(clicker.burst_count))
+            self.burst_delay.set(str(clicker.burst_delay_ms))
+            button_names = {number: name for name, number in MOUSE_BUTTONS.items()}
+            self.button_var.set(button_names.get(clicker.button, 'left').title())
+            
+            self.interval_jitter.set(f"{clicker.interval_jitter_ms:g}")
+            self.position_jitter.set(f"{clicker.position_jitter_px:g}")
+            self.jitter_distribution.set(clicker.jitter_distribution.title())
+            self.jitter_seed.set("" if clicker.jitter_seed is None else str(clicker.jitter_seed))
+            
+            # Targets a config file wrote by hand may have no picked-points form; they stay as they are
+            editable = points_from_targets(clicker.coordinates, clicker.targets)
+            self.points, grid = editable if editable is not None else ([], None)
+            self.grid_var.set(f"{grid[0]}x{grid[1]}" if grid else "")
+            self._shown_grid = self.grid_var.get()
+            self._show_targets()
+        finally:
+            self._loading = False
         
+        self._update_visual_state()
+        self._render_status()
+    
     def _create_widgets(self, parent):
         """Create the GUI widgets for this clicker section"""
-        # Main frame for this section with compact modern styling
+        # Main frame for this section with compact modern styling; ClickerListView packs it
         self.frame = tk.Frame(parent, bg=COLORS['bg_section'], relief='flat', bd=1)
-        self.frame.pack(fill="x", pady=3, padx=10, ipady=8, ipadx=10)
         
         # Title and checkbox in same row for compactness
         top_frame = tk.Frame(self.frame, bg=COLORS['bg_section'])
         top_frame.pack(fill="x", pady=(0, 8))
         
-        title_label = tk.Label(top_frame, text=f"Clicker {self.section_id}", 
-                              font=("Segoe UI", 11, "bold"), 
-                              fg=COLORS['text_primary'], 
-                              bg=COLORS['bg_section'])
-        title_label.pack(side="left")
+        self.title_label = tk.Label(top_frame, text="Clicker", 
+                                   font=("Segoe UI", 11, "bold"), 
+                                   fg=COLORS['text_primary'], 
+                                   bg=COLORS['bg_section'])
+        self.title_label.pack(side="left")
+        
+        self.remove_btn = tk.Button(top_frame, text="Remove",
+                                   command=self.remove_clicker,
+                                   font=("Segoe UI", 8),
+                                   bg=COLORS['button_disabled'],
+                                   fg=COLORS['text_primary'],
+                                   relief='flat',
+                                   bd=0,
+                                   padx=8,
+                                   pady=2,
+                                   cursor='hand2')
+        self.remove_btn.pack(side="right", padx=(8, 0))
         
         self.enable_cb = tk.Checkbutton(
             top_frame, 
@@ -156,6 +2325,152 @@ class ClickerSection:
                                 justify='center')
         self.ms_entry.pack()
         
+        # Wait mode: how precisely the scheduler hits this clicker's deadlines
+        mode_frame = tk.Frame(time_frame, bg=COLORS['bg_section'])
+        mode_frame.pack(side="right")
+        
+        self.mode_label = tk.Label(mode_frame, text="Timing:", 
+                                  font=("Segoe UI", 8),
+                                  fg=COLORS['text_secondary'], 
+                                  bg=COLORS['bg_section'])
+        self.mode_label.pack()
+        
+        self.wait_mode_var = tk.StringVar(value=WAIT_MODE_LABELS[DEFAULT_WAIT_MODE])
+        self.wait_mode_var.trace_add('write', self._on_wait_mode_change)
+        self.wait_mode_box = ttk.Combobox(mode_frame, textvariable=self.wait_mode_var,
+                                         values=[WAIT_MODE_LABELS[mode] for mode in WAIT_MODES],
+                                         width=10, state='readonly',
+                                         font=("Segoe UI", 8))
+        self.wait_mode_box.pack()
+        
+        # Burst: clicks per tick, spacing between them, and which button
+        burst_frame = tk.Frame(self.frame, bg=COLORS['bg_section'])
+        burst_frame.pack(fill="x", pady=(0, 8))
+        
+        self.burst_label = tk.Label(burst_frame, text="Clicks per tick:", 
+                                   font=("Segoe UI", 8),
+                                   fg=COLORS['text_secondary'], 
+                                   bg=COLORS['bg_section'])
+        self.burst_label.pack(side="left")
+        
+        self.burst_entry = tk.Entry(burst_frame, textvariable=self.burst_count, width=5,
+                                   font=("Segoe UI", 9), 
+                                   relief='flat', bd=0,
+                                   bg=COLORS['entry_bg'],
+                                   fg=COLORS['text_primary'],
+                                   insertbackground=COLORS['text_primary'],
+                                   highlightthickness=1,
+                                   highlightcolor=COLORS['accent_blue'],
+                                   justify='center')
+        self.burst_entry.pack(side="left", padx=(4, 12))
+        
+        self.burst_delay_label = tk.Label(burst_frame, text="Delay ms:", 
+                                         font=("Segoe UI", 8),
+                                         fg=COLORS['text_secondary'], 
+                                         bg=COLORS['bg_section'])
+        self.burst_delay_label.pack(side="left")
+        
+        self.burst_delay_entry = tk.Entry(burst_frame, textvariable=self.burst_delay, width=5,
+                                         font=("Segoe UI", 9), 
+                                         relief='flat', bd=0,
+                                         bg=COLORS['entry_bg'],
+                                         fg=COLORS['text_primary'],
+                                         insertbackground=COLORS['text_primary'],
+                                         highlightthickness=1,
+                                         highlightcolor=COLORS['accent_blue'],
+                                         justify='center')
+        self.burst_delay_entry.pack(side="left", padx=(4, 12))
+        
+        self.button_label = tk.Label(burst_frame, text="Button:", 
+                                    font=("Segoe UI", 8),
+                                    fg=COLORS['text_secondary'], 
+                                    bg=COLORS['bg_section'])
+        self.button_label.pack(side="left")
+        
+        self.button_box = ttk.Combobox(burst_frame, textvariable=self.button_var,
+                                      values=[name.title() for name in MOUSE_BUTTONS],
+                                      width=7, state='readonly',
+                                      font=("Segoe UI", 8))
+        self.button_box.pack(side="left", padx=(4, 0))
+        
+        self.grid_entry = tk.Entry(burst_frame, textvariable=self.grid_var, width=7,
+                                  font=("Segoe UI", 9), 
+                                  relief='flat', bd=0,
+                                  bg=COLORS['entry_bg'],
+                                  fg=COLORS['text_primary'],
+                                  insertbackground=COLORS['text_primary'],
+                                  highlightthickness=1,
+                                  highlightcolor=COLORS['accent_blue'],
+                                  justify='center')
+        self.grid_entry.pack(side="right")
+        
+        self.grid_label = tk.Label(burst_frame, text="Grid (e.g. 20x20):", 
+                                  font=("Segoe UI", 8),
+                                  fg=COLORS['text_secondary'], 
+                                  bg=COLORS['bg_section'])
+        self.grid_label.pack(side="right", padx=(0, 4))
+        
+        # Jitter: random spread on the interval and the click position
+        jitter_frame = tk.Frame(self.frame, bg=COLORS['bg_section'])
+        jitter_frame.pack(fill="x", pady=(0, 8))
+        
+        self.interval_jitter_label = tk.Label(jitter_frame, text="Jitter ±ms:", 
+                                             font=("Segoe UI", 8),
+                                             fg=COLORS['text_secondary'], 
+                                             bg=COLORS['bg_section'])
+        self.interval_jitter_label.pack(side="left")
+        
+        self.interval_jitter_entry = tk.Entry(jitter_frame, textvariable=self.interval_jitter, width=5,
+                                             font=("Segoe UI", 9), 
+                                             relief='flat', bd=0,
+                                             bg=COLORS['entry_bg'],
+                                             fg=COLORS['text_primary'],
+                                             insertbackground=COLORS['text_primary'],
+                                             highlightthickness=1,
+                                             highlightcolor=COLORS['accent_blue'],
+                                             justify='center')
+        self.interval_jitter_entry.pack(side="left", padx=(4, 12))
+        
+        self.position_jitter_label = tk.Label(jitter_frame, text="±px:", 
+                                             font=("Segoe UI", 8),
+                                             fg=COLORS['text_secondary'], 
+                                             bg=COLORS['bg_section'])
+        self.position_jitter_label.pack(side="left")
+        
+        self.position_jitter_entry = tk.Entry(jitter_frame, textvariable=self.position_jitter, width=4,
+                                             font=("Segoe UI", 9), 
+                                             relief='flat', bd=0,
+                                             bg=COLORS['entry_bg'],
+                                             fg=COLORS['text_primary'],
+                                             insertbackground=COLORS['text_primary'],
+                                             highlightthickness=1,
+                                             highlightcolor=COLORS['accent_blue'],
+                                             justify='center')
+        self.position_jitter_entry.pack(side="left", padx=(4, 12))
+        
+        self.distribution_box = ttk.Combobox(jitter_frame, textvariable=self.jitter_distribution,
+                                            values=[name.title() for name in JITTER_DISTRIBUTIONS],
+                                            width=9, state='readonly',
+                                            font=("Segoe UI", 8))
+        self.distribution_box.pack(side="left")
+        
+        self.seed_entry = tk.Entry(jitter_frame, textvariable=self.jitter_seed, width=10,
+                                  font=("Segoe UI", 9), 
+                                  relief='flat', bd=0,
+                                  bg=COLORS['entry_bg'],
+                                  fg=COLORS['text_primary'],
+                                  insertbackground=COLORS['text_primary'],
+                                  highlightthickness=1,
+                                  highlightcolor=COLORS['accent_blue'],
+                                  justify='center')
+        self.seed_entry.pack(side="right")
+        
+        self.seed_label = tk.Label(jitter_frame, text="Seed:", 
+                                  font=("Segoe UI", 8),
+                                  fg=COLORS['text_secondary'], 
+                                  bg=COLORS['bg_section'])
+        self.seed_label.pack(side="right", padx=(0, 4))
+        
         # Coordinate selection frame
         coord_frame = tk.Frame(self.frame, bg=COLORS['bg_section'])
         coord_frame.pack(fill="x", pady=(8, 8))
@@ -184,6 +2499,19 @@ class ClickerSection:
                                          cursor='hand2')
         self.choose_coord_btn.pack(side="right", padx=(0, 5))
         
+        # Add another target point; the clicker then cycles through all of them
+        self.add_point_btn = tk.Button(coord_frame, text="Add Point",
+                                      command=self.add_point_coordinates,
+                                      font=("Segoe UI", 8),
+                                      bg=COLORS['accent_blue_light'],
+                                      fg=COLORS['text_primary'],
+                                      relief='flat',
+                                      bd=0,
+                                      padx=8,
+                                      pady=4,
+                                      cursor='hand2')
+        self.add_point_btn.pack(side="right", padx=(0, 5))
+        
         # Test coordinates button
         self.test_coord_btn = tk.Button(coord_frame, text="Test",
                                        command=self.test_coordinates,
@@ -228,22 +2556,26 @@ class ClickerSection:
         
         # Store all widgets for easy state management
         self.widgets = [
-            self.frame, title_label, self.enable_cb, 
+            self.frame, self.title_label, self.remove_btn, self.enable_cb, 
             self.min_label, self.min_entry,
             self.sec_label, self.sec_entry, 
             self.ms_label, self.ms_entry,
-            coord_label, self.coord_display, self.choose_coord_btn, self.test_coord_btn, self.reset_btn,
+            self.mode_label, self.wait_mode_box,
+            self.burst_label, self.burst_entry, self.burst_delay_label, self.burst_delay_entry,
+            self.button_label, self.button_box, self.grid_label, self.grid_entry,
+            self.interval_jitter_label, self.interval_jitter_entry,
+            self.position_jitter_label, self.position_jitter_entry,
+            self.distribution_box, self.seed_label, self.seed_entry,
+            coord_label, self.coord_display, self.choose_coord_btn, self.add_point_btn, self.test_coord_btn, self.reset_btn,
             self.status_label, self.count_label
         ]
         
-        # Bind validation to entry fields
-        for entry in [self.min_entry, self.sec_entry, self.ms_entry]:
-            entry.bind('<KeyRelease>', self._validate_input)
-            entry.bind('<FocusOut>', self._validate_input)
+        # Typed fields are applied once the edit is finished, never half-typed on every keystroke
+        for entry in [self.min_entry, self.sec_entry, self.ms_entry, self.burst_entry, self.burst_delay_entry,
+                      self.grid_entry, self.interval_jitter_entry, self.position_jitter_entry, self.seed_entry]:
+            entry.bind('<Return>', self.commit_input)
+            entry.bind('<FocusOut>', self.commit_input)
         
-        # Initialize disabled state
-        self._update_visual_state()
-    
     def _update_visual_state(self):
         """Update visual appearance based on enabled/disabled state"""
         if self.enabled.get():
@@ -280,12 +2612,17 @@ class ClickerSection:
                             grandchild.config(bg=bg_color, fg=text_secondary)
         
         # Update entry fields
-        for entry in [self.min_entry, self.sec_entry, self.ms_entry]:
+        for entry in [self.min_entry, self.sec_entry, self.ms_entry, self.burst_entry, self.burst_delay_entry,
+                      self.grid_entry, self.interval_jitter_entry, self.position_jitter_entry, self.seed_entry]:
             entry.config(state=entry_state, bg=entry_bg, 
                         disabledbackground=entry_bg, 
                         disabledforeground=text_color,
                         fg=text_color)
         
+        self.wait_mode_box.config(state='readonly' if self.enabled.get() else 'disabled')
+        self.button_box.config(state='readonly' if self.enabled.get() else 'disabled')
+        self.distribution_box.config(state='readonly' if self.enabled.get() else 'disabled')
+        
         # Update checkbox
         self.enable_cb.config(bg=bg_color, activebackground=bg_color, fg=text_color)
         
@@ -293,14 +2630,17 @@ class ClickerSection:
         if self.enabled.get():
             self.choose_coord_btn.config(state='normal', bg=COLORS['accent_blue'])
             # Test button enabled only if coordinates are set
-            if self.coordinates is not None:
+            if self.clicker is not None and self.clicker.coordinates is not None:
                 self.test_coord_btn.config(state='normal', bg=COLORS['accent_blue_light'])
+                self.add_point_btn.config(state='normal', bg=COLORS['accent_blue_light'])
                 self.reset_btn.config(state='normal', bg=COLORS['button_disabled'])
             else:
                 self.test_coord_btn.config(state='disabled', bg=COLORS['button_disabled'])
+                self.add_point_btn.config(state='disabled', bg=COLORS['button_disabled'])
                 self.reset_btn.config(state='disabled', bg=COLORS['button_disabled'])
         else:
             self.choose_coord_btn.config(state='disabled', bg=COLORS['button_disabled'])
+            self.add_point_btn.config(state='disabled', bg=COLORS['button_disabled'])
             self.test_coord_btn.config(state='disabled', bg=COLORS['button_disabled'])
             self.reset_btn.config(state='disabled', bg=COLORS['button_disabled'])
         
@@ -311,43 +2651,96 @@ class ClickerSection:
     
     def _on_enabled_change(self, *args):
         """Handle enable/disable state changes"""
+        if self._loading:
+            return
+        # Not a live edit: a disabled clicker leaves the schedule now, not at its next deadline
+        if hasattr(self, 'parent_app') and self.parent_app:
+            self.parent_app.set_clicker_enabled(self.clicker, self.enabled.get())
+        else:
+            self.clicker.is_enabled = self.enabled.get()
         self._update_visual_state()
-        
-        if self.enabled.get():
-            self.status_label.config(text="Status: Enabled (Waiting for hotkey)")
+        self._render_status()
+    
+    def _on_button_change(self, *args):
+        """Copy the button choice into the model"""
+        if self._loading:
+            return
+        self.clicker.button = MOUSE_BUTTONS.get(self.button_var.get().lower(), 1)
+        self.on_config_change(self.clicker)
+    
+    def _on_distribution_change(self, *args):
+        """Copy the jitter distribution into the model; a change restarts the jitter streams"""
+        if self._loading:
+            return
+        distribution = self.jitter_distribution.get().lower()
+        if distribution in JITTER_DISTRIBUTIONS:
+            self.clicker.jitter_distribution = distribution
+        self.on_config_change(self.clicker)
+    
+    def commit_input(self, event=None):
+        """Copy the typed fields into the model once an edit is finished; bad input gets the model's value back"""
+        if self.clicker is None or self._loading:
+            return
+        self._validate_input()
+        self.clicker.interval_ms = self.get_total_milliseconds()
+        self.clicker.burst_count = int(self.burst_count.get())
+        self.clicker.burst_delay_ms = int(self.burst_delay.get())
+        self.clicker.interval_jitter_ms = float(self.interval_jitter.get() or 0)
+        self.clicker.position_jitter_px = float(self.position_jitter.get() or 0)
+        seed = self.jitter_seed.get().strip()
+        if seed != ("" if self.clicker.jitter_seed is None else str(self.clicker.jitter_seed)):
+            # Numeric text is stored as an int, like a seed read from a config or profile
+            try:
+                self.clicker.jitter_seed = int(seed)
+            except ValueError:
+                self.clicker.jitter_seed = seed or None
+        if self.grid_var.get() != self._shown_grid:
+            # Only a changed grid rebuilds the targets, so hand-written ones survive a focus-out
+            self._sync_targets()
         else:
-            self.status_label.config(text="Status: Disabled")
-            self.is_active = False
-        self.on_config_change()
+            self.on_config_change(self.clicker)
     
-    def _validate_input(self, event=None):
-        """Validate time input fields"""
+    def _on_wait_mode_change(self, *args):
+        """Copy the timing choice into the model; the scheduler reads it before every wait"""
+        if self._loading:
+            return
+        label = self.wait_mode_var.get()
+        for mode, mode_label in WAIT_MODE_LABELS.items():
+            if mode_label == label:
+                self.clicker.wait_mode = mode
+        self.on_config_change(self.clicker)
+    
+    def _validate_input(self):
+        """Put the model's value back into any field holding empty, partial or out-of-range input"""
         try:
-            minutes = int(self.minutes.get()) if self.minutes.get() else 0
-            seconds = int(self.seconds.get()) if self.seconds.get() else 0
-            milliseconds = int(self.milliseconds.get()) if self.milliseconds.get() else 0
-            
-            # Validate ranges
-            if minutes < 0 or minutes > 59:
-                self.minutes.set("0")
-            if seconds < 0 or seconds > 59:
-                self.seconds.set("1")
-            if milliseconds < 0 or milliseconds > 999:
-                self.milliseconds.set("0")
-                
-            # Ensure at least some time is set
-            total_ms = self.get_total_milliseconds()
-            if total_ms < 10:  # Minimum 10ms
-                self.milliseconds.set("10")
-                
+            minutes, seconds, milliseconds = (int(var.get() or 0)
+                                              for var in (self.minutes, self.seconds, self.milliseconds))
+            valid = (0 <= minutes <= 59 and 0 <= seconds <= 59 and 0 <= milliseconds <= 999
+                     and minutes * 60000 + seconds * 1000 + milliseconds >= MIN_INTERVAL_MS)
         except ValueError:
-            # Reset to default values if invalid
-            if not self.minutes.get().isdigit():
-                self.minutes.set("0")
-            if not self.seconds.get().isdigit():
-                self.seconds.set("1")
-            if not self.milliseconds.get().isdigit():
-                self.milliseconds.set("0")
+            valid = False
+        if not valid:
+            self._show_interval()
+        
+        if not self.burst_count.get().isdigit() or not 1 <= int(self.burst_count.get()) <= MAX_BURST:
+            self.burst_count.set(str(self.clicker.burst_count))
+        if not self.burst_delay.get().isdigit() or int(self.burst_delay.get()) > MAX_BURST_DELAY_MS:
+            self.burst_delay.set(str(self.clicker.burst_delay_ms))
+        for var, value in ((self.interval_jitter, self.clicker.interval_jitter_ms),
+                           (self.position_jitter, self.clicker.position_jitter_px)):
+            try:
+                valid = float(var.get() or 0) >= 0
+            except ValueError:
+                valid = False
+            if not valid:
+                var.set(f"{value:g}")
+    
+    def _show_interval(self):
+        """Fill the interval fields from the model"""
+        minutes, rest = divmod(int(self.clicker.interval_ms), 60000)
+        self.minutes.set(str(minutes))
+        self.seconds.set(str(rest // 1000))
+        self.milliseconds.set(str(rest % 1000))
     
     def get_total_milliseconds(self):
         """Calculate total milliseconds from minutes, seconds, and milliseconds"""
@@ -362,18 +2755,30 @@ class ClickerSection:
     
     def update_status(self, is_active, click_count=None):
         """Update the status display"""
-        self.is_active = is_active
+        self.clicker.is_active = is_active
         if click_count is not None:
-            self.click_count = click_count
-            
-        if not self.enabled.get():
+            self.clicker.click_count = click_count
+        self._render_status()
+    
+    def refresh_status(self):
+        """Redraw the status if the click thread changed it since the last refresh"""
+        clicker = self.clicker
+        if clicker is not None and (clicker.is_enabled, clicker.is_active, clicker.click_count) != self._shown_status:
+            self._render_status()
+    
+    def _render_status(self):
+        """Draw the status and click count labels"""
+        clicker = self.clicker
+        self._shown_status = (clicker.is_enabled, clicker.is_active, clicker.click_count)
+        
+        if not clicker.is_enabled:
             self.status_label.config(text="Status: Disabled")
-        elif is_active:
+        elif clicker.is_active:
             self.status_label.config(text="Status: Active (Clicking)", fg=COLORS['accent_blue_light'])
         else:
             self.status_label.config(text="Status: Enabled (Waiting for hotkey)", fg=COLORS['accent_blue'])
             
-        self.count_label.config(text=f"Clicks: {self.click_count}")
+        self.count_label.config(text=f"Clicks: {clicker.click_count}")
     
     def choose_coordinates(self):
         """Start coordinate selection process"""
@@ -385,24 +2790,68 @@ class ClickerSection:
                               "Click anywhere on the screen to set coordinates.\n"
                               "The coordinates will be captured automatically.")
     
+    def add_point_coordinates(self):
+        """Pick another target point to add to this clicker"""
+        if hasattr(self, 'parent_app') and self.parent_app:
+            self.parent_app.start_coordinate_selection(self, append=True)
+    
     def set_coordinates(self, x, y):
-        """Set the coordinates for this clicker"""
-        self.coordinates = (x, y)
-        self.coordinates_text.set(f"({x}, {y})")
+        """Set the coordinates for this clicker, replacing any extra points"""
+        self.points = [(x, y)]
+        self._sync_targets()
         print(f"📍 Clicker {self.section_id} coordinates set to: ({x}, {y})")
         # Update visual state to enable test button
         self._update_visual_state()
     
+    def add_point(self, x, y):
+        """Append a target point; the clicker cycles through every point in order"""
+        self.points.append((x, y))
+        self._sync_targets()
+        print(f"📍 Clicker {self.section_id} point {len(self.points)} added: ({x}, {y})")
+        self._update_visual_state()
+    
+    def _parse_grid(self):
+        """(rows, cols) from the grid field, or None if it is empty or invalid"""
+        rows, sep, cols = self.grid_var.get().lower().partition('x')
+        if sep and rows.strip().isdigit() and cols.strip().isdigit():
+            rows, cols = int(rows), int(cols)
+            if rows > 0 and cols > 0 and rows * cols <= MAX_TARGET_POINTS:
+                return rows, cols
+        return None
+    
+    def _sync_targets(self):
+        """Turn the picked points and grid field into the model's coordinates and targets"""
+        if self._loading:
+            return
+        self._shown_grid = self.grid_var.get()
+        self.clicker.coordinates, self.clicker.targets = targets_from_points(self.points, self._parse_grid())
+        self._show_targets()
+        self.on_config_change(self.clicker)
+    
+    def _show_targets(self):
+        """Describe the model's targets in the coordinates label"""
+        coordinates, targets = self.clicker.coordinates, self.clicker.targets
+        if coordinates is None:
+            self.coordinates_text.set("No coordinates set")
+        elif not targets:
+            self.coordinates_text.set(f"({coordinates[0]}, {coordinates[1]})")
+        elif len(targets) == 1 and 'grid' in targets[0]:
+            self.coordinates_text.set(f"{targets[0]['grid']['rows']}x{targets[0]['grid']['cols']} grid")
+        elif len(targets) == 1 and 'points' in targets[0]:
+            self.coordinates_text.set(f"{len(targets[0]['points'])} points")
+        else:
+            self.coordinates_text.set(f"{len(targets)} target segments")
+    
     def test_coordinates(self):
         """Test the current coordinates by performing a single click"""
-        if self.coordinates is None:
+        if self.clicker.coordinates is None:
             messagebox.showwarning("No Coordinates", "Please set coordinates first by clicking 'Choose Coordinates'.")
             return
         
         if hasattr(self, 'parent_app') and self.parent_app:
-            self.parent_app.test_click_at_coordinates(self.coordinates, self.section_id)
+            self.parent_app.test_click_at_coordinates(self.clicker.coordinates, self.section_id)
         else:
-            messagebox.showinfo("Test Click", f"Would click at coordinates: {self.coordinates}")
+            messagebox.showinfo("Test Click", f"Would click at coordinates: {self.clicker.coordinates}")
     
     def reset_clicker(self):
         """Reset this clicker to default values"""
@@ -410,13 +2859,23 @@ class ClickerSection:
         self.minutes.set("0")
         self.seconds.set("1")
         self.milliseconds.set("0")
+        self.wait_mode_var.set(WAIT_MODE_LABELS[DEFAULT_WAIT_MODE])
+        self.burst_count.set("1")
+        self.burst_delay.set("0")
+        self.button_var.set("Left")
+        self.interval_jitter.set("0")
+        self.position_jitter.set("0")
+        self.jitter_distribution.set(JITTER_DISTRIBUTIONS[0].title())
+        self.jitter_seed.set("")
+        self.commit_input()
         
         # Reset coordinates
-        self.coordinates = None
-        self.coordinates_text.set("No coordinates set")
+        self.points = []
+        self.grid_var.set("")
+        self._sync_targets()
         
         # Reset click count
-        self.click_count = 0
+        self.clicker.reset_counters()
         
         # Update status
         self.update_status(False, 0)
@@ -425,43 +2884,258 @@ class ClickerSection:
         self._update_visual_state()
         
         print(f"🔄 Clicker {self.section_id} reset to defaults")
+    
+    def remove_clicker(self):
+        """Remove the bound clicker from the list"""
+        if hasattr(self, 'parent_app') and self.parent_app:
+            self.parent_app.remove_clicker(self.clicker)
+
+
+class ClickerListView:
+    """Scrollable list of clickers that only builds widgets for the visible rows"""
+    
+    def __init__(self, parent, app, rows=VISIBLE_CLICKER_ROWS):
+        self.clickers = []
+        self.top = 0          # Index of the first visible clicker
+        self._shown = None    # Clickers bound to the sections, in order
+        
+        self.frame = tk.Frame(parent, bg=COLORS['bg_main'])
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.body = tk.Frame(self.frame, bg=COLORS['bg_main'])
+        self.body.pack(side="left", fill="both", expand=True)
+        
+        # A few sections rebound to whichever clickers are in view, so the widget count and
+        # refresh cost stay the same for three clickers or three hundred
+        self.sections = []
+        for _ in range(rows):
+            section = ClickerSection(self.body, app.on_config_change)
+            section.parent_app = app
+            self.sections.append(section)
+        
+        # The wheel scrolls the list wherever the pointer is over a row
+        for section in self.sections:
+            widgets = [section.frame]
+            while widgets:
+                widget = widgets.pop()
+                widget.bindtags(widget.bindtags() + ('ClickerList',))
+                widgets.extend(widget.winfo_children())
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.body.bind_class('ClickerList', sequence, self._on_wheel)
+    
+    def set_clickers(self, clickers):
+        """Show another list of clickers, rebinding every row even if the same models are shown"""
+        self.clickers = clickers
+        self.top = 0
+        self.redraw()
+    
+    def redraw(self):
+        """Reload every visible row from its model, after the models changed behind the view"""
+        self._shown = None
+        self.refresh()
+    
+    def refresh(self):
+        """Rebind rows if the list or scroll position changed, then redraw changed statuses"""
+        rows = len(self.sections)
+        count = len(self.clickers)
+        self.top = max(0, min(self.top, count - rows))
+        shown = self.clickers[self.top:self.top + rows]
+        
+        if shown != self._shown:
+            if self._shown is None or len(shown) != len(self._shown):
+                for section in self.sections:
+                    section.frame.pack_forget()
+                for section in self.sections[:len(shown)]:
+                    section.frame.pack(fill="x", pady=3, padx=10, ipady=8, ipadx=10)
+            for index, (section, clicker) in enumerate(zip(self.sections, shown)):
+                if self._shown is None or index >= len(self._shown) or self._shown[index] is not clicker:
+                    section.show(clicker)
+            self._shown = shown
+            if count > rows:
+                self.scrollbar.set(self.top / count, (self.top + rows) / count)
+            else:
+                self.scrollbar.set(0.0, 1.0)
+        
+        for section in self.sections[:len(shown)]:
+            section.refresh_status()
+    
+    def commit_edits(self):
+        """Apply edits still being typed in the visible rows, which a button or hotkey leaves unfinished"""
+        for section in self.sections[:len(self._shown or ())]:
+            section.commit_input()
+    
+    def section_for(self, clicker):
+        """The section currently showing clicker, or None if it is scrolled out of view"""
+        for section, shown in zip(self.sections, self._shown or ()):
+            if shown is clicker:
+                return section
+        return None
+    
+    def scroll_to(self, top):
+        """Show clickers from index top"""
+        self.top = max(0, int(top))
+        self.refresh()
+    
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.clickers))
+        elif action == 'scroll':
+            step = len(self.sections) if unit == 'pages' else 1
+            self.scroll_to(self.top + int(amount) * step)
+    
+    def _on_wheel(self, event):
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.top - 1)
+        else:
+            self.scroll_to(self.top + 1)
+        return "break"
+
+
+class EventListView:
+    """Scrollable list of a recording's events that only renders the visible rows"""
+    
+    def __init__(self, parent, rows=6):
+        self.recording = None
+        self.top = 0          # Index of the first visible event
+        self.rows = rows      # Visible rows, updated when the widget is resized
+        self.follow = True    # Keep the newest event in view
+        self._shown = None    # (recording, count, top, rows) last drawn
+        
+        self.frame = tk.Frame(parent, bg=COLORS['bg_section'])
+        self.text = tk.Text(self.frame, height=rows, width=50,
+                           font=("Segoe UI", 9),
+                           bg=COLORS['entry_bg'],
+                           fg=COLORS['text_primary'],
+                           relief='flat', bd=0,
+                           wrap='none',
+                           state='disabled')
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.text.pack(side="left", fill="both", expand=True)
+        
+        self._line_height = int(self.text.tk.call('font', 'metrics', self.text.cget('font'), '-linespace'))
+        self.text.bind('<Configure>', self._on_resize)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.text.bind(sequence, self._on_wheel)
+    
+    def show(self, recording):
+        """Display another recording, starting at its newest events"""
+        self.recording = recording
+        self.top = 0
+        self.follow = True
+        self.refresh()
+    
+    def refresh(self):
+        """Redraw if the recording grew or the view moved; cheap enough for every UI tick"""
+        recording = self.recording
+        count = len(recording) if recording is not None else 0
+        last_top = max(0, count - self.rows)
+        self.top = last_top if self.follow else min(self.top, last_top)
+        shown = (recording, count, self.top, self.rows)
+        if shown == self._shown:
+            return
+        self._shown = shown
+        
+        lines = []
+        for index in range(self.top, min(count, self.top + self.rows)):
+            x, y, t, kind, detail = recording[index]
+            lines.append(f"{index + 1}. {EVENT_NAMES[kind]} at ({x}, {y}) after {t:.2f}s")
+        self.text.config(state='normal')
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', "\n".join(lines))
+        self.text.config(state='disabled')
+        
+        if count > self.rows:
+            self.scrollbar.set(self.top / count, (self.top + self.rows) / count)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    def scroll_to(self, top):
+        """Show events from index top; scrolling to the end resumes following"""
+        count = len(self.recording) if self.recording is not None else 0
+        self.top = max(0, min(int(top), count - self.rows))
+        self.follow = self.top >= count - self.rows
+        self.refresh()
+    
+    def _on_scrollbar(self, action, amount, unit=None):
+        count = len(self.recording) if self.recording is not None else 0
+        if action == 'moveto':
+            self.scroll_to(float(amount) * count)
+        elif action == 'scroll':
+            step = self.rows if unit == 'pages' else 1
+            self.scroll_to(self.top + int(amount) * step)
+    
+    def _on_wheel(self, event):
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.top - 3)
+        else:
+            self.scroll_to(self.top + 3)
+        return "break"
+    
+    def _on_resize(self, event):
+        rows = max(1, event.height // max(1, self._line_height))
+        if rows != self.rows:
+            self.rows = rows
+            self.refresh()
 
 
 class AutoClicker:
     """Main application class"""
     
-    def __init__(self):
+    def __init__(self, backend_name=None, summary_interval=LOG_SUMMARY_INTERVAL):
+        load_tk()
+        STARTUP.mark("import tkinter")
         self.root = tk.Tk()
         self.setup_window()
+        STARTUP.mark("create Tk root")
         
-        # Clicker sections
+        # Clicker models of the active profile; the list view binds the visible ones to its few sections
         self.clickers = []
-        self.clicker_threads = {}
-        self.active_clickers = set()
-        self.global_active = False
+        self._clicker_ids = itertools.count(1)
+        self._load_profiles()
+        STARTUP.mark("load profiles")
         
-        # Mouse controller
-        self.mouse_controller = mouse.Controller()
+        # Scheduler, input backend and replay live in the GUI-free engine
+        self.engine = ClickEngine(backend_name, summary_interval)
+        self.engine.on_error = lambda title, message: self.post_ui(
+            lambda: messagebox.showerror(title, message))
+        self.engine.on_replay_finished = lambda completed: self.post_ui(
+            self.replay_completed if completed else self.stop_replay)
         
         # Recording variables
-        self.recorded_clicks = []
+        self.recorded_clicks = RecordingBuffer()
         self.recording = False
         self.recording_start_time = None
         self.recording_listener = None
-        self.replaying = False
-        self.replay_count = 0
-        self.max_replays = 1
+        self.recording_writer = None
+        self.stream_recordings = False
+        self.record_motion = False      # High fidelity: moves, drags, every button and scroll
+        self.motion_filter = None
         
-        # Global hotkey setup
+        # Callables queued by other threads for the Tk main thread
+        self.ui_calls = collections.deque()
+        self._shown_record_count = None
+        self._shown_replay_count = None
+        
+        # Global hotkeys start once the window is up (see _finish_startup)
         self.hotkey_listener = None
-        self.setup_hotkeys()
         
         self.create_widgets()
+        STARTUP.mark("build widgets")
+        self.root.after(UI_REFRESH_INTERVAL_MS, self._ui_pump)
+        self.root.after_idle(self._finish_startup)
+    
+    def _finish_startup(self):
+        """Start the slower pieces after the first frame has been drawn"""
+        STARTUP.mark("first frame")
+        self.setup_hotkeys()
+        STARTUP.mark("global hotkeys")
+        STARTUP.report()
         
     def setup_window(self):
         """Configure the main window"""
         self.root.title("Advanced Autoclicker")
-        self.root.geometry("600x700")
+        self.root.geometry("600x800")
         self.root.resizable(False, False)
         self.root.configure(bg=COLORS['bg_main'])
         
@@ -498,6 +3172,7 @@ class AutoClicker:
         # Create tabs
         self.create_multi_clicker_tab()
         self.create_recorder_tab()
+        self.create_stats_tab()
         
         # Global status at bottom
         status_frame = tk.Frame(main_frame, bg=COLORS['bg_main'])
@@ -534,15 +3209,50 @@ class AutoClicker:
                                     font=("Segoe UI", 8))
         instruction_label.pack(pady=6)
         
-        # Clickers container
-        clickers_frame = tk.Frame(multi_frame, bg=COLORS['bg_main'])
-        clickers_frame.pack(fill="both", expand=True, pady=(0, 10))
+        # Profiles: named clicker sets, switched without rebuilding the rows
+        profile_frame = tk.Frame(multi_frame, bg=COLORS['bg_main'])
+        profile_frame.pack(fill="x", pady=(0, 8), padx=3)
+        
+        profile_label = tk.Label(profile_frame, text="Profile:", 
+                                font=("Segoe UI", 9),
+                                fg=COLORS['text_secondary'], 
+                                bg=COLORS['bg_main'])
+        profile_label.pack(side="left")
+        
+        self.profile_var = tk.StringVar(value=self.active_profile)
+        self.profile_box = ttk.Combobox(profile_frame, textvariable=self.profile_var,
+                                       values=self.profile_names(),
+                                       width=20,
+                                       font=("Segoe UI", 9))
+        self.profile_box.pack(side="left", padx=(6, 10))
+        self.profile_box.bind('<<ComboboxSelected>>', lambda event: self.switch_profile(self.profile_var.get()))
+        
+        save_profile_btn = tk.Button(profile_frame, text="Save", 
+                                    command=self.save_profile,
+                                    font=("Segoe UI", 9),
+                                    bg=COLORS['accent_blue'],
+                                    fg=COLORS['text_primary'],
+                                    relief='flat', bd=0, padx=12, pady=3, cursor='hand2')
+        save_profile_btn.pack(side="left", padx=(0, 5))
+        
+        delete_profile_btn = tk.Button(profile_frame, text="Delete", 
+                                      command=self.delete_profile,
+                                      font=("Segoe UI", 9),
+                                      bg=COLORS['button_disabled'],
+                                      fg=COLORS['text_primary'],
+                                      relief='flat', bd=0, padx=12, pady=3, cursor='hand2')
+        delete_profile_btn.pack(side="left")
+        
+        profile_hint = tk.Label(profile_frame, text="Type a new name and Save to copy", 
+                               font=("Segoe UI", 8),
+                               fg=COLORS['text_secondary'], 
+                               bg=COLORS['bg_main'])
+        profile_hint.pack(side="right")
         
-        # Create 3 clicker sections
-        for i in range(1, 4):
-            clicker = ClickerSection(clickers_frame, i, self.on_config_change)
-            clicker.parent_app = self
-            self.clickers.append(clicker)
+        # Clickers container: only the visible rows have widgets
+        self.clicker_list = ClickerListView(multi_frame, self)
+        self.clicker_list.frame.pack(fill="both", expand=True, pady=(0, 10))
+        self.clicker_list.set_clickers(self.clickers)
         
         # Controls
         control_frame = tk.Frame(multi_frame, bg=COLORS['bg_main'])
@@ -570,7 +3280,32 @@ class AutoClicker:
                                       bg=COLORS['button_disabled'],
                                       fg=COLORS['text_primary'],
                                       relief='flat', bd=0, padx=20, pady=6, cursor='hand2')
-        self.reset_all_btn.pack(side="left")
+        self.reset_all_btn.pack(side="left", padx=(0, 10))
+        
+        self.add_clicker_btn = tk.Button(control_frame, text="Add Clicker", 
+                                        command=self.add_clicker,
+                                        font=("Segoe UI", 10, "bold"),
+                                        bg=COLORS['accent_blue'],
+                                        fg=COLORS['text_primary'],
+                                        relief='flat', bd=0, padx=20, pady=6, cursor='hand2')
+        self.add_clicker_btn.pack(side="left")
+        
+        self.fast_path_var = tk.BooleanVar(value=self.engine.fast_path)
+        self.fast_path_var.trace_add('write', self._on_fast_path_change)
+        self.fast_path_cb = tk.Checkbutton(
+            control_frame,
+            text=f"Fast clicks (verify every {self.engine.verify_every})",
+            variable=self.fast_path_var,
+            font=("Segoe UI", 9),
+            fg=COLORS['text_primary'],
+            bg=COLORS['bg_main'],
+            activebackground=COLORS['bg_main'],
+            selectcolor=COLORS['accent_blue'],
+            relief='flat',
+            bd=0,
+            highlightthickness=0
+        )
+        self.fast_path_cb.pack(side="right")
     
     def create_recorder_tab(self):
         """Create the click recorder tab"""
@@ -595,30 +3330,121 @@ class AutoClicker:
         record_frame = tk.Frame(recorder_frame, bg=COLORS['bg_section'], relief='flat', bd=1)
         record_frame.pack(fill="x", pady=(0, 15), padx=3, ipady=15)
         
-        record_title = tk.Label(record_frame, text="Recording Controls", 
-                               font=("Segoe UI", 12, "bold"),
-                               fg=COLORS['text_primary'], 
-                               bg=COLORS['bg_section'])
-        record_title.pack(pady=(0, 10))
+        record_title = tk.Label(record_frame, text="Recording Controls", 
+                               font=("Segoe UI", 12, "bold"),
+                               fg=COLORS['text_primary'], 
+                               bg=COLORS['bg_section'])
+        record_title.pack(pady=(0, 10))
+        
+        record_btn_frame = tk.Frame(record_frame, bg=COLORS['bg_section'])
+        record_btn_frame.pack()
+        
+        self.record_btn = tk.Button(record_btn_frame, text="Start Recording", 
+                                   command=self.toggle_recording,
+                                   font=("Segoe UI", 11, "bold"),
+                                   bg=COLORS['accent_blue'],
+                                   fg=COLORS['text_primary'],
+                                   relief='flat', bd=0, padx=25, pady=8, cursor='hand2')
+        self.record_btn.pack(side="left", padx=(0, 15))
+        
+        self.clear_record_btn = tk.Button(record_btn_frame, text="Clear Recording", 
+                                         command=self.clear_recording,
+                                         font=("Segoe UI", 11, "bold"),
+                                         bg=COLORS['button_disabled'],
+                                         fg=COLORS['text_primary'],
+                                         relief='flat', bd=0, padx=25, pady=8, cursor='hand2')
+        self.clear_record_btn.pack(side="left")
+        
+        self.record_motion_var = tk.BooleanVar(value=self.record_motion)
+        self.record_motion_var.trace_add('write', self._on_record_motion_change)
+        self.record_motion_cb = tk.Checkbutton(
+            record_btn_frame,
+            text="Motion, drags && scroll",
+            variable=self.record_motion_var,
+            font=("Segoe UI", 9),
+            fg=COLORS['text_primary'],
+            bg=COLORS['bg_section'],
+            activebackground=COLORS['bg_section'],
+            selectcolor=COLORS['accent_blue'],
+            relief='flat',
+            bd=0,
+            highlightthickness=0
+        )
+        self.record_motion_cb.pack(side="left", padx=(15, 0))
+        
+        # Save / load recordings
+        file_btn_frame = tk.Frame(record_frame, bg=COLORS['bg_section'])
+        file_btn_frame.pack(pady=(10, 0))
+        
+        self.save_record_btn = tk.Button(file_btn_frame, text="Save Recording", 
+                                        command=self.save_recording_file,
+                                        font=("Segoe UI", 9),
+                                        bg=COLORS['button_disabled'],
+                                        fg=COLORS['text_primary'],
+                                        relief='flat', bd=0, padx=12, pady=4, cursor='hand2')
+        self.save_record_btn.pack(side="left", padx=(0, 10))
+        
+        self.load_record_btn = tk.Button(file_btn_frame, text="Load Recording", 
+                                        command=self.load_recording_file,
+                                        font=("Segoe UI", 9),
+                                        bg=COLORS['accent_blue_light'],
+                                        fg=COLORS['text_primary'],
+                                        relief='flat', bd=0, padx=12, pady=4, cursor='hand2')
+        self.load_record_btn.pack(side="left", padx=(0, 10))
+        
+        self.stream_recordings_var = tk.BooleanVar(value=self.stream_recordings)
+        self.stream_recordings_var.trace_add('write', self._on_stream_recordings_change)
+        self.stream_recordings_cb = tk.Checkbutton(
+            file_btn_frame,
+            text="Stream to disk",
+            variable=self.stream_recordings_var,
+            font=("Segoe UI", 9),
+            fg=COLORS['text_primary'],
+            bg=COLORS['bg_section'],
+            activebackground=COLORS['bg_section'],
+            selectcolor=COLORS['accent_blue'],
+            relief='flat',
+            bd=0,
+            highlightthickness=0
+        )
+        self.stream_recordings_cb.pack(side="left")
+        
+        # Edit the current recording: trim, dedupe, snap, scale, loop, append
+        edit_frame = tk.Frame(record_frame, bg=COLORS['bg_section'])
+        edit_frame.pack(pady=(10, 0))
         
-        record_btn_frame = tk.Frame(record_frame, bg=COLORS['bg_section'])
-        record_btn_frame.pack()
+        edit_label = tk.Label(edit_frame, text="Edits:", 
+                             font=("Segoe UI", 9),
+                             fg=COLORS['text_secondary'], 
+                             bg=COLORS['bg_section'])
+        edit_label.pack(side="left", padx=(0, 5))
         
-        self.record_btn = tk.Button(record_btn_frame, text="Start Recording", 
-                                   command=self.toggle_recording,
-                                   font=("Segoe UI", 11, "bold"),
-                                   bg=COLORS['accent_blue'],
-                                   fg=COLORS['text_primary'],
-                                   relief='flat', bd=0, padx=25, pady=8, cursor='hand2')
-        self.record_btn.pack(side="left", padx=(0, 15))
+        self.edit_spec_var = tk.StringVar(value="trim,dedupe=80")
+        self.edit_spec_entry = tk.Entry(edit_frame, textvariable=self.edit_spec_var, width=28,
+                                       font=("Segoe UI", 9), 
+                                       relief='flat', bd=0,
+                                       bg=COLORS['entry_bg'],
+                                       fg=COLORS['text_primary'],
+                                       insertbackground=COLORS['text_primary'],
+                                       highlightthickness=1,
+                                       highlightcolor=COLORS['accent_blue'])
+        self.edit_spec_entry.pack(side="left", padx=(0, 10))
+        
+        self.apply_edit_btn = tk.Button(edit_frame, text="Apply", 
+                                       command=self.apply_recording_edits,
+                                       font=("Segoe UI", 9),
+                                       bg=COLORS['accent_blue_light'],
+                                       fg=COLORS['text_primary'],
+                                       relief='flat', bd=0, padx=12, pady=4, cursor='hand2')
+        self.apply_edit_btn.pack(side="left", padx=(0, 10))
         
-        self.clear_record_btn = tk.Button(record_btn_frame, text="Clear Recording", 
-                                         command=self.clear_recording,
-                                         font=("Segoe UI", 11, "bold"),
-                                         bg=COLORS['button_disabled'],
-                                         fg=COLORS['text_primary'],
-                                         relief='flat', bd=0, padx=25, pady=8, cursor='hand2')
-        self.clear_record_btn.pack(side="left")
+        self.append_record_btn = tk.Button(edit_frame, text="Append File", 
+                                          command=self.append_recording_file,
+                                          font=("Segoe UI", 9),
+                                          bg=COLORS['accent_blue_light'],
+                                          fg=COLORS['text_primary'],
+                                          relief='flat', bd=0, padx=12, pady=4, cursor='hand2')
+        self.append_record_btn.pack(side="left")
         
         # Recording status
         self.record_status = tk.Label(record_frame, text="Status: Ready to record", 
@@ -659,6 +3485,50 @@ class AutoClicker:
                                           justify='center')
         self.replay_count_entry.pack(side="left")
         
+        # Replay timing: speed factor, pause cap and pause between repeats
+        timing_frame = tk.Frame(replay_frame, bg=COLORS['bg_section'])
+        timing_frame.pack(pady=(0, 10))
+        
+        self.replay_speed_var = tk.StringVar(value="1.0")
+        self.replay_max_speed_var = tk.BooleanVar(value=False)
+        self.replay_max_gap_var = tk.StringVar(value="")
+        self.replay_gap_var = tk.StringVar(value=str(DEFAULT_REPLAY_GAP_MS))
+        
+        for text, var, width in (("Speed ×", self.replay_speed_var, 5),
+                                 ("Max pause ms:", self.replay_max_gap_var, 6),
+                                 ("Gap ms:", self.replay_gap_var, 6)):
+            label = tk.Label(timing_frame, text=text, 
+                            font=("Segoe UI", 9),
+                            fg=COLORS['text_secondary'], 
+                            bg=COLORS['bg_section'])
+            label.pack(side="left", padx=(0, 4))
+            entry = tk.Entry(timing_frame, textvariable=var, width=width,
+                            font=("Segoe UI", 9), 
+                            relief='flat', bd=0,
+                            bg=COLORS['entry_bg'],
+                            fg=COLORS['text_primary'],
+                            insertbackground=COLORS['text_primary'],
+                            highlightthickness=1,
+                            highlightcolor=COLORS['accent_blue'],
+                            justify='center')
+            entry.pack(side="left", padx=(0, 12))
+            if var is self.replay_speed_var:
+                self.replay_speed_entry = entry
+        
+        max_speed_cb = tk.Checkbutton(timing_frame, text="As fast as possible",
+                                      variable=self.replay_max_speed_var,
+                                      command=lambda: self.replay_speed_entry.config(
+                                          state='disabled' if self.replay_max_speed_var.get() else 'normal'),
+                                      font=("Segoe UI", 9),
+                                      fg=COLORS['text_primary'],
+                                      bg=COLORS['bg_section'],
+                                      activebackground=COLORS['bg_section'],
+                                      selectcolor=COLORS['accent_blue'],
+                                      relief='flat',
+                                      bd=0,
+                                      highlightthickness=0)
+        max_speed_cb.pack(side="left")
+        
         # Replay buttons
         replay_btn_frame = tk.Frame(replay_frame, bg=COLORS['bg_section'])
         replay_btn_frame.pack(pady=(10, 0))
@@ -696,20 +3566,69 @@ class AutoClicker:
                              bg=COLORS['bg_section'])
         info_title.pack(pady=(0, 10))
         
-        self.recording_info = tk.Text(info_frame, height=8, width=50,
+        self.recording_info = tk.Text(info_frame, height=5, width=50,
                                      font=("Segoe UI", 9),
                                      bg=COLORS['entry_bg'],
                                      fg=COLORS['text_primary'],
                                      relief='flat', bd=0,
                                      wrap=tk.WORD,
                                      state='disabled')
-        self.recording_info.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self.recording_info.pack(fill="x", padx=10, pady=(0, 5))
+        
+        # Every recorded event; rows are drawn on demand, so size does not matter
+        self.event_list = EventListView(info_frame)
+        self.event_list.frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self.event_list.show(self.recorded_clicks)
         
         # Initial info text
         self.recording_info.config(state='normal')
         self.recording_info.insert('1.0', "No recording yet. Click 'Start Recording' or press F10 to begin recording clicks.")
         self.recording_info.config(state='disabled')
     
+    def create_stats_tab(self):
+        """Create the timing statistics tab"""
+        self.stats_frame = tk.Frame(self.notebook, bg=COLORS['bg_main'])
+        self.notebook.add(self.stats_frame, text="Stats")
+        
+        stats_section = tk.Frame(self.stats_frame, bg=COLORS['bg_section'], relief='flat', bd=1)
+        stats_section.pack(fill="both", expand=True, padx=3, ipady=10)
+        
+        stats_title = tk.Label(stats_section, text="Timing Accuracy", 
+                              font=("Segoe UI", 12, "bold"),
+                              fg=COLORS['text_primary'], 
+                              bg=COLORS['bg_section'])
+        stats_title.pack(pady=(0, 10))
+        
+        self.stats_text = tk.Text(stats_section, height=20, width=70,
+                                 font=("Courier", 9),
+                                 bg=COLORS['entry_bg'],
+                                 fg=COLORS['text_primary'],
+                                 relief='flat', bd=0,
+                                 wrap=tk.NONE,
+                                 state='disabled')
+        self.stats_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        
+        stats_btn_frame = tk.Frame(stats_section, bg=COLORS['bg_section'])
+        stats_btn_frame.pack()
+        
+        export_btn = tk.Button(stats_btn_frame, text="Export...", 
+                              command=self.export_stats,
+                              font=("Segoe UI", 10, "bold"),
+                              bg=COLORS['accent_blue'],
+                              fg=COLORS['text_primary'],
+                              relief='flat', bd=0, padx=20, pady=6, cursor='hand2')
+        export_btn.pack(side="left", padx=(0, 10))
+        
+        reset_stats_btn = tk.Button(stats_btn_frame, text="Reset Stats", 
+                                   command=self.reset_stats,
+                                   font=("Segoe UI", 10, "bold"),
+                                   bg=COLORS['button_disabled'],
+                                   fg=COLORS['text_primary'],
+                                   relief='flat', bd=0, padx=20, pady=6, cursor='hand2')
+        reset_stats_btn.pack(side="left")
+        
+        self._stats_shown_at = 0
+    
     def _add_button_effects(self):
         """Add hover effects to buttons for modern feel"""
         def on_enter_start(event):
@@ -740,10 +3659,12 @@ class AutoClicker:
     def setup_hotkeys(self):
         """Set up global hotkey listener"""
         try:
+            # Hotkeys fire on the listener thread; run their handlers on the Tk thread
             hotkeys = {
-                '<f9>': self.toggle_clickers,
-                '<f10>': self.toggle_recording
+                '<f9>': self.on_toggle_hotkey,
+                '<f10>': lambda: self.post_ui(self.toggle_recording)
             }
+            from pynput.keyboard import GlobalHotKeys
             self.hotkey_listener = GlobalHotKeys(hotkeys)
             self.hotkey_listener.start()
             print("✅ Global hotkeys enabled")
@@ -763,21 +3684,114 @@ class AutoClicker:
             
             messagebox.showwarning("Hotkey Warning", error_msg)
     
-    def on_config_change(self):
-        """Handle configuration changes"""
-        # This can be extended for real-time config updates
-        pass
+    def on_toggle_hotkey(self):
+        """F9, on the hotkey thread: stopping takes effect right here, the UI catches up on its next refresh"""
+        if self.engine.global_active:
+            self.engine.stop_clickers()
+            self.post_ui(self.stop_all_clickers)
+        else:
+            self.post_ui(self.start_all_clickers)
+    
+    def post_ui(self, callback):
+        """Queue a callable to run on the Tk main thread at the next UI refresh"""
+        self.ui_calls.append(callback)
+    
+    def _ui_pump(self):
+        """Fixed-rate UI refresh: the only place worker-thread state reaches Tk"""
+        pending = self.ui_calls
+        while pending:
+            callback = pending.popleft()
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️  UI update failed: {e}")
+        
+        self.clicker_list.refresh()
+        
+        writer = self.recording_writer
+        if self.recording and writer is not None and writer.submitted != self._shown_record_count:
+            self._shown_record_count = writer.submitted
+            self.record_status.config(text=f"Status: Recording... {writer.submitted} clicks recorded")
+        self.event_list.refresh()
+        
+        engine = self.engine
+        if engine.replaying and engine.replay_count != self._shown_replay_count:
+            self._shown_replay_count = engine.replay_count
+            self.replay_status.config(text=f"Status: Replaying... {engine.replay_count}/{engine.max_replays}")
+        
+        # Percentiles walk every bucket, so the stats tab refreshes less often and only when visible
+        now = time.monotonic()
+        if now - self._stats_shown_at >= STATS_REFRESH_INTERVAL and self.notebook.select() == str(self.stats_frame):
+            self._stats_shown_at = now
+            self.refresh_stats()
+        
+        self.root.after(UI_REFRESH_INTERVAL_MS, self._ui_pump)
+    
+    def metrics_sources(self):
+        """Every ClickMetrics the app collects, by display name"""
+        sources = {f"Clicker {c.clicker_id}": c.metrics for c in self.clickers}
+        sources["Replay"] = self.engine.replay_metrics
+        return sources
+    
+    def refresh_stats(self):
+        """Redraw the stats tab"""
+        lines = []
+        for name, metrics in self.metrics_sources().items():
+            lines.extend(format_metrics(name, metrics))
+            lines.append("")
+        self.stats_text.config(state='normal')
+        self.stats_text.delete('1.0', tk.END)
+        self.stats_text.insert('1.0', "\n".join(lines))
+        self.stats_text.config(state='disabled')
+    
+    def export_stats(self):
+        """Export every histogram to a JSON or CSV file"""
+        path = filedialog.asksaveasfilename(
+            title="Export Stats",
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("CSV", "*.csv")])
+        if not path:
+            return
+        try:
+            export_metrics(self.metrics_sources(), path)
+        except OSError as e:
+            messagebox.showerror("Export Error", f"Could not export stats:\n{e}")
+            return
+        print(f"📊 Stats exported to {path}")
+    
+    def reset_stats(self):
+        """Clear every histogram"""
+        for metrics in self.metrics_sources().values():
+            metrics.reset()
+        self.refresh_stats()
+    
+    def _on_fast_path_change(self, *args):
+        """Mirror the fast-path checkbox into a plain attribute the click thread can read"""
+        self.engine.fast_path = self.fast_path_var.get()
+    
+    def _on_stream_recordings_change(self, *args):
+        """Mirror the stream-to-disk checkbox into a plain attribute"""
+        self.stream_recordings = self.stream_recordings_var.get()
+    
+    def _on_record_motion_change(self, *args):
+        """Mirror the high-fidelity checkbox; takes effect on the next recording"""
+        self.record_motion = self.record_motion_var.get()
+    
+    def on_config_change(self, clicker):
+        """Push a clicker's edited settings to the engine so a running clicker picks them up"""
+        self.engine.apply_config(clicker)
     
     def toggle_clickers(self):
         """Toggle all enabled clickers on/off"""
-        if self.global_active:
+        if self.engine.global_active:
             self.stop_all_clickers()
         else:
             self.start_all_clickers()
     
     def start_all_clickers(self):
         """Start all enabled clickers"""
-        enabled_clickers = [c for c in self.clickers if c.enabled.get()]
+        self.clicker_list.commit_edits()
+        enabled_clickers = [c for c in self.clickers if c.is_enabled]
         
         if not enabled_clickers:
             messagebox.showinfo("Info", "No clickers are enabled!\nPlease enable at least one clicker to start.")
@@ -786,153 +3800,180 @@ class AutoClicker:
         # Check if all enabled clickers have coordinates set
         clickers_without_coords = [c for c in enabled_clickers if c.coordinates is None]
         if clickers_without_coords:
-            clicker_numbers = [str(c.section_id) for c in clickers_without_coords]
+            clicker_numbers = [str(c.clicker_id) for c in clickers_without_coords]
             messagebox.showwarning("Missing Coordinates", 
                                  f"Clicker(s) {', '.join(clicker_numbers)} have no coordinates set!\n"
                                  f"Please click 'Choose Coordinates' to set click positions before starting.")
             return
         
-        self.global_active = True
         self.global_status_label.config(text="Status: ACTIVE", 
                                        fg=COLORS['accent_blue_light'])
         
-        for clicker in enabled_clickers:
-            if clicker.section_id not in self.clicker_threads:
-                thread = threading.Thread(target=self.clicker_worker, 
-                                        args=(clicker,), daemon=True)
-                self.clicker_threads[clicker.section_id] = thread
-                thread.start()
-                clicker.update_status(True)
+        self.engine.start_clickers(enabled_clickers)
+        self.clicker_list.refresh()
     
     def stop_all_clickers(self):
         """Stop all clickers"""
-        self.global_active = False
         self.global_status_label.config(text="Status: Inactive", 
                                        fg=COLORS['text_secondary'])
         
-        # Clear active clickers set
-        self.active_clickers.clear()
-        
-        # Update status for all clickers
-        for clicker in self.clickers:
-            clicker.update_status(False)
+        # Drop every pending deadline and clear active clickers
+        self.engine.stop_clickers()
         
-        # Threads will stop naturally when they check global_active
+        # Update status for the visible clickers
+        self.clicker_list.refresh()
     
     def reset_all_clickers(self):
         """Reset all clickers to default values"""
         # Stop all clickers first
         self.stop_all_clickers()
         
-        # Reset each clicker
-        for clicker in self.clickers:
-            clicker.reset_clicker()
+        # Fresh models keep each clicker's number and enabled state; the list is the profile's, so edit it in place
+        self.clickers[:] = [Clicker(c.clicker_id, enabled=c.is_enabled) for c in self.clickers]
+        self.clicker_list.redraw()
         
         print("🔄 All clickers reset to defaults")
         messagebox.showinfo("Reset Complete", "All clickers have been reset to default values.")
     
-    def clicker_worker(self, clicker):
-        """Worker thread for individual clicker"""
-        self.active_clickers.add(clicker.section_id)
-        
-        while self.global_active and clicker.enabled.get():
-            try:
-                # Check if coordinates are set
-                if clicker.coordinates is None:
-                    print(f"⚠️  Clicker {clicker.section_id}: No coordinates set, skipping...")
-                    # Update UI to show warning
-                    self.root.after(0, lambda c=clicker: c.update_status(False))
-                    break
-                
-                # Use stored coordinates
-                target_x, target_y = clicker.coordinates
-                print(f"🖱️  Clicking at coordinates: ({target_x}, {target_y})")
-                
-                # Move mouse to target position and click with improved multi-monitor handling
-                try:
-                    # First, try to set position and verify it worked
-                    self.mouse_controller.position = (target_x, target_y)
-                    time.sleep(0.02)  # Slightly longer delay for multi-monitor setups
-                    
-                    # Verify the position was set correctly
-                    actual_pos = self.mouse_controller.position
-                    print(f"🎯 Target: ({target_x}, {target_y}), Actual: {actual_pos}")
-                    
-                    # If position is significantly off, try alternative approach
-                    pos_diff = abs(actual_pos[0] - target_x) + abs(actual_pos[1] - target_y)
-                    if pos_diff > 5:  # If more than 5 pixels off
-                        print(f"⚠️  Position offset detected: {pos_diff} pixels")
-                        # Try setting position again
-                        self.mouse_controller.position = (target_x, target_y)
-                        time.sleep(0.01)
-                    
-                    # Perform the click
-                    self.mouse_controller.click(mouse.Button.left, 1)
-                    
-                except Exception as click_error:
-                    print(f"⚠️  Click failed: {click_error}")
-                    # Try alternative method for Linux
-                    if sys.platform.startswith('linux'):
-                        try:
-                            # Alternative: Use xdotool if available
-                            import subprocess
-                            
-                            # Check for bundled xdotool first (AppImage)
-                            xdotool_cmd = 'xdotool'
-                            if 'APPDIR' in os.environ:
-                                bundled_xdotool = os.path.join(os.environ['APPDIR'], 'usr', 'bin', 'xdotool')
-                                if os.path.exists(bundled_xdotool):
-                                    xdotool_cmd = bundled_xdotool
-                                    print("🎯 Using bundled xdotool from AppImage")
-                            
-                            subprocess.run([xdotool_cmd, 'mousemove', str(target_x), str(target_y), 'click', '1'], 
-                                         check=True, capture_output=True)
-                            print("✅ Used xdotool as fallback")
-                        except (subprocess.CalledProcessError, FileNotFoundError):
-                            print("❌ xdotool not available")
-                            # Show error in UI
-                            self.root.after(0, lambda: messagebox.showerror(
-                                "Click Error", 
-                                "Cannot click outside app window.\n\n"
-                                "Linux Solutions:\n"
-                                "1. Install xdotool: sudo apt install xdotool\n"
-                                "2. Add user to input group: sudo usermod -a -G input $USER\n"
-                                "3. Run with sudo (not recommended)\n"
-                                "4. Switch from Wayland to X11 if using Wayland"))
-                            break
-                
-                # Update click count
-                clicker.click_count += 1
-                
-                # Update UI in main thread
-                self.root.after(0, lambda c=clicker: c.update_status(True, c.click_count))
-                
-                # Wait for the specified interval
-                interval_ms = clicker.get_total_milliseconds()
-                time.sleep(interval_ms / 1000.0)
-                
-            except Exception as e:
-                print(f"❌ Error in clicker {clicker.section_id}: {e}")
-                # Show error in UI
-                self.root.after(0, lambda: messagebox.showerror(
-                    "Clicker Error", 
-                    f"Clicker {clicker.section_id} encountered an error:\n{e}\n\n"
-                    "This may be due to Linux security restrictions."))
-                break
-        
-        # Clean up when stopping
-        if clicker.section_id in self.active_clickers:
-            self.active_clickers.remove(clicker.section_id)
-        
-        if clicker.section_id in self.clicker_threads:
-            del self.clicker_threads[clicker.section_id]
-        
-        # Update UI
-        self.root.after(0, lambda c=clicker: c.update_status(False))
+    def _load_profiles(self):
+        """Read the profiles file and make its active profile the current clicker set"""
+        self.profile_clickers = {}  # Profiles built into Clickers so far, by name
+        try:
+            self.profiles, self.active_profile = load_profiles()
+            self.profiles_readable = True
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not load profiles from {profiles_path()}: {e}")
+            self.profiles, self.active_profile = {}, DEFAULT_PROFILE
+            self.profiles_readable = False
+        try:
+            clickers = self._profile_clickers(self.active_profile)
+        except ValueError as e:
+            print(f"⚠️  {e}; starting with default clickers")
+            self.profiles_readable = False
+            clickers = self.profile_clickers[self.active_profile] = self._default_clickers()
+        self._set_clickers(clickers)
+    
+    def _default_clickers(self):
+        """The clickers of a new, empty profile"""
+        return [Clicker(clicker_id, enabled=False) for clicker_id in range(1, DEFAULT_CLICKERS + 1)]
+    
+    def _profile_clickers(self, name):
+        """A profile's Clickers, built from its saved entries the first time it is used"""
+        clickers = self.profile_clickers.get(name)
+        if clickers is None:
+            entries = self.profiles.get(name)
+            clickers = clickers_from_profile(name, entries) if entries is not None else self._default_clickers()
+            self.profile_clickers[name] = clickers
+            self.profiles.setdefault(name, [])
+        return clickers
+    
+    def _set_clickers(self, clickers):
+        """Make clickers the current set; the list view rebinds its rows instead of rebuilding them"""
+        self.clickers = clickers
+        self._clicker_ids = itertools.count(max((c.clicker_id for c in clickers), default=0) + 1)
+        if hasattr(self, 'clicker_list'):
+            self.clicker_list.set_clickers(clickers)
+    
+    def profile_names(self):
+        """Every profile name, sorted"""
+        return sorted(self.profiles)
     
-    def start_coordinate_selection(self, clicker_section):
-        """Start coordinate selection for a specific clicker"""
-        self.coordinate_selection_clicker = clicker_section
+    def write_profiles(self):
+        """Save every profile to disk, taking the ones in use from their live clickers; returns success"""
+        self.clicker_list.commit_edits()
+        profiles = dict(self.profiles)
+        for name, clickers in self.profile_clickers.items():
+            profiles[name] = [clicker_to_config(c) for c in clickers]
+        try:
+            save_profiles(profiles, self.active_profile)
+        except OSError as e:
+            print(f"❌ Could not save profiles to {profiles_path()}: {e}")
+            return False
+        self.profiles_readable = True
+        return True
+    
+    def switch_profile(self, name):
+        """Replace the whole clicker set with another profile's in one step"""
+        if name == self.active_profile:
+            return
+        try:
+            clickers = self._profile_clickers(name)
+        except ValueError as e:
+            messagebox.showerror("Profile Error", f"Could not load profile:\n{e}")
+            self.profile_var.set(self.active_profile)
+            return
+        self.stop_all_clickers()
+        self.active_profile = name
+        self._set_clickers(clickers)
+        if self.profiles_readable:
+            self.write_profiles()  # Remember the active profile for the next start
+        print(f"📂 Profile '{name}' loaded ({len(clickers)} clickers)")
+    
+    def save_profile(self):
+        """Save the current clickers; a new name in the profile box saves a copy under that name"""
+        name = self.profile_var.get().strip()
+        if not name:
+            messagebox.showwarning("No Name", "Please enter a profile name.")
+            return
+        if name != self.active_profile:
+            if name in self.profiles and not messagebox.askyesno(
+                    "Overwrite Profile", f"Replace the clickers of profile '{name}' with the current ones?"):
+                return
+            # Copies, so editing the new profile leaves the old one as it was saved
+            copies = [clicker_from_config(clicker_to_config(c), c.clicker_id) for c in self.clickers]
+            self.stop_all_clickers()
+            self.profiles[name] = []
+            self.profile_clickers[name] = copies
+            self.active_profile = name
+            self._set_clickers(copies)
+            self.profile_box.config(values=self.profile_names())
+        if self.write_profiles():
+            print(f"💾 Profile '{name}' saved ({len(self.clickers)} clickers)")
+        else:
+            messagebox.showerror("Save Error", f"Could not save profiles to {profiles_path()}")
+    
+    def delete_profile(self):
+        """Delete the current profile and switch to the first remaining one"""
+        name = self.active_profile
+        if len(self.profiles) <= 1:
+            messagebox.showinfo("Delete Profile", "The last profile cannot be deleted.")
+            return
+        if not messagebox.askyesno("Delete Profile", f"Delete profile '{name}'?"):
+            return
+        remaining = [other for other in self.profile_names() if other != name][0]
+        try:
+            self._profile_clickers(remaining)
+        except ValueError as e:
+            messagebox.showerror("Profile Error", f"Could not load profile:\n{e}")
+            return
+        self.profiles.pop(name)
+        self.profile_clickers.pop(name, None)
+        self.profile_var.set(remaining)
+        self.profile_box.config(values=self.profile_names())
+        self.switch_profile(remaining)
+        print(f"🗑️  Profile '{name}' deleted")
+    
+    def add_clicker(self):
+        """Append a disabled clicker and scroll it into view"""
+        self.clickers.append(Clicker(next(self._clicker_ids), enabled=False))
+        self.clicker_list.scroll_to(len(self.clickers))
+        print(f"➕ Clicker {self.clickers[-1].clicker_id} added ({len(self.clickers)} total)")
+    
+    def set_clicker_enabled(self, clicker, enabled):
+        """Enable or disable a clicker; it joins or leaves a running session at once"""
+        self.engine.set_enabled(clicker, enabled)
+    
+    def remove_clicker(self, clicker):
+        """Stop a clicker if it is running and drop it from the list"""
+        self.engine.stop_clicker(clicker)
+        self.clickers.remove(clicker)
+        self.clicker_list.refresh()
+        print(f"➖ Clicker {clicker.clicker_id} removed ({len(self.clickers)} left)")
+    
+    def start_coordinate_selection(self, clicker_section, append=False):
+        """Start coordinate selection for a specific clicker; append adds a point instead of replacing"""
+        self.coordinate_selection_clicker = clicker_section.clicker
+        self.coordinate_selection_append = append
         
         # Minimize the main window
         self.root.iconify()
@@ -986,6 +4027,7 @@ class AutoClicker:
         cancel_btn.pack()
         
         # Set up mouse listener for coordinate capture
+        from pynput import mouse
         self.coordinate_listener = mouse.Listener(on_click=self.on_coordinate_click)
         self.coordinate_listener.start()
         
@@ -998,6 +4040,7 @@ class AutoClicker:
     
     def on_coordinate_click(self, x, y, button, pressed):
         """Handle mouse click during coordinate selection"""
+        from pynput import mouse
         if pressed and button == mouse.Button.left:
             # Stop the listener
             if hasattr(self, 'coordinate_listener'):
@@ -1012,22 +4055,31 @@ class AutoClicker:
                 # Validate coordinates are within reasonable bounds
                 try:
                     # Test if we can get current mouse position for validation
-                    current_pos = self.mouse_controller.position
+                    current_pos = self.engine.require_input_backend().position()
                     print(f"🖱️  Current mouse position: {current_pos}")
-                    
-                    # Set the coordinates
-                    self.coordinate_selection_clicker.set_coordinates(coord_x, coord_y)
-                    
                 except Exception as e:
                     print(f"⚠️  Coordinate validation warning: {e}")
-                    # Still set coordinates even if validation fails
-                    self.coordinate_selection_clicker.set_coordinates(coord_x, coord_y)
+                
+                # Set the coordinates on the Tk thread even if validation fails
+                clicker = self.coordinate_selection_clicker
+                append = self.coordinate_selection_append
+                self.post_ui(lambda: self.set_clicker_point(clicker, coord_x, coord_y, append))
             
             # Close instruction window and restore main window
-            self.root.after(0, self.complete_coordinate_selection)
+            self.post_ui(self.complete_coordinate_selection)
             
             return False  # Stop the listener
     
+    def set_clicker_point(self, clicker, x, y, append=False):
+        """Give a picked point to the row showing clicker, if it is still in the list"""
+        section = self.clicker_list.section_for(clicker)
+        if section is None:
+            print(f"⚠️  Clicker {clicker.clicker_id} is no longer shown, point ({x}, {y}) ignored")
+        elif append:
+            section.add_point(x, y)
+        else:
+            section.set_coordinates(x, y)
+    
     def complete_coordinate_selection(self):
         """Complete the coordinate selection process"""
         # Close instruction window
@@ -1071,21 +4123,23 @@ class AutoClicker:
         print(f"🧪 Testing click for Clicker {clicker_id} at ({target_x}, {target_y})")
         
         try:
+            backend = self.engine.require_input_backend()
+            
             # Store current mouse position to restore later
-            original_pos = self.mouse_controller.position
+            original_pos = backend.position()
             
             # Move to target position
-            self.mouse_controller.position = (target_x, target_y)
+            backend.move(target_x, target_y)
             time.sleep(0.02)
             
             # Verify position
-            actual_pos = self.mouse_controller.position
+            actual_pos = backend.position()
             pos_diff = abs(actual_pos[0] - target_x) + abs(actual_pos[1] - target_y)
             
             print(f"🎯 Test - Target: ({target_x}, {target_y}), Actual: {actual_pos}, Diff: {pos_diff}")
             
             # Perform test click
-            self.mouse_controller.click(mouse.Button.left, 1)
+            backend.click(1, 1)
             
             # Show result
             if pos_diff <= 2:
@@ -1103,7 +4157,7 @@ class AutoClicker:
             
             # Restore original mouse position
             time.sleep(0.1)
-            self.mouse_controller.position = original_pos
+            backend.move(*original_pos)
             
         except Exception as e:
             print(f"❌ Test click failed: {e}")
@@ -1120,13 +4174,25 @@ class AutoClicker:
     
     def start_recording(self):
         """Start recording clicks"""
-        if self.replaying:
+        if self.engine.replaying:
             messagebox.showwarning("Recording Error", "Cannot record while replaying. Stop replay first.")
             return
         
-        self.recorded_clicks = []
+        self.set_recording(RecordingBuffer())
+        
+        # Optionally stream events to disk as they are recorded
+        stream = None
+        if self.stream_recordings:
+            path = os.path.join(recordings_dir(), time.strftime("recording-%Y%m%d-%H%M%S") + RECORDING_EXTENSION)
+            try:
+                stream = RecordingStream(path)
+            except OSError as e:
+                print(f"⚠️  Could not stream recording to {path}: {e}")
+        
+        self.recording_writer = RecordingWriter(self.recorded_clicks, stream)
+        self.recording_writer.start()
         self.recording = True
-        self.recording_start_time = time.time()
+        self.recording_start_time = time.monotonic()
         
         # Update UI
         self.record_btn.config(text="Stop Recording", bg=COLORS['accent_blue_hover'])
@@ -1134,11 +4200,25 @@ class AutoClicker:
         self.global_status_label.config(text="Status: Recording clicks", fg=COLORS['accent_blue_light'])
         
         # Start mouse listener
-        self.recording_listener = mouse.Listener(on_click=self.on_recording_click)
+        from pynput import mouse
+        if self.record_motion:
+            self.motion_filter = MotionFilter()
+            self.recording_listener = mouse.Listener(on_move=self.on_recording_move,
+                                                     on_click=self.on_recording_button,
+                                                     on_scroll=self.on_recording_scroll)
+        else:
+            self.recording_listener = mouse.Listener(on_click=self.on_recording_click)
         self.recording_listener.start()
         
-        # Update recording info
-        self.update_recording_info("Recording started. Click anywhere to record clicks...")
+        # Update recording info; the UI pump keeps the click counter current
+        if self.record_motion:
+            info_text = "Recording started. Moves, drags, clicks and scrolling are all recorded..."
+        else:
+            info_text = "Recording started. Click anywhere to record clicks..."
+        if stream is not None:
+            info_text += f"\n\nStreaming to {stream.path}"
+        self.update_recording_info(info_text)
+        self._shown_record_count = None
         
         print("🎬 Recording started")
     
@@ -1149,31 +4229,39 @@ class AutoClicker:
         
         self.recording = False
         
-        # Stop listener
+        # Stop listener; once joined no callback can submit another event
         if self.recording_listener:
             self.recording_listener.stop()
+            self.recording_listener.join(WORKER_JOIN_TIMEOUT)
             self.recording_listener = None
         
+        # Flush events still queued for the writer
+        stream_path = None
+        if self.recording_writer is not None:
+            if self.recording_writer.stream is not None:
+                stream_path = self.recording_writer.stream.path
+            self.recording_writer.stop()
+            self.recording_writer = None
+        
         # Update UI
         self.record_btn.config(text="Start Recording", bg=COLORS['accent_blue'])
         click_count = len(self.recorded_clicks)
         
         if click_count > 0:
-            duration = time.time() - self.recording_start_time
+            duration = time.monotonic() - self.recording_start_time
             self.record_status.config(text=f"Status: Recorded {click_count} clicks in {duration:.1f}s", 
                                      fg=COLORS['text_secondary'])
             self.replay_btn.config(bg=COLORS['accent_blue'], state='normal')
             self.clear_record_btn.config(bg=COLORS['accent_blue_hover'])
+            self.save_record_btn.config(bg=COLORS['accent_blue'])
             self.replay_status.config(text=f"Status: Ready to replay {click_count} clicks")
             
             # Update recording info with details
-            info_text = f"Recording completed!\n\n"
+            info_text = "Recording completed!\n\n"
             info_text += f"Total clicks: {click_count}\n"
-            info_text += f"Duration: {duration:.1f} seconds\n\n"
-            info_text += "Click sequence:\n"
-            
-            for i, (x, y, delay) in enumerate(self.recorded_clicks, 1):
-                info_text += f"{i}. Click at ({x}, {y}) after {delay:.2f}s\n"
+            info_text += f"Duration: {duration:.1f} seconds\n"
+            if stream_path:
+                info_text += f"Saved to: {stream_path}\n"
             
             self.update_recording_info(info_text)
         else:
@@ -1184,35 +4272,210 @@ class AutoClicker:
         print(f"🎬 Recording stopped. Captured {click_count} clicks")
     
     def on_recording_click(self, x, y, button, pressed):
-        """Handle mouse click during recording"""
+        """Handle mouse click during recording; runs on the pynput listener thread"""
+        from pynput import mouse
         if pressed and button == mouse.Button.left and self.recording:
-            current_time = time.time()
-            delay = current_time - self.recording_start_time
-            
-            # Store click with coordinates and timing
-            self.recorded_clicks.append((int(x), int(y), delay))
-            
-            click_num = len(self.recorded_clicks)
-            print(f"📹 Recorded click {click_num}: ({int(x)}, {int(y)}) at {delay:.2f}s")
-            
-            # Update status
-            self.root.after(0, lambda: self.record_status.config(
-                text=f"Status: Recording... {click_num} clicks recorded"))
+            writer = self.recording_writer
+            if writer is not None:
+                writer.submit(int(x), int(y), time.monotonic() - self.recording_start_time)
+    
+    def on_recording_move(self, x, y):
+        """High-fidelity recording: keep pointer moves that pass the motion filter"""
+        writer = self.recording_writer
+        if self.recording and writer is not None:
+            t = time.monotonic() - self.recording_start_time
+            if self.motion_filter.accept(x, y, t):
+                writer.submit(int(x), int(y), t, EVENT_MOVE, 0)
+    
+    def _flush_motion(self, writer):
+        """Record the last move held back by the motion filter before a button or scroll event"""
+        pending = self.motion_filter.flush()
+        if pending is not None:
+            x, y, t = pending
+            writer.submit(int(x), int(y), t, EVENT_MOVE, 0)
+    
+    def on_recording_button(self, x, y, button, pressed):
+        """High-fidelity recording: every press and release, so drags and held buttons replay"""
+        from pynput import mouse
+        number = {mouse.Button.left: 1, mouse.Button.middle: 2, mouse.Button.right: 3}.get(button)
+        writer = self.recording_writer
+        if number is None or not self.recording or writer is None:
+            return
+        self._flush_motion(writer)
+        writer.submit(int(x), int(y), time.monotonic() - self.recording_start_time,
+                      EVENT_PRESS if pressed else EVENT_RELEASE, number)
+    
+    def on_recording_scroll(self, x, y, dx, dy):
+        """High-fidelity recording: scroll steps, one event per axis"""
+        writer = self.recording_writer
+        if not self.recording or writer is None:
+            return
+        self._flush_motion(writer)
+        t = time.monotonic() - self.recording_start_time
+        if dy:
+            writer.submit(int(x), int(y), t, EVENT_SCROLL, int(dy))
+        if dx:
+            writer.submit(int(x), int(y), t, EVENT_HSCROLL, int(dx))
     
     def clear_recording(self):
         """Clear the current recording"""
         if self.recording:
             self.stop_recording()
         
-        self.recorded_clicks = []
+        self.set_recording(RecordingBuffer())
         self.record_status.config(text="Status: Ready to record", fg=COLORS['text_secondary'])
         self.replay_btn.config(bg=COLORS['button_disabled'], state='disabled')
         self.clear_record_btn.config(bg=COLORS['button_disabled'])
+        self.save_record_btn.config(bg=COLORS['button_disabled'])
         self.replay_status.config(text="Status: No recording to replay")
         
         self.update_recording_info("Recording cleared. Click 'Start Recording' or press F10 to begin recording clicks.")
         print("🗑️ Recording cleared")
     
+    def set_recording(self, recording):
+        """Replace the current recording, unmapping a previously loaded file"""
+        previous = self.recorded_clicks
+        self.recorded_clicks = recording
+        self.event_list.show(recording)
+        # A replay thread may still be reading the old mapping; let GC close it then
+        if isinstance(previous, MappedRecording) and previous is not recording and not self.engine.replaying:
+            previous.close()
+    
+    def save_recording_file(self):
+        """Save the current recording to a binary .acrec file"""
+        if self.recording:
+            messagebox.showwarning("Save Error", "Stop recording before saving.")
+            return
+        
+        click_count = len(self.recorded_clicks)
+        if click_count == 0:
+            messagebox.showwarning("Save Error", "No recording to save. Record some clicks first.")
+            return
+        
+        path = filedialog.asksaveasfilename(
+            title="Save Recording",
+            defaultextension=RECORDING_EXTENSION,
+            filetypes=[("Click recordings", "*" + RECORDING_EXTENSION), ("All files", "*.*")])
+        if not path:
+            return
+        
+        try:
+            save_recording(self.recorded_clicks, path)
+        except OSError as e:
+            print(f"❌ Could not save recording: {e}")
+            messagebox.showerror("Save Failed", f"Could not save recording:\n{e}")
+            return
+        
+        self.record_status.config(text=f"Status: Saved {click_count} clicks to {os.path.basename(path)}",
+                                 fg=COLORS['text_secondary'])
+        print(f"💾 Saved {click_count} clicks to {path}")
+    
+    def load_recording_file(self):
+        """Load a .acrec file; replay reads it through a memory map"""
+        if self.recording or self.engine.replaying:
+            messagebox.showwarning("Load Error", "Stop recording and replay before loading a recording.")
+            return
+        
+        path = filedialog.askopenfilename(
+            title="Load Recording",
+            filetypes=[("Click recordings", "*" + RECORDING_EXTENSION), ("All files", "*.*")])
+        if not path:
+            return
+        
+        try:
+            recording = MappedRecording(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load recording: {e}")
+            messagebox.showerror("Load Failed", f"Could not load recording:\n{e}")
+            return
+        
+        self.set_recording(recording)
+        click_count = len(recording)
+        duration = recording.duration()
+        
+        # Update UI
+        self.record_status.config(text=f"Status: Loaded {click_count} clicks from {os.path.basename(path)}",
+                                 fg=COLORS['text_secondary'])
+        if click_count > 0:
+            self.replay_btn.config(bg=COLORS['accent_blue'], state='normal')
+            self.replay_status.config(text=f"Status: Ready to replay {click_count} clicks")
+        self.clear_record_btn.config(bg=COLORS['accent_blue_hover'])
+        self.save_record_btn.config(bg=COLORS['accent_blue'])
+        
+        info_text = "Recording loaded!\n\n"
+        info_text += f"File: {path}\n"
+        info_text += f"Total clicks: {click_count}\n"
+        info_text += f"Duration: {duration:.1f} seconds\n"
+        saved_at = recording.metadata.get('saved_at')
+        if saved_at:
+            info_text += f"Saved: {saved_at}\n"
+        self.update_recording_info(info_text)
+        
+        print(f"📂 Loaded {click_count} clicks from {path}")
+    
+    def apply_recording_edits(self):
+        """Run the edit spec over the current recording and replace it with the result"""
+        if self.recording or self.engine.replaying:
+            messagebox.showwarning("Edit Error", "Stop recording and replay before editing the recording.")
+            return
+        if not self.recorded_clicks:
+            messagebox.showwarning("Edit Error", "No recording to edit. Record or load some clicks first.")
+            return
+        
+        spec = self.edit_spec_var.get()
+        try:
+            edited = edit_recording(self.recorded_clicks, spec)
+        except ValueError as e:
+            messagebox.showerror("Invalid Edits", str(e))
+            return
+        self._show_edited_recording(edited, f"Applied edits: {spec}")
+    
+    def append_recording_file(self):
+        """Join a saved recording onto the end of the current one"""
+        if self.recording or self.engine.replaying:
+            messagebox.showwarning("Edit Error", "Stop recording and replay before editing the recording.")
+            return
+        
+        path = filedialog.askopenfilename(
+            title="Append Recording",
+            filetypes=[("Click recordings", "*" + RECORDING_EXTENSION), ("All files", "*.*")])
+        if not path:
+            return
+        
+        try:
+            appended = MappedRecording(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load recording: {e}")
+            messagebox.showerror("Load Failed", f"Could not load recording:\n{e}")
+            return
+        try:
+            joined = concat_recordings([self.recorded_clicks, appended])
+        finally:
+            appended.close()
+        self._show_edited_recording(joined, f"Appended: {path}")
+    
+    def _show_edited_recording(self, recording, description):
+        """Make an edited recording current and describe it"""
+        before = len(self.recorded_clicks)
+        self.set_recording(recording)
+        click_count = len(recording)
+        
+        self.record_status.config(text=f"Status: Edited recording, {click_count} clicks",
+                                 fg=COLORS['text_secondary'])
+        state = 'normal' if click_count else 'disabled'
+        self.replay_btn.config(bg=COLORS['accent_blue'] if click_count else COLORS['button_disabled'], state=state)
+        self.replay_status.config(text=f"Status: Ready to replay {click_count} clicks")
+        self.clear_record_btn.config(bg=COLORS['accent_blue_hover'])
+        self.save_record_btn.config(bg=COLORS['accent_blue'])
+        
+        info_text = "Recording edited!\n\n"
+        info_text += f"{description}\n"
+        info_text += f"Events: {before} -> {click_count}\n"
+        info_text += f"Duration: {recording.duration():.1f} seconds\n"
+        self.update_recording_info(info_text)
+        
+        print(f"✂️  {description}: {before} -> {click_count} events")
+    
     def start_replay(self):
         """Start replaying recorded clicks"""
         if not self.recorded_clicks:
@@ -1224,15 +4487,28 @@ class AutoClicker:
             return
         
         try:
-            self.max_replays = int(self.replay_count_var.get())
-            if self.max_replays <= 0:
+            max_replays = int(self.replay_count_var.get())
+            if max_replays <= 0:
                 raise ValueError()
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter a valid positive number for replay count.")
             return
         
-        self.replaying = True
-        self.replay_count = 0
+        try:
+            speed = None if self.replay_max_speed_var.get() else float(self.replay_speed_var.get())
+            if speed is not None and not MIN_REPLAY_SPEED <= speed <= MAX_REPLAY_SPEED:
+                raise ValueError()
+            max_gap_ms = int(self.replay_max_gap_var.get()) if self.replay_max_gap_var.get().strip() else None
+            gap_ms = int(self.replay_gap_var.get() or 0)
+            if (max_gap_ms is not None and max_gap_ms < 0) or gap_ms < 0:
+                raise ValueError()
+        except ValueError:
+            messagebox.showerror("Invalid Input",
+                                 f"Speed must be between {MIN_REPLAY_SPEED} and {MAX_REPLAY_SPEED:g}, "
+                                 f"and pauses must be whole milliseconds (max pause may be left empty).")
+            return
+        
+        self._shown_replay_count = None
         
         # Update UI
         self.replay_btn.config(text="Replaying...", bg=COLORS['accent_blue_hover'], state='disabled')
@@ -1241,14 +4517,14 @@ class AutoClicker:
         self.global_status_label.config(text="Status: Replaying clicks", fg=COLORS['accent_blue_light'])
         
         # Start replay in separate thread
-        replay_thread = threading.Thread(target=self.replay_worker, daemon=True)
-        replay_thread.start()
+        self.engine.start_replay(self.recorded_clicks, max_replays, speed, max_gap_ms, gap_ms)
         
-        print(f"▶️ Starting replay of {len(self.recorded_clicks)} clicks, {self.max_replays} times")
+        speed_text = "as fast as possible" if speed is None else f"at {speed:g}x"
+        print(f"▶️ Starting replay of {len(self.recorded_clicks)} clicks, {max_replays} times, {speed_text}")
     
     def stop_replay(self):
         """Stop replaying"""
-        self.replaying = False
+        self.engine.stop_replay()
         
         # Update UI
         self.replay_btn.config(text="Start Replay", bg=COLORS['accent_blue'], state='normal')
@@ -1256,97 +4532,25 @@ class AutoClicker:
         self.record_btn.config(state='normal')
         self.global_status_label.config(text="Status: Ready", fg=COLORS['text_secondary'])
         
-        if self.replay_count > 0:
-            self.replay_status.config(text=f"Status: Stopped after {self.replay_count} replays")
+        if self.engine.replay_count > 0:
+            self.replay_status.config(text=f"Status: Stopped after {self.engine.replay_count} replays")
         else:
             self.replay_status.config(text=f"Status: Ready to replay {len(self.recorded_clicks)} clicks")
         
         print("⏹️ Replay stopped")
     
-    def replay_worker(self):
-        """Worker thread for replaying clicks"""
-        try:
-            for replay_num in range(self.max_replays):
-                if not self.replaying:
-                    break
-                
-                self.replay_count = replay_num + 1
-                
-                # Update status
-                self.root.after(0, lambda: self.replay_status.config(
-                    text=f"Status: Replaying... {self.replay_count}/{self.max_replays}"))
-                
-                # Replay each click
-                start_time = time.time()
-                
-                for i, (x, y, original_delay) in enumerate(self.recorded_clicks):
-                    if not self.replaying:
-                        break
-                    
-                    # Wait for the original delay
-                    elapsed = time.time() - start_time
-                    wait_time = original_delay - elapsed
-                    
-                    if wait_time > 0:
-                        time.sleep(wait_time)
-                    
-                    if not self.replaying:
-                        break
-                    
-                    # Perform click
-                    try:
-                        self.mouse_controller.position = (x, y)
-                        time.sleep(0.01)
-                        self.mouse_controller.click(mouse.Button.left, 1)
-                        print(f"🔄 Replay {self.replay_count}: Click {i+1} at ({x}, {y})")
-                    except Exception as e:
-                        print(f"❌ Replay click failed: {e}")
-                        # Try Linux xdotool fallback
-                        if sys.platform.startswith('linux'):
-                            try:
-                                import subprocess
-                                
-                                # Check for bundled xdotool first (AppImage)
-                                xdotool_cmd = 'xdotool'
-                                if 'APPDIR' in os.environ:
-                                    bundled_xdotool = os.path.join(os.environ['APPDIR'], 'usr', 'bin', 'xdotool')
-                                    if os.path.exists(bundled_xdotool):
-                                        xdotool_cmd = bundled_xdotool
-                                        print("🎯 Using bundled xdotool from AppImage for replay")
-                                
-                                subprocess.run([xdotool_cmd, 'mousemove', str(x), str(y), 'click', '1'], 
-                                             check=True, capture_output=True)
-                                print(f"✅ Replay {self.replay_count}: Click {i+1} at ({x}, {y}) via xdotool")
-                            except (subprocess.CalledProcessError, FileNotFoundError):
-                                print(f"❌ xdotool fallback failed for replay click {i+1}")
-                        else:
-                            # Non-Linux systems - break on click failure
-                            break
-                
-                # Small delay between replays
-                if self.replaying and replay_num < self.max_replays - 1:
-                    time.sleep(0.5)
-            
-            # Replay completed
-            if self.replaying:
-                self.root.after(0, self.replay_completed)
-                
-        except Exception as e:
-            print(f"❌ Replay error: {e}")
-            self.root.after(0, self.stop_replay)
-    
     def replay_completed(self):
         """Handle replay completion"""
-        self.replaying = False
+        self.engine.stop_replay()
         
         # Update UI
         self.replay_btn.config(text="Start Replay", bg=COLORS['accent_blue'], state='normal')
         self.stop_replay_btn.config(bg=COLORS['button_disabled'], state='disabled')
         self.record_btn.config(state='normal')
         self.global_status_label.config(text="Status: Ready", fg=COLORS['text_secondary'])
-        self.replay_status.config(text=f"Status: Completed {self.replay_count} replays")
+        self.replay_status.config(text=f"Status: Completed {self.engine.replay_count} replays")
         
-        print(f"✅ Replay completed: {self.replay_count} replays finished")
+        print(f"✅ Replay completed: {self.engine.replay_count} replays finished")
     
     def update_recording_info(self, text):
         """Update the recording information display"""
@@ -1359,19 +4563,27 @@ class AutoClicker:
         """Handle application closing"""
         self.stop_all_clickers()
         
+        # Keep every clicker setting for the next start
+        if self.profiles_readable:
+            self.write_profiles()
+        
         # Stop recording if active
         if self.recording:
             self.stop_recording()
         
         # Stop replay if active
-        if self.replaying:
+        if self.engine.replaying:
             self.stop_replay()
         
         if self.hotkey_listener:
             self.hotkey_listener.stop()
+            self.hotkey_listener.join(WORKER_JOIN_TIMEOUT)
         
-        # Wait a moment for threads to clean up
-        time.sleep(0.1)
+        # Joins the scheduler, replay and summary threads
+        self.engine.close()
+        
+        if isinstance(self.recorded_clicks, MappedRecording):
+            self.recorded_clicks.close()
         
         self.root.destroy()
     
@@ -1383,16 +4595,319 @@ class AutoClicker:
             self.on_closing()
 
 
+def clicker_from_config(entry, clicker_id, default_seed=None):
+    """Build a Clicker from one 'clickers' entry of a job file or profile; raises ValueError"""
+    targets = entry.get('targets')
+    coordinates = entry.get('coordinates')
+    if coordinates is not None:
+        x, y = coordinates
+        coordinates = (int(x), int(y))
+    interval_ms = int(entry.get('interval_ms', DEFAULT_INTERVAL_MS))
+    wait_mode = entry.get('wait_mode', DEFAULT_WAIT_MODE)
+    if wait_mode not in WAIT_MODES:
+        raise ValueError(f"wait_mode must be one of {', '.join(WAIT_MODES)}")
+    button = entry.get('button', 'left')
+    if button not in MOUSE_BUTTONS:
+        raise ValueError(f"button must be one of {', '.join(MOUSE_BUTTONS)}")
+    burst = int(entry.get('burst', 1))
+    burst_delay_ms = int(entry.get('burst_delay_ms', 0))
+    if not 1 <= burst <= MAX_BURST or not 0 <= burst_delay_ms <= MAX_BURST_DELAY_MS:
+        raise ValueError(f"burst must be 1-{MAX_BURST} and burst_delay_ms 0-{MAX_BURST_DELAY_MS}")
+    clicker = Clicker(clicker_id, coordinates, max(MIN_INTERVAL_MS, interval_ms),
+                      bool(entry.get('enabled', True)), wait_mode,
+                      MOUSE_BUTTONS[button], burst, burst_delay_ms)
+    clicker.targets = targets
+    clicker.new_target_path()  # Validate now rather than when the clicker starts; the start reuses it
+    clicker.interval_jitter_ms = float(entry.get('interval_jitter_ms', 0))
+    clicker.position_jitter_px = float(entry.get('position_jitter_px', 0))
+    if clicker.interval_jitter_ms < 0 or clicker.position_jitter_px < 0:
+        raise ValueError("interval_jitter_ms and position_jitter_px must not be negative")
+    clicker.jitter_distribution = entry.get('jitter', 'uniform')
+    if clicker.jitter_distribution not in JITTER_DISTRIBUTIONS:
+        raise ValueError(f"jitter must be one of {', '.join(JITTER_DISTRIBUTIONS)}")
+    clicker.jitter_seed = entry.get('seed', default_seed)
+    return clicker
+
+
+def clicker_to_config(clicker):
+    """Inverse of clicker_from_config: one 'clickers' entry for a job file or profile"""
+    button_names = {number: name for name, number in MOUSE_BUTTONS.items()}
+    entry = {
+        'enabled': clicker.is_enabled,
+        'interval_ms': clicker.interval_ms,
+        'wait_mode': clicker.wait_mode,
+        'button': button_names.get(clicker.button, 'left'),
+        'burst': clicker.burst_count,
+        'burst_delay_ms': clicker.burst_delay_ms,
+        'interval_jitter_ms': clicker.interval_jitter_ms,
+        'position_jitter_px': clicker.position_jitter_px,
+        'jitter': clicker.jitter_distribution,
+    }
+    if clicker.coordinates is not None:
+        entry['coordinates'] = list(clicker.coordinates)
+    if clicker.targets is not None:
+        entry['targets'] = clicker.targets
+    if clicker.jitter_seed is not None:
+        entry['seed'] = clicker.jitter_seed
+    return entry
+
+
+def profiles_path():
+    """Return the file every saved profile is kept in"""
+    return os.path.join(config_dir(), PROFILES_FILE)
+
+
+def load_profiles(path=None):
+    """Read the profiles file and return (profiles, active); raises ValueError if it is unreadable"""
+    path = path or profiles_path()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}, DEFAULT_PROFILE
+    if not isinstance(data, dict) or not isinstance(data.get('profiles'), dict):
+        raise ValueError("profiles file must be a JSON object with a 'profiles' object")
+    version = data.get('version')
+    if not isinstance(version, int) or not 1 <= version <= PROFILES_VERSION:
+        raise ValueError(f"unsupported profiles version {version!r} (this build reads up to {PROFILES_VERSION})")
+
+    profiles = {}
+    for name, profile in data['profiles'].items():
+        if not (isinstance(profile, dict) and isinstance(profile.get('clickers', []), list)):
+            raise ValueError(f"profile '{name}' needs a 'clickers' list")
+        profiles[name] = profile.get('clickers', [])
+    return profiles, data.get('active', DEFAULT_PROFILE)
+
+
+def clickers_from_profile(name, entries):
+    """Build the Clickers of one profile, numbered from 1"""
+    clickers = []
+    for index, entry in enumerate(entries, start=1):
+        try:
+            clickers.append(clicker_from_config(entry, index))
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"profile '{name}', clicker {index}: {e}")
+    return clickers
+
+
+def save_profiles(profiles, active, path=None):
+    """Write every profile's clicker entries to one file atomically, so a crash never leaves it half written"""
+    path = path or profiles_path()
+    data = {
+        'version': PROFILES_VERSION,
+        'active': active,
+        'profiles': {name: {'clickers': entries} for name, entries in profiles.items()},
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_headless_config(path):
+    """Read a headless job file and return (clickers, settings); raises ValueError if it is malformed"""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError("config must be a JSON object")
+
+    clickers = []
+    for index, entry in enumerate(config.get('clickers', []), start=1):
+        try:
+            clicker = clicker_from_config(entry, index, config.get('seed'))
+            if clicker.coordinates is None and clicker.targets is None:
+                raise ValueError("needs 'coordinates' or 'targets'")
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"clicker {index}: {e}")
+        clickers.append(clicker)
+
+    replay = config.get('replay')
+    if replay is not None:
+        if not (isinstance(replay, dict) and replay.get('file')):
+            raise ValueError("replay needs a 'file' entry")
+        try:
+            replay_options(replay)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"replay: {e}")
+
+    if not any(c.is_enabled for c in clickers) and replay is None:
+        raise ValueError("nothing to run: no enabled clickers and no replay")
+    return clickers, config
+
+
+def replay_options(replay):
+    """Return the start_replay keyword arguments for a headless replay entry"""
+    speed = replay.get('speed', 1.0)
+    if speed == 'max':
+        speed = None
+    else:
+        speed = float(speed)
+        if not MIN_REPLAY_SPEED <= speed <= MAX_REPLAY_SPEED:
+            raise ValueError(f"speed must be {MIN_REPLAY_SPEED}-{MAX_REPLAY_SPEED} or \"max\"")
+    max_gap_ms = replay.get('max_gap_ms')
+    if max_gap_ms is not None:
+        max_gap_ms = int(max_gap_ms)
+    gap_ms = int(replay.get('gap_ms', DEFAULT_REPLAY_GAP_MS))
+    if (max_gap_ms is not None and max_gap_ms < 0) or gap_ms < 0:
+        raise ValueError("max_gap_ms and gap_ms must not be negative")
+    return {'speed': speed, 'max_gap_ms': max_gap_ms, 'gap_ms': gap_ms}
+
+
+def run_headless(args):
+    """Run clickers and/or a replay from a config file without any GUI"""
+    try:
+        clickers, config = load_headless_config(args.config)
+    except (OSError, ValueError) as e:
+        print(f"❌ Invalid config {args.config}: {e}")
+        return 2
+
+    engine = ClickEngine(args.backend or config.get('backend'), args.log_summary)
+    engine.fast_path = bool(config.get('fast_path', True))
+    engine.verify_every = max(1, int(config.get('verify_every', VERIFY_EVERY_N_CLICKS)))
+    engine.on_error = lambda title, message: print(f"❌ {title}: {message}")
+    if engine.open_input_backend() is None:
+        print("❌ No working input backend")
+        engine.close()
+        return 1
+
+    duration = args.duration if args.duration is not None else config.get('duration')
+    deadline = time.monotonic() + duration if duration else None
+
+    STARTUP.mark("open input backend")
+    STARTUP.report()
+
+    recording = None
+    try:
+        enabled = [c for c in clickers if c.is_enabled]
+        if enabled:
+            engine.start_clickers(enabled)
+            print(f"🚀 Headless: {len(enabled)} clickers running via {engine.input_backend.name}")
+
+        replay = config.get('replay')
+        if replay is not None:
+            recording = MappedRecording(replay['file'])
+            count = max(1, int(replay.get('count', 1)))
+            engine.start_replay(recording, count, **replay_options(replay))
+            print(f"▶️ Headless: replaying {len(recording)} clicks from {replay['file']}, {count} times")
+
+        # Run until the duration is up, every job has finished, or Ctrl+C
+        while engine.active_clickers or engine.replaying:
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                break
+            engine.jobs_changed.wait(timeout)
+            engine.jobs_changed.clear()
+    except KeyboardInterrupt:
+        print("⏹️ Interrupted")
+    finally:
+        engine.close()
+        if recording is not None:
+            recording.close()
+
+    sources = {f"Clicker {c.clicker_id}": c.metrics for c in clickers if c.is_enabled}
+    if config.get('replay') is not None:
+        print(f"📊 Replay: {engine.replay_count} runs")
+        sources["Replay"] = engine.replay_metrics
+    for name, metrics in sources.items():
+        print("\n".join(format_metrics(f"📊 {name}", metrics)))
+
+    if args.metrics_out:
+        try:
+            export_metrics(sources, args.metrics_out)
+            print(f"📊 Metrics written to {args.metrics_out}")
+        except OSError as e:
+            print(f"❌ Could not write metrics: {e}")
+            return 1
+    return 0
+
+
+def run_edit(args):
+    """Join recordings, apply an edit spec and save the result, without any GUI"""
+    try:
+        edits = parse_recording_edits(args.edits)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    
+    recordings = []
+    try:
+        for path in args.edit:
+            recordings.append(MappedRecording(path))
+        recording = concat_recordings(recordings, args.join_gap)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load recording: {e}")
+        return 2
+    finally:
+        for mapped in recordings:
+            mapped.close()
+    
+    before = len(recording), recording.duration()
+    try:
+        for function, edit_args in edits:
+            recording = function(recording, *edit_args)
+        save_recording(recording, args.output, {'edits': args.edits, 'sources': args.edit})
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not edit recording: {e}")
+        return 1
+    print(f"✂️  {before[0]} events / {before[1]:.1f}s -> {len(recording)} events / "
+          f"{recording.duration():.1f}s, saved to {args.output}")
+    return 0
+
+
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Advanced Autoclicker")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run the click engine without a GUI (needs --config)")
+    parser.add_argument("--config", help="JSON job file for --headless")
+    parser.add_argument("--backend", choices=sorted(INPUT_BACKENDS),
+                        help="Input backend to use instead of auto-detection")
+    parser.add_argument("--duration", type=float,
+                        help="Stop a headless run after this many seconds")
+    parser.add_argument("--metrics-out",
+                        help="Write headless timing metrics to this .json or .csv file")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print how long each startup phase took")
+    parser.add_argument("--log-level", default="info", choices=["debug", "info", "warning", "error"],
+                        help="debug logs every click; info logs a periodic summary")
+    parser.add_argument("--log-summary", type=float, default=LOG_SUMMARY_INTERVAL, metavar="SECONDS",
+                        help="Seconds between click-count summaries (0 disables)")
+    parser.add_argument("--edit", nargs='+', metavar="RECORDING",
+                        help="Join these .acrec files, apply --edits and save the result to --output")
+    parser.add_argument("--edits", default="", metavar="SPEC",
+                        help="Comma-separated edits applied in order: trim, dedupe=MS, snap=PX, "
+                             "scale=FACTOR, loop=COUNT[:GAP_MS]")
+    parser.add_argument("--join-gap", type=float, default=0, metavar="MS",
+                        help="Pause between recordings joined by --edit")
+    parser.add_argument("--output", help="Where --edit saves the result")
+    args = parser.parse_args()
+    STARTUP.enabled = args.profile_startup
+    STARTUP.mark("python imports")
+    
+    if args.headless and not args.config:
+        parser.error("--headless needs --config")
+    if args.edit and not args.output:
+        parser.error("--edit needs --output")
+    
+    log_listener = setup_logging(getattr(logging, args.log_level.upper()))
     try:
-        app = AutoClicker()
+        if args.edit:
+            sys.exit(run_edit(args))
+        if args.headless:
+            sys.exit(run_headless(args))
+        app = AutoClicker(args.backend, args.log_summary)
         app.run()
     except Exception as e:
         print(f"Error starting application: {e}")
         if hasattr(e, '__class__'):
             print(f"Error type: {e.__class__.__name__}")
         sys.exit(1)
+    finally:
+        # Flush whatever the worker threads logged last
+        log_listener.stop()
 
 
 if __name__ == "__main__":
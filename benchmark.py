@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Advanced Autoclicker engine
+
+Usage:
+    python3 benchmark.py scheduler [--clickers N] [--interval-ms MS] [--duration S] [--wait-modes MODES]
+    python3 benchmark.py backend --x X --y Y [--clicks N] [--batch B] [--backends NAMES]
+
+The backend benchmark performs real clicks at (X, Y): point it at an empty area.
+Use --backends memory to measure the engine overhead headless (e.g. in CI).
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from autoclicker import ClickScheduler, INPUT_BACKENDS, WAIT_MODES, find_xdotool
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of values (nearest rank)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def simulated_click(work_s):
+    """Stand-in for a mouse move + click that costs work_s seconds"""
+    if work_s > 0:
+        time.sleep(work_s)
+
+
+def summarize(name, fire_times, start, interval_s, thread_count):
+    """Print drift and jitter for a set of per-clicker fire timestamps"""
+    lateness = []
+    drift = []
+    for times in fire_times:
+        if not times:
+            continue
+        # Ideal schedule is start + k * interval for the k-th click
+        clicker_late = [t - (start + k * interval_s) for k, t in enumerate(times)]
+        lateness.extend(abs(late) for late in clicker_late)
+        drift.append(clicker_late[-1])
+
+    clicks = sum(len(times) for times in fire_times)
+    print(f"📊 {name}")
+    print(f"   threads:        {thread_count}")
+    print(f"   clicks:         {clicks}")
+    if not drift:
+        return
+    print(f"   drift (mean):   {statistics.mean(drift) * 1000:.3f} ms")
+    print(f"   drift (max):    {max(drift) * 1000:.3f} ms")
+    print(f"   jitter p50:     {percentile(lateness, 50) * 1000:.3f} ms")
+    print(f"   jitter p99:     {percentile(lateness, 99) * 1000:.3f} ms")
+
+
+def bench_thread_per_clicker(clickers, interval_s, duration_s, work_s):
+    """Legacy model: one thread per clicker sleeping a full interval after each click"""
+    fire_times = [[] for _ in range(clickers)]
+    running = threading.Event()
+    running.set()
+    start = time.perf_counter()
+
+    def worker(index):
+        while running.is_set():
+            fire_times[index].append(time.perf_counter())
+            simulated_click(work_s)
+            time.sleep(interval_s)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(clickers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration_s)
+    running.clear()
+    for thread in threads:
+        thread.join()
+
+    summarize("Thread per clicker (time.sleep after click)", fire_times, start, interval_s, clickers)
+
+
+def bench_scheduler(clickers, interval_s, duration_s, work_s, wait_mode):
+    """Deadline scheduler: one thread, min-heap of absolute deadlines"""
+    fire_times = [[] for _ in range(clickers)]
+
+    def fire(index, deadline):
+        fire_times[index].append(time.perf_counter())
+        simulated_click(work_s)
+        return interval_s
+
+    scheduler = ClickScheduler(fire, wait_mode_of=lambda job: wait_mode)
+    cpu_start = time.process_time()
+    scheduler.start()
+    start = time.perf_counter()
+    for i in range(clickers):
+        scheduler.schedule(i, i)
+    time.sleep(duration_s)
+    scheduler.stop()
+    cpu = (time.process_time() - cpu_start) / duration_s
+
+    summarize(f"Single deadline scheduler, {wait_mode} wait", fire_times, start, interval_s, 1)
+    print(f"   CPU:            {cpu * 100:.1f}% of one core")
+
+
+def run_scheduler_benchmark(args):
+    """Compare drift and jitter of both scheduling models"""
+    interval_s = args.interval_ms / 1000.0
+    work_s = args.work_ms / 1000.0
+    print(f"🚀 {args.clickers} clickers, {args.interval_ms} ms interval, "
+          f"{args.work_ms} ms per click, {args.duration}s")
+    bench_thread_per_clicker(args.clickers, interval_s, args.duration, work_s)
+    for wait_mode in args.wait_modes.split(','):
+        if wait_mode not in WAIT_MODES:
+            print(f"⚠️  Unknown wait mode '{wait_mode}', expected one of {', '.join(WAIT_MODES)}")
+            continue
+        bench_scheduler(args.clickers, interval_s, args.duration, work_s, wait_mode)
+
+
+def report_rate(name, clicks, elapsed):
+    """Print clicks per second for one backend"""
+    print(f"📊 {name}: {clicks} clicks in {elapsed:.3f}s = {clicks / elapsed:,.0f} clicks/sec")
+
+
+def bench_subprocess_per_click(xdotool_cmd, x, y, clicks):
+    """Legacy path: fork/exec xdotool for every click"""
+    start = time.perf_counter()
+    for _ in range(clicks):
+        subprocess.run([xdotool_cmd, 'mousemove', str(x), str(y), 'click', '1'],
+                       check=True, capture_output=True)
+    report_rate("xdotool, one process per click", clicks, time.perf_counter() - start)
+
+
+def bench_backend_batches(backend, label, x, y, clicks, batch):
+    """Send clicks through a persistent backend in batches"""
+    start = time.perf_counter()
+    sent = 0
+    while sent < clicks:
+        size = min(batch, clicks - sent)
+        backend.move_and_click_batch([(x, y)] * size)
+        sent += size
+    report_rate(f"{label}, batch of {batch}", clicks, time.perf_counter() - start)
+
+
+def run_backend_benchmark(args):
+    """Compare clicks/sec of the per-click subprocess path and the persistent backends"""
+    print(f"🚀 {args.clicks} clicks at ({args.x}, {args.y})")
+    names = [name.strip() for name in args.backends.split(',') if name.strip()]
+
+    if 'xdotool' in names:
+        xdotool_cmd = find_xdotool()
+        if xdotool_cmd:
+            bench_subprocess_per_click(xdotool_cmd, args.x, args.y, args.clicks)
+        else:
+            print("⚠️  xdotool not found, skipping per-click subprocess baseline")
+
+    for name in names:
+        try:
+            backend = INPUT_BACKENDS[name]()
+        except Exception as e:
+            print(f"⚠️  {name} unavailable, skipping: {e}")
+            continue
+        try:
+            bench_backend_batches(backend, name, args.x, args.y, args.clicks, 1)
+            bench_backend_batches(backend, name, args.x, args.y, args.clicks, args.batch)
+        finally:
+            backend.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Autoclicker engine benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    sched = subparsers.add_parser("scheduler", help="Drift/jitter: deadline scheduler vs thread per clicker")
+    sched.add_argument("--clickers", type=int, default=3)
+    sched.add_argument("--interval-ms", type=float, default=50)
+    sched.add_argument("--work-ms", type=float, default=0.1,
+                       help="Simulated cost of one move + click")
+    sched.add_argument("--duration", type=float, default=5.0)
+    sched.add_argument("--wait-modes", default=",".join(WAIT_MODES),
+                       help="Comma-separated scheduler wait modes to compare")
+    sched.set_defaults(func=run_scheduler_benchmark)
+
+    backend = subparsers.add_parser("backend", help="Clicks/sec: persistent backends vs one xdotool per click")
+    backend.add_argument("--x", type=int, required=True)
+    backend.add_argument("--y", type=int, required=True)
+    backend.add_argument("--clicks", type=int, default=200)
+    backend.add_argument("--batch", type=int, default=20)
+    backend.add_argument("--backends", default="memory,xtest,pynput,xdotool",
+                         help="Comma-separated backends to measure")
+    backend.set_defaults(func=run_backend_benchmark)
+
+    args = parser.parse_args()
+    args.func(args)
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -7,6 +7,9 @@ import os
 import sys
 import subprocess
 import shutil
+import compileall
+import py_compile
+import zipapp
 from pathlib import Path
 
 def run_command(cmd, cwd=None):
@@ -23,6 +26,30 @@ def run_command(cmd, cwd=None):
         print(f"Stderr: {e.stderr}")
         return False
 
+def build_zipapp(site_packages, target):
+    """Pack autoclicker.py and its dependencies into one zipapp with precompiled bytecode"""
+    staging = target.parent / "zipapp-staging"
+    if staging.exists():
+        shutil.rmtree(staging)
+    shutil.copytree(site_packages, staging, ignore=shutil.ignore_patterns("__pycache__"))
+    shutil.copy2("autoclicker.py", staging / "autoclicker.py")
+    with open(staging / "__main__.py", "w") as f:
+        f.write("import autoclicker\nautoclicker.main()\n")
+
+    # Python cannot write bytecode caches inside a zip, so every module is compiled here: legacy
+    # layout (.pyc next to its source, as zipimport reads it), unchecked hashes so it is used as-is.
+    # Another Python version falls back to the bundled sources.
+    if not compileall.compile_dir(str(staging), quiet=1, legacy=True,
+                                  invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH):
+        print("❌ Failed to precompile bytecode")
+        return False
+
+    # Stored rather than deflated: nothing to decompress at import time
+    zipapp.create_archive(staging, target, compressed=False)
+    shutil.rmtree(staging)
+    print(f"✅ Built zipapp: {target.name} ({target.stat().st_size // 1024} KB)")
+    return True
+
 def main():
     print("🚀 Building Advanced Autoclicker AppImage...")
     
@@ -49,9 +76,6 @@ def main():
     (app_dir / "usr" / "share" / "icons" / "hicolor" / "256x256" / "apps").mkdir(parents=True)
     (app_dir / "usr" / "lib" / "x86_64-linux-gnu").mkdir(parents=True)
     
-    # Copy main application
-    shutil.copy2("autoclicker.py", app_dir / "usr" / "bin" / "autoclicker.py")
-    
     # Create desktop file
     desktop_content = """[Desktop Entry]
 Type=Application
@@ -92,7 +116,6 @@ HERE="$(dirname "$(readlink -f "${0}")")"
 export APPDIR="$HERE"
 export PATH="${HERE}/usr/bin:${PATH}"
 export LD_LIBRARY_PATH="${HERE}/usr/lib:${HERE}/usr/lib/x86_64-linux-gnu:${LD_LIBRARY_PATH}"
-export PYTHONPATH="${HERE}/usr/lib/python3/site-packages:${PYTHONPATH}"
 
 # Set up X11 environment
 export DISPLAY="${DISPLAY:-:0}"
@@ -109,7 +132,7 @@ else
 fi
 
 cd "${HERE}/usr/bin"
-exec python3 autoclicker.py "$@"
+exec python3 autoclicker.pyz "$@"
 """
     
     with open(app_dir / "AppRun", "w") as f:
@@ -118,10 +141,10 @@ exec python3 autoclicker.py "$@"
     # Make AppRun executable
     os.chmod(app_dir / "AppRun", 0o755)
     
-    # Install Python dependencies into the AppImage
+    # Install Python dependencies outside the AppDir; only the zipapp is shipped
     print("📦 Installing Python dependencies...")
     
-    python_lib_dir = app_dir / "usr" / "lib" / "python3" / "site-packages"
+    python_lib_dir = build_dir / "site-packages"
     python_lib_dir.mkdir(parents=True)
     
     # Install Python dependencies
@@ -129,6 +152,10 @@ exec python3 autoclicker.py "$@"
         print("❌ Failed to install pynput")
         return False
     
+    print("📦 Precompiling and packing the application...")
+    if not build_zipapp(python_lib_dir, app_dir / "usr" / "bin" / "autoclicker.pyz"):
+        return False
+    
     print("📦 Bundling system dependencies...")
     
     # Bundle xdotool binary and its dependencies
@@ -166,7 +193,7 @@ exec python3 autoclicker.py "$@"
         temp_install_dir.mkdir(exist_ok=True)
         
         # Download and extract xdotool package
-        if not run_command(f"apt download xdotool", cwd=temp_install_dir):
+        if not run_command("apt download xdotool", cwd=temp_install_dir):
             print("❌ Could not download xdotool package")
         else:
             # Extract the .deb package
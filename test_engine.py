@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Headless tests for the click engine, run against the in-memory backend
+"""
+
+import time
+
+import autoclicker
+from autoclicker import (ClickEngine, Clicker, JitterSource, MappedRecording, RecordingBuffer,
+                         EVENT_CLICK, EVENT_PRESS, EVENT_RELEASE, JITTER_BLOCK)
+
+
+def start_engine(clicker):
+    """Start clicker on an engine that clicks into a RecordingBackend"""
+    engine = ClickEngine('memory', summary_interval=0)
+    engine.start_clickers([clicker])
+    return engine, engine.input_backend
+
+
+def wait_for(condition, timeout=2.0):
+    """Poll condition until it holds or timeout seconds pass"""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def click_times(backend):
+    """perf_counter_ns of every click the backend received"""
+    return [event[0] for event in list(backend.events) if event[1] == 'click']
+
+
+def test_spaced_burst_clicks_count_times_burst_delay_apart():
+    clicker = Clicker(1, (10, 20), interval_ms=60000, burst_count=3, burst_delay_ms=20)
+    engine, backend = start_engine(clicker)
+    try:
+        assert wait_for(lambda: clicker.click_count == 3)
+        time.sleep(0.1)  # The next tick is a minute away: nothing else may arrive
+        times = click_times(backend)
+    finally:
+        engine.close()
+    assert len(times) == 3
+    assert all(count == 1 for _, kind, _, count in backend.events if kind == 'click')
+    gaps_ms = [(b - a) / 1e6 for a, b in zip(times, times[1:])]
+    assert all(15 <= gap < 60 for gap in gaps_ms), gaps_ms
+
+
+def test_interval_edit_reschedules_the_pending_click():
+    clicker = Clicker(1, (10, 20), interval_ms=60000)
+    engine, backend = start_engine(clicker)
+    try:
+        assert wait_for(lambda: clicker.click_count == 1)
+        clicker.interval_ms = 10
+        engine.apply_config(clicker)
+        # Without the reschedule the second click would wait out the old minute
+        assert wait_for(lambda: clicker.click_count >= 5)
+    finally:
+        engine.close()
+
+
+def test_scheduler_reschedule_reports_unknown_jobs():
+    scheduler = autoclicker.ClickScheduler(lambda job, deadline: None)
+    assert not scheduler.reschedule('missing', 0.01)
+
+
+def test_seeded_jitter_repeats_across_refills():
+    def draw(seed):
+        source = JitterSource('gaussian', 5.0, seed)
+        return [source.next() for _ in range(2 * JITTER_BLOCK + 10)]
+
+    first = draw("42:1:interval")
+    assert draw("42:1:interval") == first
+    assert draw("43:1:interval") != first
+
+
+def test_recording_v2_round_trip(tmp_path):
+    buffer = RecordingBuffer()
+    buffer.append(1, 2, 0.0, EVENT_PRESS, 1)
+    buffer.append(3, 4, 0.05, EVENT_RELEASE, 1)
+    buffer.append(-5, 6, 0.25, EVENT_CLICK, 3)
+    path = str(tmp_path / "clicks.acrec")
+    autoclicker.save_recording(buffer, path, {'note': 'test'})
+
+    recording = MappedRecording(path)
+    try:
+        assert list(recording) == list(buffer)
+        assert recording.duration() == 0.25
+        assert recording.metadata['note'] == 'test'
+    finally:
+        recording.close()
+
+
+def test_recording_v1_loads_as_left_clicks(tmp_path):
+    clicks = [(1, 2, 0.0), (30, 40, 0.5)]
+    header = autoclicker.RECORDING_HEADER.pack(autoclicker.RECORDING_MAGIC, 1,
+                                               autoclicker.RECORDING_RECORD_V1.size, 0, len(clicks))
+    path = tmp_path / "old.acrec"
+    path.write_bytes(header + b''.join(autoclicker.RECORDING_RECORD_V1.pack(*click) for click in clicks))
+
+    recording = MappedRecording(str(path))
+    try:
+        assert list(recording) == [(x, y, t, EVENT_CLICK, 1) for x, y, t in clicks]
+        assert recording[-1] == (30, 40, 0.5, EVENT_CLICK, 1)
+    finally:
+        recording.close()